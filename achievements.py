@@ -0,0 +1,317 @@
+# achievements.py
+
+"""
+Achievements Module
+
+Description:
+This Python module defines the achievements a player can unlock and the rule
+engine that tracks them from the game's events (see events.py). Rather than
+rescanning every flag and clue for every rule on every check, the rules
+are compiled once into a Rete-style network that every session shares:
+
+- Alpha nodes test a single event: its type and the values of its fields.
+  Rules that test for the same thing share one alpha node, and alpha nodes
+  are indexed by event type.
+- Beta nodes keep partial matches: how many matching events were seen, which
+  distinct values a field took, or how many parts of an 'all_of' rule hold.
+
+Each session keeps only its own partial matches. An event is tested against
+the alpha nodes of its type, and only the beta nodes of rules those tests
+matched are updated, so the cost of an event does not grow with the number
+of unrelated rules. Parts of a rule that already hold, and unlocked rules,
+are skipped.
+
+Unlocked achievements are saved with the player record in 'user_data.json'
+and restored when the player logs in.
+
+Classes:
+1. Achievement: The id, title, description and condition of an achievement.
+2. AchievementNetwork: The compiled, shared rule network.
+3. AchievementTracker: One session's partial matches and unlocked achievements.
+
+Functions:
+1. on(event_type, **fields): A condition matching one event.
+2. times(pattern, count): Holds once 'count' events matched.
+3. distinct(pattern, field, count): Holds once matching events had 'count' different values of a field.
+4. all_of(*conditions): Holds once every condition holds.
+5. get_achievement_network(): Returns the network compiled from ACHIEVEMENTS.
+
+Usage:
+    tracker = AchievementTracker(get_achievement_network(), on_unlock=print)
+    game.events.subscribe(tracker.handle)
+
+Author: Haydens Little Helpers
+"""
+
+import threading
+from collections import namedtuple
+
+from events import CaseClosed, CharacterInteracted, ClueFound, MiniGameWon
+
+Achievement = namedtuple("Achievement", ["achievement_id", "title", "description",
+                                         "condition"])
+Achievement.__doc__ = """An achievement and the condition that unlocks it."""
+
+_Pattern = namedtuple("_Pattern", ["event_type", "fields"])
+_Times = namedtuple("_Times", ["pattern", "count"])
+_Distinct = namedtuple("_Distinct", ["pattern", "field", "count"])
+_AllOf = namedtuple("_AllOf", ["conditions"])
+
+
+def on(event_type, **fields):
+    """
+    Match one event.
+
+    Parameters:
+    - event_type (type): The event class, e.g. ClueFound.
+    - fields: Values the event's fields must have, e.g. location="Kitchen".
+
+    Returns:
+    _Pattern: A condition that holds once a matching event is seen.
+    """
+    return _Pattern(event_type, tuple(sorted(fields.items())))
+
+
+def times(pattern, count):
+    """Hold once 'count' events matched 'pattern'."""
+    return _Times(pattern, count)
+
+
+def distinct(pattern, field, count):
+    """Hold once events matching 'pattern' had 'count' different values of 'field'."""
+    return _Distinct(pattern, field, count)
+
+
+def all_of(*conditions):
+    """Hold once every one of 'conditions' holds."""
+    return _AllOf(conditions)
+
+
+def _passage_count():
+    from mini_game_registry import MINI_GAMES
+    return len(MINI_GAMES)
+
+
+ACHIEVEMENTS = (
+    Achievement("case_solved", "Case Closed", "Find the thief.",
+                on(CaseClosed, solved=True)),
+    # The butler at the crime scene and the chef in the kitchen
+    Achievement("every_suspect", "Interviewed Every Suspect",
+                "Talk to every suspect you can find.",
+                distinct(on(CharacterInteracted, role="suspect"), "character", 2)),
+    Achievement("every_witness", "All Ears", "Hear out every witness.",
+                distinct(on(CharacterInteracted, role="witness"), "character", 2)),
+    Achievement("every_passage", "Opened Every Passage",
+                "Win the challenge behind every hidden passage.",
+                distinct(on(MiniGameWon), "door", _passage_count())),
+    Achievement("upstairs_clues", "No Stone Unturned",
+                "Find every clue in the kitchen, the library and the attic.",
+                all_of(times(on(ClueFound, location="Kitchen"), 3),
+                       times(on(ClueFound, location="Library"), 3),
+                       times(on(ClueFound, location="Attic"), 3))),
+    Achievement("no_interrogation", "Sharp Instincts",
+                "Name the thief without interrogating anyone.",
+                on(CaseClosed, solved=True, interrogated=False)),
+)
+
+
+class AchievementNetwork:
+    """The AchievementNetwork class holds achievements compiled into alpha
+    and beta nodes. It is read-only, so every session shares one."""
+
+    __slots__ = ("achievements", "alpha", "kinds", "fields", "counts", "parents",
+                 "rule_of", "roots", "rule_nodes", "ids")
+
+    def __init__(self, achievements):
+        """
+        Compile achievements into a network.
+
+        Parameters:
+        - achievements (iterable): Achievement records.
+
+        Returns:
+        None
+
+        Raises:
+        ValueError: If two achievements share an id.
+        """
+        self.achievements = tuple(achievements)
+        # event type -> [(field tests, beta nodes fed by the test)]
+        self.alpha = {}
+        shared_tests = {}
+        # Beta nodes, by number: kind ('times', 'distinct' or 'all'), the
+        # field a 'distinct' node counts, the count that makes the node hold,
+        # the node it feeds (None for a rule's root) and its rule
+        self.kinds, self.fields, self.counts, self.parents, self.rule_of = [], [], [], [], []
+        self.roots = []
+        self.rule_nodes = []
+        self.ids = {}
+
+        def compile_condition(condition, parent, rule):
+            node = len(self.kinds)
+            if isinstance(condition, _Pattern):
+                condition = _Times(condition, 1)
+            kind = {_Times: "times", _Distinct: "distinct", _AllOf: "all"}[type(condition)]
+            self.kinds.append(kind)
+            self.fields.append(getattr(condition, "field", None))
+            self.counts.append(len(condition.conditions) if kind == "all" else condition.count)
+            self.parents.append(parent)
+            self.rule_of.append(rule)
+            self.rule_nodes[rule].append(node)
+            if kind == "all":
+                for part in condition.conditions:
+                    compile_condition(part, node, rule)
+            else:
+                pattern = condition.pattern
+                successors = shared_tests.get(pattern)
+                if successors is None:
+                    successors = shared_tests[pattern] = []
+                    self.alpha.setdefault(pattern.event_type, []).append(
+                        (pattern.fields, successors))
+                successors.append(node)
+            return node
+
+        for rule, achievement in enumerate(self.achievements):
+            if achievement.achievement_id in self.ids:
+                raise ValueError(f"Two achievements are called {achievement.achievement_id!r}")
+            self.ids[achievement.achievement_id] = rule
+            self.rule_nodes.append([])
+            self.roots.append(compile_condition(achievement.condition, None, rule))
+
+    def __len__(self):
+        return len(self.achievements)
+
+
+class AchievementTracker:
+    """The AchievementTracker class keeps one session's partial matches and
+    unlocks achievements as the session's events arrive."""
+
+    __slots__ = ("network", "on_unlock", "_done", "_counts", "_values", "_unlocked")
+
+    def __init__(self, network, on_unlock=None):
+        """
+        Initialize a tracker with nothing matched.
+
+        Parameters:
+        - network (AchievementNetwork): The compiled achievements.
+        - on_unlock (callable): Called with each Achievement when it unlocks.
+
+        Returns:
+        None
+        """
+        self.network = network
+        self.on_unlock = on_unlock
+        self._done = bytearray(len(network.kinds))
+        self._counts = [0] * len(network.kinds)
+        self._values = {}       # 'distinct' node -> the values seen
+        self._unlocked = {}     # achievement id -> None, in unlock order
+
+    def handle(self, events):
+        """
+        Update partial matches from a batch of events, as a subscriber of the game's event bus.
+
+        Parameters:
+        - events (list): Events, in the order they happened.
+
+        Returns:
+        list: The achievements unlocked by these events.
+        """
+        unlocked = []
+        alpha = self.network.alpha
+        for event in events:
+            for tests, successors in alpha.get(type(event), ()):
+                if all(getattr(event, field) == value for field, value in tests):
+                    for node in successors:
+                        if not self._done[node]:
+                            self._match(node, event, unlocked)
+        return unlocked
+
+    def _match(self, node, event, unlocked):
+        network = self.network
+        if network.kinds[node] == "distinct":
+            values = self._values.setdefault(node, set())
+            values.add(getattr(event, network.fields[node]))
+            self._counts[node] = len(values)
+        else:
+            self._counts[node] += 1
+        # A node that holds feeds the 'all_of' node above it, up to the rule's root
+        while self._counts[node] >= network.counts[node]:
+            self._done[node] = 1
+            self._values.pop(node, None)
+            parent = network.parents[node]
+            if parent is None:
+                self._unlock(network.rule_of[node], unlocked)
+                return
+            node = parent
+            self._counts[node] += 1
+
+    def _unlock(self, rule, unlocked):
+        achievement = self.network.achievements[rule]
+        for node in self.network.rule_nodes[rule]:
+            self._done[node] = 1
+        self._unlocked[achievement.achievement_id] = None
+        unlocked.append(achievement)
+        if self.on_unlock is not None:
+            self.on_unlock(achievement)
+
+    def reset(self):
+        """
+        Forget every partial match and unlocked achievement, for a new session.
+
+        Returns:
+        None
+        """
+        self._done[:] = bytes(len(self._done))
+        self._counts[:] = [0] * len(self._counts)
+        self._values.clear()
+        self._unlocked.clear()
+
+    @property
+    def unlocked(self):
+        """The ids of the unlocked achievements, in the order they were unlocked."""
+        return list(self._unlocked)
+
+    def restore(self, achievement_ids):
+        """
+        Mark achievements saved in the player record as unlocked, without notifying.
+
+        Parameters:
+        - achievement_ids (iterable): Saved achievement ids. Ids no longer defined are kept.
+
+        Returns:
+        None
+        """
+        for achievement_id in achievement_ids:
+            self._unlocked[achievement_id] = None
+            rule = self.network.ids.get(achievement_id)
+            if rule is not None:
+                for node in self.network.rule_nodes[rule]:
+                    self._done[node] = 1
+
+    def export(self):
+        """
+        Get the unlocked achievements in the format saved to 'user_data.json'.
+
+        Returns:
+        list: The ids of the unlocked achievements.
+        """
+        return list(self._unlocked)
+
+
+_network = None
+_network_lock = threading.Lock()
+
+
+def get_achievement_network():
+    """
+    Get the achievement network shared by every session, compiling it on first use.
+
+    Returns:
+    AchievementNetwork: The network compiled from ACHIEVEMENTS.
+    """
+    global _network
+    if _network is None:
+        with _network_lock:
+            if _network is None:
+                _network = AchievementNetwork(ACHIEVEMENTS)
+    return _network
@@ -0,0 +1,367 @@
+# balance.py
+
+"""
+Balance Simulator Module
+
+Description:
+This Python module estimates how hard the three mini-games are by simulating
+millions of players at once. Each game's rules are written as NumPy array
+operations over a batch of players instead of playing the classes in
+miniGames.py one round at a time. It reports win rates and how many attempts
+or rounds winning and losing players used, for tuning settings such as
+HauntedMansionGame's 'max_attempts' and RockPaperScissors' 3 lives.
+
+Simulated players:
+- Haunted Mansion: the secret word is drawn from the word dictionary and the
+  player guesses single letters in a random order ('random') or in order of
+  how often letters appear in the dictionary ('frequency'). Every letter guess
+  costs an attempt, as in the game.
+- Rock, Paper, Scissors: the player and the random computer pick uniformly at
+  random. Draws are free, losses cost a life, the first win ends the game.
+- Riddle: the player knows the answer with probability 'knows' and, when they
+  do, drops each letter with probability 'typo'. Whether each possible
+  dropped-letter answer is accepted is precomputed with the game's own
+  RiddleIndex, so typo forgiveness is simulated exactly.
+
+'cross_check' plays the same random inputs through the classes in miniGames.py
+and confirms every simulated result matches.
+
+Functions:
+1. simulate_haunted(players, max_attempts, player, seed): Haunted Mansion results.
+2. simulate_rps(players, lives, seed): Rock, Paper, Scissors results.
+3. simulate_riddle(players, knows, typo, seed): Riddle results.
+4. cross_check(players, seed): Compares the simulator with the game classes.
+
+Usage:
+    python balance.py [players=1000000] [max_attempts=6] [seed=1]
+    python balance.py check [players=500]
+
+Author: Haydens Little Helpers
+"""
+
+import numpy as np
+
+_LETTERS = np.arange(26, dtype=np.uint32)
+_CHUNK = 100000  # players simulated per batch, to bound memory
+_RPS_ROUNDS = 64  # the chance of a game lasting longer is below 1e-9
+_MAX_TYPO_LETTERS = 12
+
+
+def _dictionary():
+    """Return every secret word's letter mask, and the WordPack or WordList they came from."""
+    from word_pack import get_words
+
+    words = get_words()
+    masks = []
+    for group in words.groups():
+        group_masks = words.masks(group)
+        masks.append(np.array(group_masks, dtype=np.uint32))
+        if hasattr(group_masks, "release"):
+            group_masks.release()
+    return np.concatenate(masks), words
+
+
+def _word_at(words, position):
+    """Return the word at a position across all of a dictionary's groups."""
+    for group in words.groups():
+        size = words.group_size(group)
+        if position < size:
+            return words.word(group, position)
+        position -= size
+    raise IndexError(position)
+
+
+def _summary(won, attempts, most):
+    """Summarize a batch: the win rate and how many attempts winners and losers used."""
+    return {
+        "players": len(won),
+        "win_rate": float(won.mean()),
+        "wins_by_attempts": np.bincount(attempts[won], minlength=most + 1)[1:],
+        "losses_by_attempts": np.bincount(attempts[~won], minlength=most + 1)[1:],
+    }
+
+
+def haunted_outcomes(word_masks, letter_ranks, max_attempts):
+    """
+    Resolve Haunted Mansion games where the player only guesses letters.
+
+    Parameters:
+    - word_masks (ndarray): One secret word letter mask per player.
+    - letter_ranks (ndarray): players x 26, the turn on which each player guesses each letter.
+    - max_attempts (int): The number of letter guesses allowed.
+
+    Returns:
+    tuple: (won, attempts used) arrays.
+    """
+    in_word = (word_masks[:, None] >> _LETTERS) & 1 == 1
+    # The game is won on the turn the last letter of the word is guessed
+    needed = np.where(in_word, letter_ranks, -1).max(axis=1) + 1
+    won = needed <= max_attempts
+    return won, np.minimum(needed, max_attempts)
+
+
+def _haunted_inputs(rng, word_masks, players, player):
+    """Draw secret words and the order each player guesses letters in."""
+    secrets = rng.integers(len(word_masks), size=players)
+    if player == "frequency":
+        counts = ((word_masks[:, None] >> _LETTERS) & 1).sum(axis=0)
+        ranks = np.argsort(np.argsort(-counts, kind="stable"))
+        letter_ranks = np.broadcast_to(ranks, (players, 26))
+    else:
+        letter_ranks = np.argsort(rng.random((players, 26)), axis=1).argsort(axis=1)
+    return secrets, letter_ranks
+
+
+def simulate_haunted(players=1000000, max_attempts=6, player="random", seed=None):
+    """
+    Simulate Haunted Mansion games.
+
+    Parameters:
+    - players (int): How many games to simulate.
+    - max_attempts (int): The game's 'max_attempts'.
+    - player (str): 'random' or 'frequency', the order letters are guessed in.
+    - seed (int): Seeds the simulation so results can be repeated.
+
+    Returns:
+    dict: win_rate, and wins_by_attempts / losses_by_attempts counts for 1..max_attempts.
+    """
+    rng = np.random.default_rng(seed)
+    word_masks, _ = _dictionary()
+    won = []
+    attempts = []
+    for start in range(0, players, _CHUNK):
+        count = min(_CHUNK, players - start)
+        secrets, letter_ranks = _haunted_inputs(rng, word_masks, count, player)
+        chunk_won, chunk_attempts = haunted_outcomes(word_masks[secrets], letter_ranks,
+                                                     max_attempts)
+        won.append(chunk_won)
+        attempts.append(chunk_attempts)
+    return _summary(np.concatenate(won), np.concatenate(attempts), max_attempts)
+
+
+def rps_outcomes(player_moves, computer_moves, lives=3):
+    """
+    Resolve Rock, Paper, Scissors games from pre-drawn moves.
+
+    Parameters:
+    - player_moves (ndarray): players x rounds moves, 0 rock, 1 paper, 2 scissors.
+    - computer_moves (ndarray): The computer's moves, the same shape.
+    - lives (int): Losses allowed before the game is over.
+
+    Returns:
+    tuple: (won, rounds played) arrays.
+    """
+    from rps_predictor import LOSS, OUTCOMES, WIN
+
+    outcomes = np.array(OUTCOMES)[player_moves, computer_moves]
+    rounds = outcomes.shape[1]
+    wins = outcomes == WIN
+    first_win = np.where(wins.any(axis=1), wins.argmax(axis=1), rounds)
+    out_of_lives = np.cumsum(outcomes == LOSS, axis=1) >= lives
+    last_life = np.where(out_of_lives.any(axis=1), out_of_lives.argmax(axis=1), rounds)
+    won = first_win < last_life
+    return won, np.minimum(first_win, last_life) + 1
+
+
+def simulate_rps(players=1000000, lives=3, seed=None):
+    """
+    Simulate Rock, Paper, Scissors games against the random computer.
+
+    Parameters:
+    - players (int): How many games to simulate.
+    - lives (int): The game's 'attempts'.
+    - seed (int): Seeds the simulation so results can be repeated.
+
+    Returns:
+    dict: win_rate, and wins_by_attempts / losses_by_attempts counts by rounds played.
+    """
+    rng = np.random.default_rng(seed)
+    won = []
+    rounds = []
+    for start in range(0, players, _CHUNK):
+        count = min(_CHUNK, players - start)
+        moves = rng.integers(3, size=(2, count, _RPS_ROUNDS))
+        chunk_won, chunk_rounds = rps_outcomes(moves[0], moves[1], lives)
+        won.append(chunk_won)
+        rounds.append(chunk_rounds)
+    return _summary(np.concatenate(won), np.concatenate(rounds), _RPS_ROUNDS)
+
+
+def _typo_letters(answer):
+    return min(len(answer), _MAX_TYPO_LETTERS)
+
+
+def _drop_letters(answer, dropped):
+    """Return 'answer' without the letters whose bit is set in 'dropped'."""
+    return "".join(letter for position, letter in enumerate(answer)
+                   if not dropped >> position & 1)
+
+
+def _levenshtein(first, second):
+    """Return the full Levenshtein distance between two strings."""
+    previous = list(range(len(second) + 1))
+    for row, letter in enumerate(first, 1):
+        current = [row]
+        for column, other in enumerate(second, 1):
+            current.append(min(previous[column] + 1, current[column - 1] + 1,
+                               previous[column - 1] + (letter != other)))
+        previous = current
+    return previous[-1]
+
+
+def _riddle_acceptance(index):
+    """Precompute, for every riddle and set of dropped letters, whether the answer is accepted.
+
+    The table follows the game's rule rather than calling RiddleIndex.check,
+    so cross_check can compare the two: a guess is accepted if it is within
+    allowed_typos edits of the normalized answer or of any of its aliases."""
+    from riddle_index import allowed_typos, normalize_answer
+
+    answers = [normalize_answer(index.answer(riddle)) for riddle in range(len(index))]
+    table = np.zeros((len(index), 1 << _MAX_TYPO_LETTERS), dtype=bool)
+    for riddle, answer in enumerate(answers):
+        accepted = index.accepted_answers(riddle)
+        for dropped in range(1 << _typo_letters(answer)):
+            guess = _drop_letters(answer, dropped)
+            table[riddle, dropped] = any(_levenshtein(guess, alias) <= allowed_typos(alias)
+                                         for alias in accepted)
+    lengths = np.array([_typo_letters(answer) for answer in answers])
+    return table, lengths, answers
+
+
+def _riddle_inputs(rng, lengths, players, knows, typo):
+    """Draw each player's riddle, whether they know it and which letters they drop."""
+    riddles = rng.integers(len(lengths), size=players)
+    knew = rng.random(players) < knows
+    drops = rng.random((players, _MAX_TYPO_LETTERS)) < typo
+    drops &= np.arange(_MAX_TYPO_LETTERS) < lengths[riddles][:, None]
+    dropped = (drops * (1 << np.arange(_MAX_TYPO_LETTERS))).sum(axis=1)
+    return riddles, knew, dropped
+
+
+def simulate_riddle(players=1000000, knows=0.6, typo=0.05, seed=None):
+    """
+    Simulate answering the door 3 riddle.
+
+    Parameters:
+    - players (int): How many players to simulate.
+    - knows (float): The chance a player knows the answer.
+    - typo (float): The chance a player drops each letter of an answer they know.
+    - seed (int): Seeds the simulation so results can be repeated.
+
+    Returns:
+    dict: win_rate, and wins_by_attempts / losses_by_attempts counts (one attempt each).
+    """
+    from riddle_index import get_riddle_index
+
+    rng = np.random.default_rng(seed)
+    table, lengths, _ = _riddle_acceptance(get_riddle_index())
+    riddles, knew, dropped = _riddle_inputs(rng, lengths, players, knows, typo)
+    won = knew & table[riddles, dropped]
+    return _summary(won, np.ones(players, dtype=np.int64), 1)
+
+
+def cross_check(players=500, seed=None):
+    """
+    Play the same random inputs through the simulator and the miniGames classes.
+
+    Parameters:
+    - players (int): How many games of each mini-game to compare.
+    - seed (int): Seeds the inputs.
+
+    Returns:
+    dict: Mini-game name -> number of games whose results differed.
+    """
+    import contextlib
+    import io
+    import random
+    from miniGames import HauntedMansionGame, Riddle, RockPaperScissors
+    from riddle_index import get_riddle_index
+    from rps_predictor import MOVES
+
+    rng = np.random.default_rng(seed)
+    mismatches = {}
+
+    word_masks, words = _dictionary()
+    secrets, letter_ranks = _haunted_inputs(rng, word_masks, players, "random")
+    won, attempts = haunted_outcomes(word_masks[secrets], letter_ranks, 6)
+    mismatches["Haunted Mansion"] = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for game in range(players):
+            haunted = HauntedMansionGame(secret_word=_word_at(words, secrets[game]))
+            class_won = False
+            for letter in np.argsort(letter_ranks[game]):
+                if haunted.check_letter(chr(97 + letter)) == 1:
+                    class_won = True
+                    break
+                if haunted.is_game_over():
+                    break
+            used = haunted.max_attempts - haunted.remaining_attempts
+            if class_won != won[game] or used != attempts[game]:
+                mismatches["Haunted Mansion"] += 1
+
+    moves = rng.integers(3, size=(2, players, _RPS_ROUNDS))
+    won, rounds = rps_outcomes(moves[0], moves[1])
+    mismatches["Rock Paper Scissors"] = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for game in range(players):
+            rps = RockPaperScissors()
+            class_won = False
+            played = 0
+            while rps.attempts > 0 and played < _RPS_ROUNDS:
+                played += 1
+                if rps.determine_winner(MOVES[moves[0, game, played - 1]],
+                                        MOVES[moves[1, game, played - 1]]):
+                    class_won = True
+                    break
+            if class_won != won[game] or played != rounds[game]:
+                mismatches["Rock Paper Scissors"] += 1
+
+    index = get_riddle_index()
+    table, lengths, answers = _riddle_acceptance(index)
+    riddles, knew, dropped = _riddle_inputs(rng, lengths, players, 0.6, 0.15)
+    won = knew & table[riddles, dropped]
+    mismatches["Riddle"] = 0
+    riddle_game = Riddle(random.Random(seed))
+    for game in range(players):
+        # Put the drawn riddle in front of the player, as print_riddle would
+        riddle_game._current = int(riddles[game])
+        riddle_game.current_riddle = index.question(riddle_game._current)
+        # A player who doesn't know the answer gives up
+        guess = (_drop_letters(answers[riddles[game]], int(dropped[game]))
+                 if knew[game] else "I don't know")
+        if riddle_game.check_answer(guess) != won[game]:
+            mismatches["Riddle"] += 1
+    return mismatches
+
+
+def _print_summary(name, summary, label):
+    print(f"{name}: {100 * summary['win_rate']:.1f}% of {summary['players']} players win")
+    wins, losses = summary["wins_by_attempts"], summary["losses_by_attempts"]
+    last = max(np.flatnonzero(wins + losses), default=0) + 1
+    for used in range(last):
+        if wins[used] or losses[used]:
+            print(f"    {used + 1:>2} {label}: {wins[used]:>9} won, {losses[used]:>9} lost")
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    options = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+    seed = int(options.get("seed", 1))
+    if "check" in sys.argv[1:]:
+        results = cross_check(int(options.get("players", 500)), seed)
+        for name, mismatched in results.items():
+            print(f"{name}: {'OK' if not mismatched else f'{mismatched} games differ'}")
+        sys.exit(1 if any(results.values()) else 0)
+
+    players = int(options.get("players", 1000000))
+    max_attempts = int(options.get("max_attempts", 6))
+    start = time.perf_counter()
+    for player in ("random", "frequency"):
+        _print_summary(f"Haunted Mansion ({player} letters, {max_attempts} attempts)",
+                       simulate_haunted(players, max_attempts, player, seed), "attempts")
+    _print_summary("Rock Paper Scissors (3 lives)", simulate_rps(players, seed=seed), "rounds")
+    _print_summary("Riddle", simulate_riddle(players, seed=seed), "attempt")
+    print(f"Simulated {3 * players} games in {time.perf_counter() - start:.1f} s")
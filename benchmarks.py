@@ -0,0 +1,690 @@
+# benchmarks.py
+
+"""
+Benchmarks Module
+
+Description:
+This script holds the performance benchmarks for the game. Each benchmark is a
+function that prints its own results, and can be run on its own from the
+command line.
+
+Usage:
+    python benchmarks.py                 # run every benchmark
+    python benchmarks.py content_startup # run one benchmark by name
+    python benchmarks.py game_memory baseline=HEAD~1   # pass keyword arguments
+
+Author: Haydens Little Helpers
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+BENCHMARKS = {}
+
+
+def benchmark(function):
+    """Register a benchmark under its function name, without the 'bench_' prefix."""
+    BENCHMARKS[function.__name__.removeprefix("bench_")] = function
+    return function
+
+
+def _time_python(code, runs):
+    """Return the best wall-clock time of running 'code' in a fresh interpreter."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@benchmark
+def bench_content_startup(runs=10):
+    """Compare a cold start that parses the JSON content with one that maps the content pack."""
+    import contextlib
+    from content import CONTENT_SOURCES
+    from content_pack import PACK_FILE, build_pack
+
+    # Touch the content a session needs on startup: story text, every character and a secret word
+    code = ("from content import get_game_data, get_story_data\n"
+            "story = get_story_data()\n"
+            "text = story['Story']['intro']\n"
+            "names = [c['name'] for c in story['Characters'].values()]\n"
+            "word = get_game_data()['Secret_words'][0]\n")
+    runs = int(runs)
+
+    had_pack = os.path.exists(PACK_FILE)
+    if had_pack:
+        os.rename(PACK_FILE, PACK_FILE + ".bak")
+    try:
+        json_time = _time_python(code, runs)
+        size = build_pack(CONTENT_SOURCES)
+        pack_time = _time_python(code, runs)
+        baseline = _time_python("pass", runs)
+    finally:
+        # build_pack may have failed before writing a pack
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(PACK_FILE)
+        if had_pack:
+            os.rename(PACK_FILE + ".bak", PACK_FILE)
+
+    print(f"interpreter only:   {baseline * 1000:.1f} ms")
+    print(f"JSON content:       {json_time * 1000:.1f} ms")
+    print(f"content pack:       {pack_time * 1000:.1f} ms ({size} bytes)")
+
+
+@benchmark
+def bench_first_prompt(runs=5, budget_ms=150):
+    """Time how long 'main.py' takes to show its first output and first prompt.
+
+    The first output is the start of the intro, so it measures imports and
+    Game() construction. It is compared against 'budget_ms' to catch
+    startup regressions. The first prompt also includes the intro's
+    typewriter effect.
+    """
+    runs, budget_ms = int(runs), float(budget_ms)
+    first_output = []
+    first_prompt = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, "-u", "main.py"],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL)
+        seen = b""
+        output_time = None
+        while b"register(R)" not in seen:
+            chunk = process.stdout.read1(4096)
+            if not chunk:
+                break
+            if output_time is None:
+                output_time = time.perf_counter() - start
+            seen += chunk
+        first_prompt.append(time.perf_counter() - start)
+        first_output.append(output_time)
+        process.kill()
+        process.wait()
+
+    output_ms = min(first_output) * 1000
+    print(f"first output:       {output_ms:.1f} ms (budget {budget_ms} ms)")
+    print(f"first prompt:       {min(first_prompt) * 1000:.1f} ms")
+    if output_ms > budget_ms:
+        print("REGRESSION: startup is over budget, run 'python main.py --profile-startup'")
+
+
+def _allocated_bytes(build):
+    """Return the bytes still allocated by 'build()' and its result, via tracemalloc."""
+    import tracemalloc
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return size, result
+
+
+@benchmark
+def bench_character_sessions(sessions=10000):
+    """Measure per-session character memory with definitions shared across sessions."""
+    from character import character_from_definition
+    from content import get_story_data
+
+    sessions = int(sessions)
+
+    def build_session():
+        characters = get_story_data()["Characters"]
+        return [character_from_definition(characters[key]) for key in characters]
+
+    # Warm up so the shared definitions are allocated outside the measurement
+    shared_size, first = _allocated_bytes(build_session)
+    size, _ = _allocated_bytes(lambda: [build_session() for _ in range(sessions)])
+
+    per_session = size / sessions
+    print(f"first session (imports, shared text):  {shared_size} bytes")
+    print(f"{sessions} concurrent sessions:           {size / 1024:.0f} KiB")
+    print(f"per session ({len(first)} characters):        {per_session:.0f} bytes")
+    print(f"per character:                         {per_session / len(first):.0f} bytes")
+
+
+_GAME_MEMORY_CODE = """
+import tracemalloc
+from game import Game
+Game()
+tracemalloc.start()
+before = tracemalloc.take_snapshot()
+games = [Game() for _ in range({count})]
+after = tracemalloc.take_snapshot()
+print(sum(stat.size_diff for stat in after.compare_to(before, "filename")) / {count})
+"""
+
+
+@benchmark
+def bench_game_memory(baseline="HEAD", count=2000):
+    """Report tracemalloc bytes per Game for the working tree and a baseline git revision."""
+    import tempfile
+
+    code = _GAME_MEMORY_CODE.format(count=int(count))
+    current = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                             text=True, check=True).stdout
+
+    with tempfile.TemporaryDirectory() as tree:
+        archive = subprocess.run(["git", "archive", baseline],
+                                 capture_output=True, check=True).stdout
+        subprocess.run(["tar", "-x", "-C", tree], input=archive, check=True)
+        previous = subprocess.run([sys.executable, "-c", code], cwd=tree,
+                                  capture_output=True, text=True,
+                                  check=True).stdout
+
+    print(f"before ({baseline}): {float(previous):8.0f} bytes per Game")
+    print(f"after (working tree): {float(current):8.0f} bytes per Game")
+
+
+def _clue_pool():
+    """Return realistic clue text: every character's interaction lines plus item clues."""
+    from character import character_from_definition
+    from content import get_story_data
+
+    story = get_story_data()
+    pool = []
+    for definition in story["Characters"].values():
+        character = character_from_definition(definition)
+        interaction = character.interact
+        pool.append(interaction if isinstance(interaction, str) else interaction())
+        if hasattr(character, "provide_alibi"):
+            pool.append(character.provide_alibi())
+        if hasattr(character, "share_observation"):
+            pool.append(character.share_observation())
+    pool.extend(item["description"] for item in story["Items"].values())
+    return pool
+
+
+@benchmark
+def bench_clue_storage(users=100000, seed=1):
+    """Compare saving clue text per player with saving ids into a shared clue dictionary."""
+    import json
+    import random
+    import tempfile
+    from clues import ClueDictionary
+
+    users = int(users)
+    rng = random.Random(int(seed))
+    pool = _clue_pool()
+    locations = ["CrimeScene", "Attic", "Kitchen", "Library", "Secret Passages"]
+    progress = {
+        f"player{number}": {location: rng.sample(pool, rng.randint(0, 6))
+                            for location in locations}
+        for number in range(users)
+    }
+
+    with tempfile.TemporaryDirectory() as folder:
+        dictionary = ClueDictionary(os.path.join(folder, "clue_dictionary.json"))
+        text_data = {}
+        id_data = {}
+        for player, found in progress.items():
+            text_data[player] = {"Location_clues": {
+                location: {"All clues found": False, "Clues": clues, "Visited": False}
+                for location, clues in found.items()}}
+            id_data[player] = {"Location_clues": {
+                location: {"All clues found": False,
+                           "Clue ids": dictionary.encode(clues), "Visited": False}
+                for location, clues in found.items()}}
+
+        results = {}
+        for label, data in (("clue text", text_data), ("clue ids", id_data)):
+            filename = os.path.join(folder, label.replace(" ", "_") + ".json")
+            with open(filename, "w") as file:
+                json.dump(data, file, indent=2)
+
+            start = time.perf_counter()
+            with open(filename) as file:
+                loaded = json.load(file)
+            parsed = time.perf_counter() - start
+            # Decoding every profile is the worst case; a game only decodes
+            # the locations its one player revisits
+            if label == "clue ids":
+                reader = ClueDictionary(dictionary.filename)
+                for player in loaded.values():
+                    for location in player["Location_clues"].values():
+                        reader.decode(location["Clue ids"])
+            decoded = time.perf_counter() - start - parsed
+            results[label] = (os.path.getsize(filename), parsed, decoded)
+            del loaded
+
+    print(f"{users} players, {len(pool)} distinct clues")
+    for label, (size, parsed, decoded) in results.items():
+        print(f"{label:>10}: {size / 1024 / 1024:7.1f} MiB, parsed in {parsed:.2f} s, "
+              f"all clues decoded in {decoded:.2f} s")
+    text_size, text_time, _ = results["clue text"]
+    id_size, id_time, _ = results["clue ids"]
+    print(f"reduction:  {100 * (1 - id_size / text_size):.0f}% smaller, "
+          f"{100 * (1 - id_time / text_time):.0f}% faster to parse")
+
+
+class _ListInventory:
+    """The list-scanning inventory used before items were indexed, kept for comparison."""
+
+    def __init__(self):
+        self.items = []
+
+    def add_item(self, item):
+        self.items.append(item)
+
+    def use_item(self, item_name, game):
+        item = next((item for item in self.items
+                     if item.name.lower() == item_name.lower()), None)
+        if item:
+            item.use(game)
+            self.items.remove(item)
+
+
+@benchmark
+def bench_inventory(items=10000):
+    """Time adding, looking up and using items in an inventory of 'items' items."""
+    import contextlib
+    import io
+    from inventory import Inventory
+    from item import Item
+
+    class Session:
+        score = 0
+
+    count = int(items)
+    names = [f"Evidence {number}" for number in range(count)]
+    stock = [Item(name, "Synthetic evidence", "", 1) for name in names]
+    # Use from the back so the list version has to scan the whole inventory
+    to_use = [name.upper() for name in reversed(names)]
+
+    for label, inventory in (("list scan", _ListInventory()),
+                             ("name index", Inventory())):
+        session = Session()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for item in stock:
+                inventory.add_item(item)
+            added = time.perf_counter()
+            for name in to_use:
+                inventory.use_item(name, session)
+            used = time.perf_counter()
+        print(f"{label:>10}: add {count} in {(added - start) * 1000:8.1f} ms, "
+              f"use {count} in {(used - added) * 1000:8.1f} ms "
+              f"({(used - added) / count * 1e6:.2f} us per use)")
+
+
+def _synthetic_words(count, rng):
+    """Return 'count' random words with letters weighted roughly like English."""
+    letters = "eeeeeeettttaaaaoooiiinnnssshhrrdlcumwfgypbvkjxqz"
+    return {"".join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+            for _ in range(count)}
+
+
+@benchmark
+def bench_word_pack(words=300000, picks=100000, seed=1):
+    """Compare a large secret word dictionary held in a Python list with a mapped word pack."""
+    import random
+    import tempfile
+    from word_pack import EASY, WordPack, build_word_pack
+
+    count, picks = int(words), int(picks)
+    rng = random.Random(int(seed))
+    dictionary = _synthetic_words(count, rng)
+
+    with tempfile.TemporaryDirectory() as folder:
+        source = os.path.join(folder, "words.txt")
+        output = os.path.join(folder, "words.pack")
+        with open(source, "w") as file:
+            file.write("\n".join(dictionary))
+
+        start = time.perf_counter()
+        build_word_pack([source], output)
+        built = time.perf_counter() - start
+
+        def load_list():
+            with open(source) as file:
+                return file.read().split()
+
+        list_size, word_list = _allocated_bytes(load_list)
+        start = time.perf_counter()
+        pack_size, pack = _allocated_bytes(lambda: WordPack(output))
+        opened = time.perf_counter() - start
+
+        pick_rng = random.Random(int(seed))
+        start = time.perf_counter()
+        for _ in range(picks):
+            pick_rng.choice(word_list)
+        list_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(picks):
+            pack.random_word(rng=pick_rng)
+        pack_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(picks):
+            pack.random_word(5, EASY, pick_rng)
+        filtered_time = time.perf_counter() - start
+
+        print(f"{len(pack)} words, pack built in {built:.2f} s, "
+              f"{os.path.getsize(output) / 1024:.0f} KiB on disk")
+        print(f"python list: {list_size / 1024:8.0f} KiB in memory")
+        print(f"word pack:   {pack_size / 1024:8.0f} KiB in memory, opened in {opened * 1000:.2f} ms")
+        print(f"random word: list {list_time / picks * 1e6:.2f} us, "
+              f"pack {pack_time / picks * 1e6:.2f} us, "
+              f"pack (length 5, easy, {pack.count(5, EASY)} words) "
+              f"{filtered_time / picks * 1e6:.2f} us")
+        pack.close()
+
+
+@benchmark
+def bench_word_guesses(guesses=2000000, words=100000, solves=100, seed=1):
+    """Time Haunted Mansion guess evaluation with sets and with letter bitmasks,
+    and how quickly the solver finds words in a large dictionary."""
+    import random
+    import tempfile
+    from word_pack import WordPack, build_word_pack, letter_mask
+    from word_solver import WordSolver, evaluate_guess
+
+    guesses, solves = int(guesses), int(solves)
+    rng = random.Random(int(seed))
+    dictionary = sorted(_synthetic_words(int(words), rng))
+    secrets = [rng.choice(dictionary) for _ in range(guesses // 6 + 1)]
+    letters = [rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(guesses)]
+
+    # The set version does what check_letter and is_winner did per guess
+    start = time.perf_counter()
+    wins = 0
+    for game, secret in enumerate(secrets):
+        guessed = set()
+        for letter in letters[game * 6:game * 6 + 6]:
+            guessed.add(letter)
+            if letter in secret and set(secret) <= guessed:
+                wins += 1
+                break
+    set_time = time.perf_counter() - start
+
+    secret_masks = [letter_mask(secret) for secret in secrets]
+    letter_masks = [1 << (ord(letter) - 97) for letter in letters]
+    start = time.perf_counter()
+    mask_wins = 0
+    for game, word_mask in enumerate(secret_masks):
+        guessed_mask = 0
+        for guess_mask in letter_masks[game * 6:game * 6 + 6]:
+            guessed_mask, hits, won = evaluate_guess(word_mask, guessed_mask, guess_mask)
+            if won:
+                mask_wins += 1
+                break
+    mask_time = time.perf_counter() - start
+
+    # The same integer operations without a function call per guess
+    start = time.perf_counter()
+    inline_wins = 0
+    for game, word_mask in enumerate(secret_masks):
+        guessed_mask = 0
+        for guess_mask in letter_masks[game * 6:game * 6 + 6]:
+            guessed_mask |= guess_mask
+            if word_mask & guess_mask and not word_mask & ~guessed_mask:
+                inline_wins += 1
+                break
+    inline_time = time.perf_counter() - start
+    assert wins == mask_wins == inline_wins
+
+    print(f"{guesses} guesses over {len(secrets)} games")
+    print(f"sets:              {guesses / set_time / 1e6:5.2f} million guesses per second")
+    print(f"evaluate_guess:    {guesses / mask_time / 1e6:5.2f} million guesses per second")
+    print(f"bitmasks, inlined: {guesses / inline_time / 1e6:5.2f} million guesses per second")
+
+    with tempfile.TemporaryDirectory() as folder:
+        source = os.path.join(folder, "words.txt")
+        output = os.path.join(folder, "words.pack")
+        with open(source, "w") as file:
+            file.write("\n".join(dictionary))
+        build_word_pack([source], output)
+        pack = WordPack(output)
+
+        solver = WordSolver(pack, 5)
+        start = time.perf_counter()
+        first = solver.suggest(0, 0, "_ _ _ _ _")
+        first_time = time.perf_counter() - start
+
+        targets = [word for word in rng.sample(dictionary, len(dictionary))
+                   if len(word) == 5][:solves]
+        start = time.perf_counter()
+        lengths = [len(solver.solve(word)) for word in targets]
+        solve_time = time.perf_counter() - start
+        pack.close()
+
+    print(f"solver: first hint for {first.candidates} five letter words "
+          f"('{first.guess}') in {first_time * 1000:.0f} ms")
+    print(f"solver: {len(targets)} words solved in {sum(lengths) / len(lengths):.1f} "
+          f"guesses on average, {solve_time / len(targets) * 1000:.0f} ms per word")
+
+
+@benchmark
+def bench_riddles(riddles=100000, checks=100000, seed=1):
+    """Time picking riddles and checking answers, exact and with typos, in a large riddle index."""
+    import random
+    from riddle_index import RiddleIndex
+
+    count, checks = int(riddles), int(checks)
+    rng = random.Random(int(seed))
+    answers = sorted(_synthetic_words(count, rng))
+    riddle_answers = {f"Riddle number {number}?": rng.choice(answers)
+                      for number in range(count)}
+    aliases = {answer: [f"the {answer}", answer[:2] + " " + answer[2:]]
+               for answer in answers[::10]}
+
+    start = time.perf_counter()
+    index = RiddleIndex(riddle_answers, aliases)
+    built = time.perf_counter() - start
+
+    # The old Riddle.print_riddle copied every question into a list per pick
+    picks = min(checks, 200)
+    start = time.perf_counter()
+    for _ in range(picks):
+        rng.choice(list(riddle_answers.keys()))
+    list_pick = (time.perf_counter() - start) / picks
+    start = time.perf_counter()
+    for _ in range(checks):
+        index.random_riddle(rng)
+    index_pick = (time.perf_counter() - start) / checks
+
+    def typo(answer):
+        position = rng.randrange(len(answer))
+        return answer[:position] + answer[position + 1:]
+
+    cases = []
+    for _ in range(checks):
+        riddle = index.random_riddle(rng)
+        answer = index.answer(riddle)
+        cases.append((riddle, rng.choice((answer, "A " + answer.upper(), typo(answer),
+                                          rng.choice(answers)))))
+    start = time.perf_counter()
+    accepted = sum(index.check(riddle, guess) for riddle, guess in cases)
+    check_time = (time.perf_counter() - start) / checks
+    worst = 0.0
+    for riddle, guess in cases[:2000]:
+        start = time.perf_counter()
+        index.check(riddle, guess)
+        worst = max(worst, time.perf_counter() - start)
+
+    print(f"{count} riddles indexed in {built:.2f} s")
+    print(f"pick a riddle: list copy {list_pick * 1000:.2f} ms, index {index_pick * 1e6:.2f} us")
+    print(f"check answer: {check_time * 1e6:.2f} us average, {worst * 1e6:.0f} us worst "
+          f"({accepted} of {checks} accepted)")
+
+
+@benchmark
+def bench_rps(rounds=1000000, seed=1):
+    """Play the adaptive Rock, Paper, Scissors opponent against scripted players and
+    check that the time per round stays flat as the move history grows."""
+    import random
+    from rps_predictor import BEATS, LOSS, OUTCOMES, WIN, MovePredictor
+
+    rounds = int(rounds)
+    rng = random.Random(int(seed))
+    # Each strategy picks the player's move from the round number, their last
+    # move and the computer's last move
+    strategies = {
+        "always rock": lambda turn, mine, theirs: 0,
+        "cycle": lambda turn, mine, theirs: turn % 3,
+        "beat last": lambda turn, mine, theirs: BEATS[theirs],
+        "repeat 3x": lambda turn, mine, theirs: turn // 3 % 3,
+        "switch every 100k": lambda turn, mine, theirs: turn // 100000 % 3,
+        "random": lambda turn, mine, theirs: rng.randrange(3),
+    }
+    chunk = rounds // 10
+
+    print(f"{rounds} rounds per strategy, order 1 model")
+    for name, strategy in strategies.items():
+        predictor = MovePredictor(order=1, rng=rng)
+        mine = theirs = 0
+        computer_wins = player_wins = 0
+        chunk_times = []
+        start = time.perf_counter()
+        for turn in range(rounds):
+            theirs = BEATS[predictor.predict()]
+            mine = strategy(turn, mine, theirs)
+            predictor.update(mine)
+            outcome = OUTCOMES[mine][theirs]
+            if outcome == LOSS:
+                computer_wins += 1
+            elif outcome == WIN:
+                player_wins += 1
+            if (turn + 1) % chunk == 0:
+                now = time.perf_counter()
+                chunk_times.append(now - start)
+                start = now
+        first, last = chunk_times[0] / chunk, chunk_times[-1] / chunk
+        print(f"{name:>18}: computer wins {100 * computer_wins / rounds:5.1f}%, "
+              f"player wins {100 * player_wins / rounds:5.1f}%, "
+              f"{first * 1e6:.2f} us per round at the start, {last * 1e6:.2f} us at the end")
+
+
+@benchmark
+def bench_event_bus(events=1000000):
+    """Measure event bus throughput with immediate, batched and background
+    delivery, and how much subscribers to other event types cost."""
+    from events import ClueFound, CommandIssued, EventBus, MiniGameWon
+
+    events = int(events)
+    published = [ClueFound("Kitchen", f"clue {number}", "evidence")
+                 for number in range(1000)]
+    received = []
+
+    def count(batch):
+        received.append(len(batch))
+
+    def run(bus):
+        received.clear()
+        start = time.perf_counter()
+        publish = bus.publish
+        for number in range(events):
+            publish(published[number % 1000])
+        bus.flush()
+        elapsed = time.perf_counter() - start
+        bus.close()
+        assert sum(received) == events
+        return elapsed
+
+    start = time.perf_counter()
+    for number in range(events):
+        count([published[number % 1000]])
+    direct = time.perf_counter() - start
+
+    setups = {
+        "immediate": {},
+        "batches of 64": {"batch_size": 64},
+        "background, batches of 256": {"batch_size": 256, "asynchronous": True},
+    }
+    print(f"{events} ClueFound events, one counting subscriber")
+    print(f"{'calling the handler directly':>42}: {events / direct:>12,.0f} events/s")
+    for name, options in setups.items():
+        bus = EventBus()
+        bus.subscribe(count, (ClueFound,), **options)
+        elapsed = run(bus)
+        print(f"{name:>42}: {events / elapsed:>12,.0f} events/s, "
+              f"{elapsed / events * 1e9:.0f} ns per event")
+
+    # Subscribers to other event types are filtered out once per type
+    bus = EventBus()
+    for _ in range(50):
+        bus.subscribe(count, (MiniGameWon, CommandIssued))
+    bus.subscribe(count, (ClueFound,))
+    elapsed = run(bus)
+    print(f"{'immediate, 50 other subscribers':>42}: {events / elapsed:>12,.0f} events/s, "
+          f"{elapsed / events * 1e9:.0f} ns per event")
+
+
+@benchmark
+def bench_session_pool(sessions=20000, live=200, seed=1):
+    """Measure how many sessions a host starts per second, and the time spent
+    in garbage collection pauses, building every Game and reusing them from a pool."""
+    import contextlib
+    import gc
+    import io
+    from collections import deque
+    from events import CharacterInteracted
+    from game import Game, derive_seed
+    from session_pool import SessionPool
+
+    sessions, live, seed = int(sessions), int(live), int(seed)
+    pauses = []
+    started = []
+
+    def on_gc(phase, info):
+        if phase == "start":
+            started.append(time.perf_counter())
+        else:
+            pauses.append(time.perf_counter() - started.pop())
+
+    def play(game):
+        # A short session that touches the state a reset has to restore
+        game.started = True
+        game.find_clue(game.crime_scene, game.witness.interact(), "testimony")
+        game.events.publish(CharacterInteracted(game.witness.name, "witness", "CrimeScene"))
+        game.find_clue(game.kitchen, game.kitchen.npc.interact, "testimony")
+        game.events.publish(CharacterInteracted(game.kitchen.npc.name, "npc", "Kitchen"))
+        game.inventory.add_item(game.new_item("letter", game.crime_scene.key))
+        game.doors_checker[0] = True
+        game.rng.random()
+
+    def host(acquire, release):
+        # 'live' players are playing at any time; each new player replaces the oldest
+        playing = deque()
+        pauses.clear()
+        gc.collect()
+        gc.callbacks.append(on_gc)
+        try:
+            start = time.perf_counter()
+            for number in range(sessions):
+                if len(playing) == live:
+                    release(playing.popleft())
+                game = acquire(derive_seed(seed, number))
+                play(game)
+                playing.append(game)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.callbacks.remove(on_gc)
+        return elapsed
+
+    pool = SessionPool(size=live)
+    setups = {
+        "new Game per player": (lambda game_seed: Game(seed=game_seed), lambda game: None),
+        f"pool of {live}": (pool.acquire, pool.release),
+    }
+    print(f"{sessions} sessions, {live} playing at once")
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = {name: (host(*hooks), list(pauses)) for name, hooks in setups.items()}
+    for name, (elapsed, gc_pauses) in results.items():
+        print(f"{name:>20}: {sessions / elapsed:>9,.0f} sessions/s, "
+              f"{len(gc_pauses)} GC pauses totalling {sum(gc_pauses) * 1000:.1f} ms "
+              f"(longest {max(gc_pauses, default=0) * 1000:.2f} ms)")
+    print(f"pool built {pool.created} sessions and reused {pool.reused}")
+
+
+if __name__ == "__main__":
+    names = [arg for arg in sys.argv[1:] if "=" not in arg] or list(BENCHMARKS)
+    options = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+    for name in names:
+        print(f"== {name} ==")
+        BENCHMARKS[name](**options)
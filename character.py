@@ -15,17 +15,72 @@ characters under suspicion in the crime investigation, providing alibis and
 potential deception cues. - The Witness class represents characters who have
 witnessed or heard something related to the crime, sharing observations.
 
+Characters are flyweights: the text and age that never change live in a
+CharacterDefinition that is shared by every session in the process, and each
+character object only carries that reference and its own interacted flag.
+Setting 'action', 'age' or 'observation' gives that one character its own
+modified copy of the definition, so other sessions are not affected. Shared
+definitions are forgotten when the story content changes.
+
 Classes:
+    - CharacterDefinition: Immutable, shared description of a character.
     - Character: Base class with common attributes and methods for characters.
     - NPC: Non-player character class inheriting from Character.
     - Suspect: Represents characters under suspicion with alibi information.
     - Witness: Represents characters who have witnessed or heard something related to the crime.
 
+Functions:
+    - shared_definition: Returns the process-wide copy of a character definition.
+    - character_from_definition: Builds a character from its entry in the story data.
+
 """
 
 # Import necessary modules and classes
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
+
+CharacterDefinition = namedtuple(
+    "CharacterDefinition",
+    ["name", "dialogue", "action", "age", "alibi", "observation"],
+    defaults=[None, None],
+)
+CharacterDefinition.__doc__ = """The parts of a character that are the same in
+every session. Shared between sessions, so it is immutable."""
+
+# One copy of every distinct definition, shared by all sessions. Cleared
+# when the content changes, so it only holds the current content's characters
+_shared_definitions = {}
+_shared_definitions_version = None
+
+
+def _forget_old_definitions():
+    """Empty the shared definitions if the content changed since they were made."""
+    global _shared_definitions_version
+    from content import content_version
+
+    version = content_version()
+    if version != _shared_definitions_version:
+        _shared_definitions.clear()
+        _shared_definitions_version = version
+
+
+def shared_definition(name, dialogue, action, age, alibi=None,
+                      observation=None):
+    """Return the process-wide CharacterDefinition with these values.
+
+    :return: An existing definition if an identical one was made before,
+        otherwise a new one that later sessions will reuse.
+    """
+    definition = CharacterDefinition(name, dialogue, action, age, alibi,
+                                     observation)
+    shared = _shared_definitions.get(definition)
+    if shared is None:
+        # Only a new definition can grow the table, so only then is the
+        # content version checked
+        _forget_old_definitions()
+        shared = _shared_definitions.setdefault(definition, definition)
+    return shared
 
 
 # Define a base class for characters
@@ -37,25 +92,66 @@ class Character(ABC):
     are subclasses that inherit from Character and introduce their unique
     attributes and methods. """
 
-    def __init__(self, name, dialogue, action, age):
-        self._name = name
-        self._dialogue = dialogue
+    # Only the per-session state is stored on each character: its
+    # definition, the shared one it was built from and its interacted flag
+    __slots__ = ("_definition", "_shared", "_interacted")
+
+    def __init__(self, name, dialogue, action, age, **details):
+        self._definition = self._shared = shared_definition(
+            name, dialogue, action, age, **details)
+        self._interacted = False
+
+    @classmethod
+    def from_definition(cls, definition):
+        """Create a character for a new session from a shared definition."""
+        character = cls.__new__(cls)
+        character._definition = character._shared = definition
+        character._interacted = False
+        return character
+
+    @property
+    def definition(self):
+        return self._definition
+
+    def reset(self):
+        """Forget that the player talked to the character, and any changes
+        made to its action, age or observation, for a new session."""
+        self._definition = self._shared
         self._interacted = False
-        self.action = action
-        self.age = age
 
     def interact(self):
         if not self._interacted:
-            interaction = f"{self._name}: {self._dialogue}"
+            interaction = f"{self.name}: {self.dialogue}"
             self._interacted = True
         else:
-            interaction = f"{self._name} is no longer interested in talking."
+            interaction = f"{self.name} is no longer interested in talking."
 
         return interaction
 
     @property
     def name(self):
-        return self._name
+        return self._definition.name
+
+    @property
+    def dialogue(self):
+        return self._definition.dialogue
+
+    @property
+    def action(self):
+        return self._definition.action
+
+    @action.setter
+    def action(self, value):
+        # Copy the shared definition rather than change it for every session
+        self._definition = self._definition._replace(action=value)
+
+    @property
+    def age(self):
+        return self._definition.age
+
+    @age.setter
+    def age(self, value):
+        self._definition = self._definition._replace(age=value)
 
     @abstractmethod
     def perform_action(self):
@@ -64,6 +160,8 @@ class Character(ABC):
 
 # Define an NPC class
 class NPC(Character):
+    __slots__ = ()
+
     def __init__(self, name, dialogue, action, age):
         super().__init__(name, dialogue, action, age)
 
@@ -71,23 +169,12 @@ class NPC(Character):
     def interact(self):
         if not self._interacted:
             self._interacted = True
-            return f'{self._name}: "{self._dialogue}"'
+            return f'{self.name}: "{self.dialogue}"'
         else:
-            return f"{self._name} is no longer interested in talking."
+            return f"{self.name} is no longer interested in talking."
 
     def perform_action(self):
-        return f"{self._name} {self.action}"
-
-    # Define a property to get the name
-    @property
-    def name(self):
-        return self._name
-
-    # Define a property to get the dialogue
-
-    @property
-    def dialogue(self):
-        return self._dialogue
+        return f"{self.name} {self.action}"
 
 
 # Define a suspect character class
@@ -95,21 +182,26 @@ class Suspect(Character):
     """This is a special type of character. This is the suspect in our crime
     investigation."""
 
+    __slots__ = ()
+
     def __init__(self, name, dialogue, alibi, action, age):
-        super().__init__(name, dialogue, action, age)
-        self._alibi = alibi
+        super().__init__(name, dialogue, action, age, alibi=alibi)
 
     def __repr__(self):
-        return f"{self._name}: {self._dialogue}. Their Alibi: {self._alibi}"
+        return f"{self.name}: {self.dialogue}. Their Alibi: {self.alibi}"
+
+    @property
+    def alibi(self):
+        return self._definition.alibi
 
     def provide_alibi(self):
-        return f"{self._name}'s Alibi: {self._alibi}"
+        return f"{self.name}'s Alibi: {self.alibi}"
 
     def interact(self):
         if not self._interacted:
             interaction = (
-                f"§{self._name} reacts nervously:"
-                f"{self._dialogue}"
+                f"§{self.name} reacts nervously:"
+                f"{self.dialogue}"
             )
             interaction += (
                 "\nYou notice subtle body language cues indicating potential "
@@ -118,42 +210,46 @@ class Suspect(Character):
             self._interacted = True
         else:
             interaction = (
-                f"Suspect {self._name} avoids eye contact and "
+                f"Suspect {self.name} avoids eye contact and "
                 "remains silent."
             )
 
         return interaction
 
     def perform_action(self):
-        return f"{self._name} {self.action}"
+        return f"{self.name} {self.action}"
 
     @property
     def interacted(self):
         return self._interacted
 
-    # Define a property to get the name
-    @property
-    def name(self):
-        return self._name
-
 
 # Define a witness character class
 class Witness(Character):
     """This class is the witness. This person has either seen or heard
     something to do with the crime."""
 
+    __slots__ = ()
+
     def __init__(self, name, dialogue, observation, action, age):
-        super().__init__(name, dialogue, action, age)
-        self.observation = observation
+        super().__init__(name, dialogue, action, age, observation=observation)
+
+    @property
+    def observation(self):
+        return self._definition.observation
+
+    @observation.setter
+    def observation(self, value):
+        self._definition = self._definition._replace(observation=value)
 
     def share_observation(self):
-        return f"{self._name}'s Observation: {self.observation}"
+        return f"{self.name}'s Observation: {self.observation}"
 
     def interact(self):
         if not self._interacted:
             interaction = (
-                f"Witness {self._name} speaks hurriedly: "
-                f"{self._dialogue}"
+                f"Witness {self.name} speaks hurriedly: "
+                f"{self.dialogue}"
             )
             interaction += (
                 "\nYou sense genuine anxiety and urgency in the "
@@ -161,18 +257,31 @@ class Witness(Character):
             )
             self._interacted = True
         else:
-            interaction = f"Witness {self._name} hesitates and murmurs softly."
+            interaction = f"Witness {self.name} hesitates and murmurs softly."
 
         return interaction
 
     def perform_action(self):
-        return f"{self._name} {self.action}"
+        return f"{self.name} {self.action}"
 
     @property
     def interacted(self):
         return self._interacted
 
-    # Define a property to get the name
-    @property
-    def name(self):
-        return self._name
+
+_CHARACTER_CLASSES = {"NPC": NPC, "Suspect": Suspect, "Witness": Witness}
+
+
+def character_from_definition(definition):
+    """Build a character from a 'Characters' entry in the story data.
+
+    :param definition: A mapping with the character's type, name, dialogue,
+        action, age and, for suspects and witnesses, alibi or observation.
+    :return: An NPC, Suspect or Witness whose text is shared with every
+        other session.
+    """
+    shared = shared_definition(definition["name"], definition["dialogue"],
+                               definition["action"], definition["age"],
+                               definition.get("alibi"),
+                               definition.get("observation"))
+    return _CHARACTER_CLASSES[definition["type"]].from_definition(shared)
@@ -0,0 +1,366 @@
+# clues.py
+
+"""
+Clues Module
+
+Description:
+This Python module defines the clue store shared by every location in a game
+session. Clue text is interned in a process-wide table and referred to by a
+small integer id, so a clue found in many sessions is stored once. The store
+keeps clues per location and per category in insertion order, ignores
+duplicates, and answers membership and count questions in O(1).
+
+Saved progress refers to clues by their id in 'clue_dictionary.json', an
+append-only list of clue text shared by every player. Each sentence is written
+once there instead of once per player in 'user_data.json'.
+
+Classes:
+1. ClueStore: Holds the clues found in one session, indexed by location and category.
+2. ClueView: A live, read-only view of the clues in one location or category.
+3. ClueDictionary: The persisted clue text <-> id mapping used by saved progress.
+
+Functions:
+1. clue_id(text): Returns the interned id for a piece of clue text.
+2. clue_text(cid): Returns the text for an interned clue id.
+3. get_clue_dictionary(): Returns the shared ClueDictionary.
+
+Usage:
+- Create one ClueStore per game session and pass it to each Location.
+
+Author: Haydens Little Helpers
+"""
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+CLUE_DICTIONARY_FILE = "clue_dictionary.json"
+
+# Global intern table: clue text <-> small integer id
+_clue_ids = {}
+_clue_texts = []
+_intern_lock = threading.Lock()
+
+
+def clue_id(text):
+    """
+    Get the interned id for a piece of clue text, adding it if it is new.
+
+    Parameters:
+    - text (str): The clue text.
+
+    Returns:
+    int: The id shared by every session for this text.
+    """
+    cid = _clue_ids.get(text)
+    if cid is None:
+        with _intern_lock:
+            cid = _clue_ids.get(text)
+            if cid is None:
+                cid = len(_clue_texts)
+                _clue_texts.append(text)
+                _clue_ids[text] = cid
+    return cid
+
+
+def clue_text(cid):
+    """
+    Get the text of an interned clue.
+
+    Parameters:
+    - cid (int): An id returned by 'clue_id'.
+
+    Returns:
+    str: The clue text.
+    """
+    return _clue_texts[cid]
+
+
+class ClueView:
+    """A live, read-only view of the clue ids in one location or category.
+    It iterates clue text in the order it was found, without copying."""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids):
+        self._ids = ids
+
+    def __iter__(self):
+        return (_clue_texts[cid] for cid in self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, text):
+        cid = _clue_ids.get(text)
+        return cid is not None and cid in self._ids
+
+    def __repr__(self):
+        return f"ClueView({list(self)!r})"
+
+
+class ClueStore:
+    """The ClueStore class holds every clue found in one game session."""
+
+    __slots__ = ("_by_location", "_by_category")
+
+    def __init__(self):
+        """
+        Initialize an empty ClueStore.
+
+        Returns:
+        None
+        """
+        # Dicts double as insertion-ordered sets of clue ids
+        self._by_location = {}
+        self._by_category = {}
+
+    def add(self, location, text, category=None):
+        """
+        Record a clue found at a location, ignoring it if it is already there.
+
+        Parameters:
+        - location (str): The id of the location the clue was found at.
+        - text (str): The clue text.
+        - category (str): An optional category such as 'evidence' or 'testimony'.
+
+        Returns:
+        bool: True if the clue was new to this location.
+        """
+        cid = clue_id(text)
+        found = self._by_location.setdefault(location, {})
+        if cid in found:
+            return False
+        found[cid] = category
+        if category is not None:
+            self._by_category.setdefault(category, {})[cid] = None
+        return True
+
+    def contains(self, location, text):
+        """
+        Check whether a clue has been found at a location.
+
+        Parameters:
+        - location (str): The id of the location.
+        - text (str): The clue text.
+
+        Returns:
+        bool: True if the clue has been found there.
+        """
+        cid = _clue_ids.get(text)
+        return cid is not None and cid in self._by_location.get(location, ())
+
+    def count(self, location=None):
+        """
+        Count clues at one location, or across all locations.
+
+        Parameters:
+        - location (str): The id of the location, or None for every location.
+
+        Returns:
+        int: The number of distinct clues.
+        """
+        if location is None:
+            return sum(len(found) for found in self._by_location.values())
+        return len(self._by_location.get(location, ()))
+
+    def location(self, location):
+        """
+        Get a view of the clues found at a location.
+
+        Parameters:
+        - location (str): The id of the location.
+
+        Returns:
+        ClueView: A live view of the location's clues.
+        """
+        return ClueView(self._by_location.setdefault(location, {}))
+
+    def category(self, category):
+        """
+        Get a view of the clues in a category, across all locations.
+
+        Parameters:
+        - category (str): The category name.
+
+        Returns:
+        ClueView: A live view of the category's clues.
+        """
+        return ClueView(self._by_category.setdefault(category, {}))
+
+    def clear(self):
+        """
+        Forget every clue, e.g. when a game session is reset. Views handed
+        out earlier stay live and become empty.
+
+        Returns:
+        None
+        """
+        for found in self._by_location.values():
+            found.clear()
+        for found in self._by_category.values():
+            found.clear()
+
+
+class ClueDictionary:
+    """The ClueDictionary class maps clue text to the small integer ids stored
+    in saved progress. Ids are only ever appended, so saved ids stay valid.
+    New ids are added under an advisory lock on '<filename>.lock', so games
+    running in several processes can share the file.
+
+    These ids belong to the file and can differ from the in-memory ids
+    returned by 'clue_id', which are local to this process."""
+
+    def __init__(self, filename=CLUE_DICTIONARY_FILE):
+        """
+        Initialize a ClueDictionary backed by a file. The file is read on first use.
+
+        Parameters:
+        - filename (str): The JSON file holding the list of clue text.
+
+        Returns:
+        None
+        """
+        self.filename = filename
+        self._texts = []
+        self._ids = {}
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _file_lock(self):
+        """Hold an advisory lock on '<filename>.lock', so games in other
+        processes take turns to add clues to the file."""
+        with open(self.filename + ".lock", "a+b") as lock_file:
+            if os.name == "nt":
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self, force=False):
+        """Reload the file if another game has added clues to it since we read it.
+
+        Parameters:
+        - force (bool): Reload even if the modification time is unchanged, e.g.
+          while holding the file lock, where a coarse mtime could hide a write.
+        """
+        import json
+
+        try:
+            mtime = os.stat(self.filename).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._mtime and not force:
+            return
+        with open(self.filename, "r", encoding="utf-8") as file:
+            texts = json.load(file)
+        # Interning here means every profile shares one copy of each sentence
+        self._texts = [clue_text(clue_id(text)) for text in texts]
+        self._ids = {text: index for index, text in enumerate(self._texts)}
+        self._mtime = mtime
+
+    def _save(self):
+        import json
+
+        # A temporary file of our own, so concurrent saves can't interleave
+        directory, name = os.path.split(os.path.abspath(self.filename))
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory,
+                                         prefix=name + ".", suffix=".tmp",
+                                         delete=False) as file:
+            json.dump(self._texts, file, indent=0, ensure_ascii=False)
+        try:
+            os.replace(file.name, self.filename)
+        except OSError:
+            os.remove(file.name)
+            raise
+        self._mtime = os.stat(self.filename).st_mtime_ns
+
+    def encode(self, texts):
+        """
+        Get the persisted ids for some clue text, adding new text to the file.
+
+        Parameters:
+        - texts (iterable): Clue text to encode.
+
+        Returns:
+        list: The id of each clue, in the same order.
+        """
+        texts = list(texts)
+        with self._lock:
+            self._refresh()
+            if all(text in self._ids for text in texts):
+                return [self._ids[text] for text in texts]
+            # Reading, appending and saving happen under the file lock, so a
+            # game in another process can't save over the ids added here
+            with self._file_lock():
+                self._refresh(force=True)
+                ids = []
+                added = False
+                for text in texts:
+                    index = self._ids.get(text)
+                    if index is None:
+                        index = len(self._texts)
+                        self._texts.append(clue_text(clue_id(text)))
+                        self._ids[text] = index
+                        added = True
+                    ids.append(index)
+                if added:
+                    self._save()
+                return ids
+
+    def decode(self, ids):
+        """
+        Get the clue text for persisted ids.
+
+        Parameters:
+        - ids (iterable): Ids returned by 'encode'.
+
+        Returns:
+        list: The interned clue text for each id.
+
+        Raises:
+        ValueError: If an id is negative or not in the dictionary.
+        """
+        ids = list(ids)
+        if any(index < 0 for index in ids):
+            raise ValueError(f"Saved progress has a negative clue id: {min(ids)}")
+        texts = self._texts
+        try:
+            return [texts[index] for index in ids]
+        except IndexError:
+            pass
+
+        # Another game may have added clues since the file was last read
+        with self._lock:
+            self._refresh()
+            try:
+                return [self._texts[index] for index in ids]
+            except IndexError:
+                raise ValueError(f"{self.filename} is missing clues used by "
+                                 "saved progress") from None
+
+
+_clue_dictionary = ClueDictionary()
+
+
+def get_clue_dictionary():
+    """
+    Get the clue dictionary shared by every session in this process.
+
+    Returns:
+    ClueDictionary: The dictionary backed by 'clue_dictionary.json'.
+    """
+    return _clue_dictionary
@@ -0,0 +1,292 @@
+# content.py
+
+"""
+Content Module
+
+Description:
+This Python module provides a process-wide cache for the game's static content
+('game_data.json' for the mini-games and 'story_data.json' for the narrative,
+characters and items). When a fresh compiled content pack exists (see
+content_pack.py) it is memory-mapped and read directly. Otherwise each file is
+parsed once, validated, frozen into immutable structures and shared by every
+game session, and only reloaded when the file's modification time changes.
+
+Classes:
+1. ContentCache: Loads, validates and freezes a content file, reloading it when it changes on disk.
+
+Functions:
+1. get_game_data(): Returns the mini-game data.
+2. get_story_data(): Returns the story text, character and item definitions.
+3. content_version(): Returns a token that changes whenever the content is reloaded.
+
+Usage:
+- Import this module and call 'get_game_data()' or 'get_story_data()' instead of opening the JSON files directly.
+
+Author: Haydens Little Helpers
+"""
+
+import os
+import threading
+from types import MappingProxyType
+from content_pack import ContentPack, PACK_FILE
+
+GAME_DATA_FILE = "game_data.json"
+STORY_DATA_FILE = "story_data.json"
+CHARACTER_TYPES = {
+    "NPC": (),
+    "Suspect": ("alibi",),
+    "Witness": ("observation",),
+}
+
+
+def freeze(value):
+    """
+    Recursively convert parsed JSON into immutable structures.
+
+    Parameters:
+    - value: A value produced by 'json.load'.
+
+    Returns:
+    The same data with dicts as read-only mappings and lists as tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def validate_game_data(data):
+    """
+    Check that the game data has the structure the mini-games expect.
+
+    Parameters:
+    - data (dict): The parsed content of 'game_data.json'.
+
+    Returns:
+    None
+
+    Raises:
+    ValueError: If a required section is missing or malformed.
+    """
+    riddles = data.get("Riddles")
+    if not isinstance(riddles, dict) or not riddles:
+        raise ValueError("game data needs a non-empty 'Riddles' mapping")
+    for riddle, answer in riddles.items():
+        if not isinstance(riddle, str) or not isinstance(answer, str):
+            raise ValueError(f"Riddle entries must be strings: {riddle!r}")
+
+    aliases = data.get("Riddle_aliases", {})
+    if not isinstance(aliases, dict):
+        raise ValueError("'Riddle_aliases' must map answers to lists of aliases")
+    answers = set(riddles.values())
+    for answer, answer_aliases in aliases.items():
+        if answer not in answers:
+            raise ValueError(f"Riddle alias for unknown answer: {answer!r}")
+        if (not isinstance(answer_aliases, list)
+                or not all(isinstance(alias, str) for alias in answer_aliases)):
+            raise ValueError(f"Aliases for {answer!r} must be a list of strings")
+
+    secret_words = data.get("Secret_words")
+    if not isinstance(secret_words, list) or not secret_words:
+        raise ValueError("game data needs a non-empty 'Secret_words' list")
+    # The word pack only stores plain a-z words up to its length limit
+    from word_pack import _MAX_LENGTH
+    for word in secret_words:
+        if not isinstance(word, str) or not (word.isascii() and word.isalpha()):
+            raise ValueError(f"Secret words must be plain ASCII letters a-z: {word!r}")
+        if len(word) > _MAX_LENGTH:
+            raise ValueError(f"Secret words must be at most {_MAX_LENGTH} letters long: "
+                             f"{word[:20]!r}...")
+
+
+def validate_story_data(data):
+    """
+    Check that the story data defines every character, item and text the game uses.
+
+    Parameters:
+    - data (dict): The parsed content of 'story_data.json'.
+
+    Returns:
+    None
+
+    Raises:
+    ValueError: If a definition is missing a field or refers to an unknown character.
+    """
+    characters = data.get("Characters")
+    if not isinstance(characters, dict):
+        raise ValueError("story data needs a 'Characters' mapping")
+    for key, definition in characters.items():
+        extra_fields = CHARACTER_TYPES.get(definition.get("type"))
+        if extra_fields is None:
+            raise ValueError(f"Character {key!r} has an unknown type")
+        for field in ("name", "dialogue", "action") + extra_fields:
+            if not isinstance(definition.get(field), str):
+                raise ValueError(f"Character {key!r} needs a text '{field}'")
+        if not isinstance(definition.get("age"), int):
+            raise ValueError(f"Character {key!r} needs a whole number 'age'")
+
+    for key in data.get("Crime_scene_npcs", []):
+        if key not in characters:
+            raise ValueError(f"Crime scene NPC {key!r} is not a defined character")
+
+    items = data.get("Items")
+    if not isinstance(items, dict):
+        raise ValueError("story data needs an 'Items' mapping")
+    for key, definition in items.items():
+        for field in ("name", "description", "impact"):
+            if not isinstance(definition.get(field), str):
+                raise ValueError(f"Item {key!r} needs a text '{field}'")
+        if not isinstance(definition.get("score_increase"), int):
+            raise ValueError(f"Item {key!r} needs a whole number 'score_increase'")
+
+    story = data.get("Story")
+    if not isinstance(story, dict) or not all(
+            isinstance(text, str) for text in story.values()):
+        raise ValueError("story data needs a 'Story' mapping of text")
+
+
+class ContentCache:
+    """The ContentCache class keeps one frozen copy of a content file per
+    process and reloads it only when the file changes on disk."""
+
+    def __init__(self, filename, validator=None):
+        """
+        Initialize a ContentCache instance.
+
+        Parameters:
+        - filename (str): The content file to load.
+        - validator (callable): Optional function that raises ValueError for invalid data.
+
+        Returns:
+        None
+        """
+        self.filename = filename
+        self._validator = validator
+        self._data = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Get the frozen content, reloading the file if its mtime has changed.
+
+        Returns:
+        MappingProxyType: The frozen content.
+        """
+        mtime = os.stat(self.filename).st_mtime_ns
+        if self._data is None or mtime != self._mtime:
+            with self._lock:
+                if self._data is None or mtime != self._mtime:
+                    self._data = self._load()
+                    self._mtime = mtime
+        return self._data
+
+    @property
+    def mtime(self):
+        """
+        Get the modification time of the currently cached content.
+
+        Returns:
+        int: The file's mtime in nanoseconds, or None if nothing is cached.
+        """
+        return self._mtime
+
+    def invalidate(self):
+        """Forget the cached content so the next 'get' reloads the file."""
+        with self._lock:
+            self._data = None
+            self._mtime = None
+
+    def _load(self):
+        import json  # only needed when no content pack is available
+
+        with open(self.filename, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if self._validator is not None:
+            self._validator(data)
+        return freeze(data)
+
+
+# Root key in the content pack -> (source file, validator)
+CONTENT_SOURCES = {
+    "game_data": (GAME_DATA_FILE, validate_game_data),
+    "story_data": (STORY_DATA_FILE, validate_story_data),
+}
+
+_caches = {key: ContentCache(filename, validator)
+           for key, (filename, validator) in CONTENT_SOURCES.items()}
+_pack = None
+_pack_mtime = None
+_pack_lock = threading.Lock()
+
+
+def _fresh_pack():
+    """Map the content pack if it exists and is newer than every source file."""
+    global _pack, _pack_mtime
+    try:
+        mtime = os.stat(PACK_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    with _pack_lock:
+        if mtime != _pack_mtime:
+            # Sessions and caches copy what they need from the content rather
+            # than keep views of it (see Game.story_data and RiddleIndex), so
+            # the replaced pack can be released straight away
+            if _pack is not None:
+                _pack.close()
+            try:
+                _pack = ContentPack(PACK_FILE)
+            except ValueError:
+                _pack = None
+            _pack_mtime = mtime
+        pack = _pack
+
+    sources = [filename for filename, _ in CONTENT_SOURCES.values()]
+    if pack is None or pack.is_stale(sources):
+        return None
+    return pack
+
+
+def _get(key):
+    pack = _fresh_pack()
+    if pack is not None:
+        return pack.root[key]
+    return _caches[key].get()
+
+
+def get_game_data():
+    """
+    Get the shared, read-only content of 'game_data.json'.
+
+    Returns:
+    Mapping: The game data shared by every session in this process.
+    """
+    return _get("game_data")
+
+
+def get_story_data():
+    """
+    Get the shared, read-only content of 'story_data.json'.
+
+    Returns:
+    Mapping: The story text, character and item definitions.
+    """
+    return _get("story_data")
+
+
+def content_version():
+    """
+    Get a token identifying the content currently in use. Caches built from
+    the content can keep this token and rebuild when it changes.
+
+    Returns:
+    tuple: A hashable token that changes when the pack or a source file changes.
+    """
+    pack = _fresh_pack()
+    if pack is not None:
+        return ("pack", pack.source_mtime)
+    for cache in _caches.values():
+        cache.get()
+    return ("json",) + tuple(cache.mtime for cache in _caches.values())
@@ -0,0 +1,309 @@
+# content_pack.py
+
+"""
+Content Pack Module
+
+Description:
+This Python module compiles the game's JSON content files into a single binary
+content pack and reads it back through a memory map. The pack holds a string
+table, an offset index into it and a flat node table describing the content
+tree, so a session can look values up without parsing any JSON.
+
+Layout (all integers little-endian):
+- Header: magic, version, node/edge/string counts, section offsets and the
+  newest source modification time (used to detect a stale pack).
+- String table: every string in the content, UTF-8 encoded and deduplicated.
+- String index: (offset, length) pairs into the string table.
+- Node table: (kind, value, count) records. Strings point into the string index,
+  lists and dicts point at a run of edges.
+- Edge table: (key string id, node id) pairs. Dict edges are sorted by key so
+  lookups are a binary search over the mapped file.
+
+Classes:
+1. ContentPack: A read-only, memory-mapped view of a compiled content pack.
+
+Functions:
+1. build_pack(sources, output): Validates and compiles JSON content files into a pack.
+
+Usage:
+- Build the pack once after editing the content files:
+    python content_pack.py
+- Read it through content.py, which falls back to the JSON files if no fresh pack exists.
+
+Author: Haydens Little Helpers
+"""
+
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+
+PACK_FILE = "content.pack"
+MAGIC = b"PMCP"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHxxIIIIIIIq")
+_STRING_ENTRY = struct.Struct("<II")
+_NODE = struct.Struct("<BxxxqI")
+_EDGE = struct.Struct("<II")
+
+KIND_NULL = 0
+KIND_BOOL = 1
+KIND_INT = 2
+KIND_STR = 3
+KIND_LIST = 4
+KIND_DICT = 5
+
+
+class _PackWriter:
+    """Flattens a JSON tree into the string, node and edge tables."""
+
+    def __init__(self):
+        self.strings = []
+        self.string_ids = {}
+        self.nodes = []
+        self.edges = []
+
+    def string_id(self, text):
+        sid = self.string_ids.get(text)
+        if sid is None:
+            sid = len(self.strings)
+            self.strings.append(text.encode("utf-8"))
+            self.string_ids[text] = sid
+        return sid
+
+    def add(self, value):
+        node_id = len(self.nodes)
+        self.nodes.append(None)
+        if value is None:
+            record = (KIND_NULL, 0, 0)
+        elif isinstance(value, bool):
+            record = (KIND_BOOL, int(value), 0)
+        elif isinstance(value, int):
+            record = (KIND_INT, value, 0)
+        elif isinstance(value, str):
+            record = (KIND_STR, self.string_id(value), 0)
+        elif isinstance(value, list):
+            children = [self.add(item) for item in value]
+            record = (KIND_LIST, len(self.edges), len(children))
+            self.edges.extend((0, child) for child in children)
+        elif isinstance(value, dict):
+            pairs = sorted(value.items())
+            children = [(self.string_id(key), self.add(item)) for key, item in pairs]
+            record = (KIND_DICT, len(self.edges), len(children))
+            self.edges.extend(children)
+        else:
+            raise ValueError(f"Content packs cannot store {type(value).__name__} values")
+        self.nodes[node_id] = record
+        return node_id
+
+    def to_bytes(self, source_mtime):
+        string_index = bytearray()
+        string_table = bytearray()
+        for encoded in self.strings:
+            string_index += _STRING_ENTRY.pack(len(string_table), len(encoded))
+            string_table += encoded
+
+        strings_offset = _HEADER.size
+        index_offset = strings_offset + len(string_table)
+        nodes_offset = index_offset + len(string_index)
+        edges_offset = nodes_offset + _NODE.size * len(self.nodes)
+
+        header = _HEADER.pack(MAGIC, VERSION, len(self.nodes), len(self.edges),
+                              len(self.strings), strings_offset, index_offset,
+                              nodes_offset, edges_offset, source_mtime)
+        body = b"".join(_NODE.pack(*node) for node in self.nodes)
+        body += b"".join(_EDGE.pack(*edge) for edge in self.edges)
+        return header + bytes(string_table) + bytes(string_index) + body
+
+
+def build_pack(sources, output=PACK_FILE):
+    """
+    Validate JSON content files and compile them into one content pack.
+
+    Parameters:
+    - sources (dict): Maps a root key to a (filename, validator) pair. The
+      validator may be None.
+    - output (str): The filename to write the pack to.
+
+    Returns:
+    int: The size of the written pack in bytes.
+    """
+    import json  # the game itself never parses JSON when a pack exists
+
+    tree = {}
+    newest = 0
+    for key, (filename, validator) in sources.items():
+        with open(filename, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if validator is not None:
+            validator(data)
+        tree[key] = data
+        newest = max(newest, os.stat(filename).st_mtime_ns)
+
+    writer = _PackWriter()
+    writer.add(tree)
+    packed = writer.to_bytes(newest)
+
+    # Write to a temporary file first so a running game never maps half a pack
+    temporary = output + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(packed)
+    os.replace(temporary, output)
+    return len(packed)
+
+
+class ContentPack:
+    """The ContentPack class maps a compiled pack into memory and exposes its
+    root as a read-only mapping. Values are decoded from the map on access."""
+
+    def __init__(self, filename=PACK_FILE):
+        """
+        Open and map a content pack.
+
+        Parameters:
+        - filename (str): The pack file to map.
+
+        Returns:
+        None
+
+        Raises:
+        ValueError: If the file is not a content pack of a supported version.
+        """
+        self.filename = filename
+        with open(filename, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self._node_count, self._edge_count, self._string_count,
+         self._strings_offset, self._index_offset, self._nodes_offset,
+         self._edges_offset, self.source_mtime) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{filename} is not a version {VERSION} content pack")
+
+    def close(self):
+        """Release the memory map."""
+        self._map.close()
+
+    @property
+    def root(self):
+        """
+        Get the top level of the pack.
+
+        Returns:
+        PackDict: The root mapping, keyed by source name.
+        """
+        return self.value(0)
+
+    def is_stale(self, filenames):
+        """
+        Check whether any of the source files changed after the pack was built.
+
+        Parameters:
+        - filenames (iterable): The source files the pack was built from.
+
+        Returns:
+        bool: True if the pack should be rebuilt.
+        """
+        try:
+            return any(os.stat(name).st_mtime_ns > self.source_mtime
+                       for name in filenames)
+        except FileNotFoundError:
+            return True
+
+    def string(self, sid):
+        offset, length = _STRING_ENTRY.unpack_from(
+            self._map, self._index_offset + sid * _STRING_ENTRY.size)
+        start = self._strings_offset + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def edge(self, index):
+        return _EDGE.unpack_from(self._map, self._edges_offset + index * _EDGE.size)
+
+    def value(self, node_id):
+        kind, value, count = _NODE.unpack_from(
+            self._map, self._nodes_offset + node_id * _NODE.size)
+        if kind == KIND_STR:
+            return self.string(value)
+        if kind == KIND_INT:
+            return value
+        if kind == KIND_BOOL:
+            return bool(value)
+        if kind == KIND_DICT:
+            return PackDict(self, value, count)
+        if kind == KIND_LIST:
+            return PackList(self, value, count)
+        return None
+
+
+class PackDict(Mapping):
+    """A read-only mapping backed by a run of sorted edges in a content pack."""
+
+    __slots__ = ("_pack", "_first", "_count")
+
+    def __init__(self, pack, first, count):
+        self._pack = pack
+        self._first = first
+        self._count = count
+
+    def _key(self, index):
+        return self._pack.string(self._pack.edge(self._first + index)[0])
+
+    def __getitem__(self, key):
+        keys = _EdgeKeys(self)
+        index = bisect_left(keys, key)
+        if index < self._count and keys[index] == key:
+            return self._pack.value(self._pack.edge(self._first + index)[1])
+        raise KeyError(key)
+
+    def __iter__(self):
+        return (self._key(index) for index in range(self._count))
+
+    def __len__(self):
+        return self._count
+
+
+class _EdgeKeys(Sequence):
+    """Lets bisect search a PackDict's keys without decoding all of them."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def __getitem__(self, index):
+        return self._owner._key(index)
+
+    def __len__(self):
+        return self._owner._count
+
+
+class PackList(Sequence):
+    """A read-only sequence backed by a run of edges in a content pack."""
+
+    __slots__ = ("_pack", "_first", "_count")
+
+    def __init__(self, pack, first, count):
+        self._pack = pack
+        self._first = first
+        self._count = count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._count)))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("content pack list index out of range")
+        return self._pack.value(self._pack.edge(self._first + index)[1])
+
+    def __len__(self):
+        return self._count
+
+
+if __name__ == "__main__":
+    from content import CONTENT_SOURCES
+
+    size = build_pack(CONTENT_SOURCES)
+    print(f"Wrote {PACK_FILE} ({size} bytes)")
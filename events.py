@@ -0,0 +1,273 @@
+# events.py
+
+"""
+Events Module
+
+Description:
+This Python module defines the game's events and the in-process bus that
+delivers them. Game logic publishes what happened (a clue was found, a
+character was talked to, a mini-game was won, a command was typed, the case
+was closed) and every consumer subscribes to the events it cares about. The
+session log, the running score and the achievements are subscribers, and a new
+consumer such as metrics or an autosave is added by subscribing it instead
+of editing every branch of Game.
+
+Events are routed by type through a table built on first use, so publishing
+costs one dict lookup plus the subscribers of that event type. A subscriber
+can take its events one at a time, in batches of a given size, or in batches
+delivered on a background thread. Batches are delivered in publishing order.
+Call 'flush' to deliver the rest of every batch, e.g. before saving.
+
+Classes:
+1. ClueFound: A clue was added to a location for the first time.
+2. CharacterInteracted: The player talked to a character.
+3. MiniGameWon: The player won the mini-game behind a door.
+4. CommandIssued: The player typed a command at a menu.
+5. CaseClosed: The player named a culprit.
+6. Subscription: A subscriber and how it takes its events.
+7. EventBus: Delivers published events to their subscribers.
+
+Usage:
+    bus = EventBus()
+    bus.subscribe(logger.log_events)
+    bus.subscribe(metrics.record, (ClueFound,), batch_size=64, asynchronous=True)
+    bus.publish(ClueFound("Kitchen", "camera system has been shut off", "evidence"))
+    bus.flush()
+
+Author: Haydens Little Helpers
+"""
+
+import queue
+import threading
+from collections import namedtuple
+
+
+class ClueFound(namedtuple("ClueFound", ["location", "clue", "category"])):
+    """A clue was added to a location for the first time."""
+
+    __slots__ = ()
+
+    @property
+    def message(self):
+        return f"Clue found in {self.location}: {self.clue}"
+
+
+class CharacterInteracted(namedtuple("CharacterInteracted",
+                                     ["character", "role", "location"])):
+    """The player talked to a character. The role is 'suspect', 'witness' or
+    'npc', and the location is the id of the location they were in."""
+
+    __slots__ = ()
+
+    @property
+    def message(self):
+        return f"{self.character} interacted with Player"
+
+
+class MiniGameWon(namedtuple("MiniGameWon", ["title", "door", "clue"])):
+    """The player won the mini-game behind a door."""
+
+    __slots__ = ()
+
+    @property
+    def message(self):
+        return f"Player won {self.title} behind door {self.door}"
+
+
+class CommandIssued(namedtuple("CommandIssued", ["command", "menu"])):
+    """The player typed a command at a menu."""
+
+    __slots__ = ()
+
+    @property
+    def message(self):
+        return f"Player input is {self.command}."
+
+
+class CaseClosed(namedtuple("CaseClosed", ["accused", "solved", "interrogated"])):
+    """The player named a culprit, ending the game. 'solved' is True if they
+    found the thief, and 'interrogated' if they questioned a suspect first."""
+
+    __slots__ = ()
+
+    @property
+    def message(self):
+        return f"Player accused {self.accused}"
+
+
+class Subscription:
+    """The Subscription class holds a subscriber's handler, the events it
+    wants and the batch it is collecting."""
+
+    __slots__ = ("handler", "event_types", "batch_size", "asynchronous", "pending")
+
+    def __init__(self, handler, event_types, batch_size, asynchronous):
+        self.handler = handler
+        self.event_types = event_types
+        self.batch_size = batch_size
+        self.asynchronous = asynchronous
+        self.pending = []
+
+
+class EventBus:
+    """The EventBus class delivers published events to the subscribers of
+    their type."""
+
+    __slots__ = ("_subscriptions", "_routes", "_queue", "_worker", "_errors")
+
+    def __init__(self):
+        """
+        Initialize a bus with no subscribers.
+
+        Returns:
+        None
+        """
+        self._subscriptions = []
+        self._routes = {}  # event type -> the subscriptions it is delivered to
+        self._queue = None
+        self._worker = None
+        self._errors = []
+
+    def subscribe(self, handler, event_types=None, batch_size=1, asynchronous=False):
+        """
+        Subscribe a handler to events.
+
+        Parameters:
+        - handler (callable): handler(events) is called with a list of events, in publishing order.
+        - event_types (iterable): The event classes to receive. Default is every event.
+        - batch_size (int): How many events to collect before delivering them.
+        - asynchronous (bool): Deliver batches on the bus's background thread.
+
+        Returns:
+        Subscription: The new subscription.
+        """
+        subscription = Subscription(handler, tuple(event_types) if event_types else None,
+                                    batch_size, asynchronous)
+        self._subscriptions.append(subscription)
+        self._routes.clear()
+        return subscription
+
+    def unsubscribe(self, handler):
+        """
+        Remove every subscription of a handler, delivering what it has collected first.
+
+        Parameters:
+        - handler (callable): The handler that was subscribed.
+
+        Returns:
+        None
+        """
+        for subscription in self._subscriptions:
+            if subscription.handler == handler and subscription.pending:
+                self._deliver(subscription)
+        self._subscriptions = [subscription for subscription in self._subscriptions
+                               if subscription.handler != handler]
+        self._routes.clear()
+
+    def _route(self, event_type):
+        routes = tuple(subscription for subscription in self._subscriptions
+                       if subscription.event_types is None
+                       or issubclass(event_type, subscription.event_types))
+        self._routes[event_type] = routes
+        return routes
+
+    def publish(self, event):
+        """
+        Publish an event to its subscribers.
+
+        Parameters:
+        - event: An event, such as a ClueFound.
+
+        Returns:
+        None
+        """
+        routes = self._routes.get(type(event))
+        if routes is None:
+            routes = self._route(type(event))
+        for subscription in routes:
+            if subscription.batch_size == 1 and not subscription.asynchronous:
+                subscription.handler([event])
+                continue
+            subscription.pending.append(event)
+            if len(subscription.pending) >= subscription.batch_size:
+                self._deliver(subscription)
+
+    def _deliver(self, subscription):
+        batch = subscription.pending
+        subscription.pending = []
+        if subscription.asynchronous:
+            self._background().put((subscription.handler, batch))
+        else:
+            subscription.handler(batch)
+
+    def _background(self):
+        """Start the background delivery thread on first use."""
+        if self._worker is None:
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(target=self._run_background,
+                                            args=(self._queue, self._errors),
+                                            daemon=True)
+            self._worker.start()
+        return self._queue
+
+    @staticmethod
+    def _run_background(deliveries, errors):
+        while True:
+            handler, batch = deliveries.get()
+            try:
+                if handler is None:
+                    return
+                handler(batch)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                deliveries.task_done()
+
+    def flush(self):
+        """
+        Deliver every collected event and wait for background deliveries.
+
+        Returns:
+        None
+
+        Raises:
+        Exception: The first error raised by a background handler since the last flush.
+        """
+        for subscription in self._subscriptions:
+            if subscription.pending:
+                self._deliver(subscription)
+        if self._queue is not None:
+            self._queue.join()
+        if self._errors:
+            error = self._errors[0]
+            self._errors.clear()
+            raise error
+
+    def discard(self):
+        """
+        Drop every collected event without delivering it, keeping the
+        subscriptions, e.g. when a game session is reset.
+
+        Returns:
+        None
+        """
+        for subscription in self._subscriptions:
+            subscription.pending.clear()
+        if self._queue is not None:
+            self._queue.join()
+        self._errors.clear()
+
+    def close(self):
+        """
+        Flush the bus and stop its background thread.
+
+        Returns:
+        None
+        """
+        try:
+            self.flush()
+        finally:
+            if self._worker is not None:
+                self._queue.put((None, None))
+                self._worker.join()
+                self._worker = self._queue = None
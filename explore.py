@@ -0,0 +1,401 @@
+# explore.py
+
+"""
+State Space Explorer Module
+
+Description:
+This Python module enumerates every state a game of 'Game' can reach, to
+check properties no single playthrough can: the highest final score, whether
+every clue can be found, and whether any state can no longer reach the end of
+the game (a dead end) or the culprit (an unwinnable state).
+
+A state is the prompt the game is waiting on together with a canonical
+encoding of everything that decides what happens next: the started and
+interacted flags on Game, every location's visited flag and clues, every
+character's '_interacted' flag, 'doors_checker' and the inventory (see
+game_state.py). The encoding is hashed to an 8-byte blake2b digest, and a
+transposition table of digests makes sure each state is expanded once however
+many paths lead to it. The running score is not part of the state. Where an
+action changes the score without changing the state, the score can be raised
+without limit, and the explorer reports the action.
+
+The explorer searches breadth first and expands each level of the search
+across a ProcessPoolExecutor. A game's call stack can't be copied, so a worker
+reaches a state by replaying its path of answers into a fresh game (see
+simulate.py), then tries every valid answer at its prompt. The mini-games are
+settled by the explorer as a win or a loss instead of being played, since
+their own states (every word guess, riddle answer or move) would swamp the
+game's.
+
+The transposition table is exact by default. Given a memory limit, it is a
+Bloom filter of that many bytes instead. A false positive can then skip an
+unseen state, and the dead-end checks are not run, since they need the full
+graph of states.
+
+Classes:
+1. ExplorerGame: A HeadlessGame whose mini-games are decided by the explorer.
+2. StateGraph: The states found and the answers between them.
+3. TranspositionTable: The exact table of visited state digests.
+4. BloomFilter: The memory-bounded set of visited state digests.
+
+Functions:
+1. explore(workers, memory_limit, max_states, keep_graph): Searches the state space and checks its properties.
+
+Usage:
+    python explore.py [workers=4] [memory=16777216] [states=100000]
+
+Author: Haydens Little Helpers
+"""
+
+import os
+import sys
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from game_state import state_digest, state_key
+from simulate import SOLVED_MESSAGES, HeadlessGame, _install_headless_io, \
+    decision_for, headless_io, run_headless
+
+OUTCOME_PROMPT = "Does the detective win"
+OUTCOMES = ("win", "lose")
+
+Node = namedtuple("Node", ["digest", "decision", "options", "score",
+                           "final_score", "solved", "clues"])
+Node.__doc__ = """A state reached by replaying a path of answers.
+
+- digest (int): The state's 8-byte digest.
+- decision (str): The decision its prompt asks for, None once the game is over.
+- options (tuple): The valid answers to its prompt.
+- score (int): Game.score when the state was reached.
+- final_score (int): The score end_game saved, None while the game is running.
+- solved (bool): Whether the culprit was found.
+- clues (frozenset): (location id, clue) pairs found so far."""
+
+
+StateGraph = namedtuple("StateGraph", ["digests", "decisions", "options",
+                                       "clue_counts", "edges", "terminal", "solved"])
+StateGraph.__doc__ = """Every state the explorer found, by state number.
+
+- digests (array): The state's digest.
+- decisions (list): The decision its prompt asks for, None once the game is over.
+- options (list): The answers to its prompt.
+- clue_counts (array): How many clues have been found in it.
+- edges (list): Arrays of the states each of its answers leads to, in the order of 'options'.
+- terminal (bytearray): 1 if the game is over.
+- solved (bytearray): 1 if the game is over and the culprit was found."""
+
+
+class ExplorerGame(HeadlessGame):
+    """A HeadlessGame whose mini-games are won or lost by the explorer's
+    answer to an extra prompt, instead of being played."""
+
+    __slots__ = ()
+
+    def attempt_mini_game(self, mini_game):
+        instance = mini_game.factory(self)
+        won = input(f"{OUTCOME_PROMPT} {mini_game.title}? (win/lose): ") == "win"
+        return won, mini_game.score(instance, won)
+
+
+class _Paused(BaseException):
+    """Raised from 'input' once a replayed path runs out, carrying the prompt."""
+
+
+class _Replay:
+    """Answers a game's prompts from a recorded path of answers."""
+
+    __slots__ = ("path", "steps", "solved")
+
+    def __init__(self, path):
+        self.path = path
+        self.steps = 0
+        self.solved = False
+
+    def answer(self, prompt, game):
+        if self.steps == len(self.path):
+            raise _Paused(prompt)
+        self.steps += 1
+        return self.path[self.steps - 1]
+
+    def observe(self, text):
+        if any(message in text for message in SOLVED_MESSAGES):
+            self.solved = True
+
+
+def _options(prompt, game):
+    """List the answers the explorer tries at a prompt."""
+    if prompt.startswith(OUTCOME_PROMPT):
+        return "outcome", OUTCOMES
+    decision, options = decision_for(prompt, game)
+    if decision == "items":
+        # Using items one at a time reaches every combination of them
+        options = ("",) + tuple(sorted({item.name for item in game.inventory.items}))
+    elif options is None:
+        raise ValueError(f"The explorer can't enumerate answers to {decision!r}")
+    return decision, options
+
+
+def _replay(path):
+    """Play a fresh game along a path of answers and return the state it ends in."""
+    agent = _Replay(path)
+    game = ExplorerGame(agent, seed=0)
+    prompt = decision = final_score = None
+    options = ()
+    try:
+        run_headless(game)
+        final_score = game.final_score
+    except _Paused as paused:
+        prompt = paused.args[0]
+        decision, options = _options(prompt, game)
+    clues = frozenset((location.key, clue) for location in game.locations
+                      for clue in location.review_clue())
+    key = state_key(game, prompt, agent.solved)
+    return Node(state_digest(key), decision, options, game.score, final_score,
+                agent.solved, clues)
+
+
+def _expand(frontier):
+    """Replay every answer from each (path, options) pair, in a worker."""
+    return [[_replay(path + (option,)) for option in options]
+            for path, options in frontier]
+
+
+class TranspositionTable:
+    """The TranspositionTable class maps the digest of every visited state to
+    its number in the search."""
+
+    __slots__ = ("_indices",)
+
+    def __init__(self):
+        self._indices = {}
+
+    def __len__(self):
+        return len(self._indices)
+
+    def insert(self, digest, index):
+        """
+        Add a state unless it was seen before.
+
+        Parameters:
+        - digest (int): The state's digest.
+        - index (int): The number to give the state if it is new.
+
+        Returns:
+        int: 'index' if the state is new, otherwise the number it was given before.
+        """
+        return self._indices.setdefault(digest, index)
+
+
+class BloomFilter:
+    """The BloomFilter class remembers visited state digests in a fixed
+    number of bits, at the cost of occasionally mistaking a new state for
+    a visited one."""
+
+    __slots__ = ("_bits", "_size", "hashes", "count")
+
+    def __init__(self, size_bytes, hashes=4):
+        """
+        Initialize an empty filter.
+
+        Parameters:
+        - size_bytes (int): The memory the filter may use.
+        - hashes (int): The bits set per state. 4 keeps false positives under
+          1% while the filter holds up to one state per byte.
+
+        Returns:
+        None
+        """
+        self._bits = bytearray(size_bytes)
+        self._size = size_bytes * 8
+        self.hashes = hashes
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _positions(self, digest):
+        # Double hashing: the two halves of the digest give every probe
+        first, step = digest & 0xFFFFFFFF, (digest >> 32) | 1
+        return [(first + probe * step) % self._size for probe in range(self.hashes)]
+
+    def __contains__(self, digest):
+        return all(self._bits[bit >> 3] & (1 << (bit & 7))
+                   for bit in self._positions(digest))
+
+    def insert(self, digest, index):
+        """
+        Add a state unless it was (probably) seen before.
+
+        Parameters:
+        - digest (int): The state's digest.
+        - index (int): The number to give the state if it is new.
+
+        Returns:
+        int: 'index' if the state is new, otherwise None.
+        """
+        new = False
+        for bit in self._positions(digest):
+            if not self._bits[bit >> 3] & (1 << (bit & 7)):
+                self._bits[bit >> 3] |= 1 << (bit & 7)
+                new = True
+        if new:
+            self.count += 1
+            return index
+        return None
+
+
+def _reaches(targets, edges):
+    """Mark every state with a path to one of 'targets', walking edges backwards."""
+    parents = [[] for _ in edges]
+    for state, children in enumerate(edges):
+        for child in children:
+            parents[child].append(state)
+    reached = bytearray(len(edges))
+    stack = list(targets)
+    for state in stack:
+        reached[state] = 1
+    while stack:
+        for parent in parents[stack.pop()]:
+            if not reached[parent]:
+                reached[parent] = 1
+                stack.append(parent)
+    return reached
+
+
+def explore(workers=None, memory_limit=None, max_states=None, keep_graph=False,
+            chunk=32):
+    """
+    Search every reachable game state, breadth first.
+
+    Parameters:
+    - workers (int): Worker processes. Default is one per CPU core; 0 searches in this process.
+    - memory_limit (int): Bytes for a Bloom filter of visited states. Default is an exact table.
+    - max_states (int): Stop after this many states. Default is to search them all.
+    - keep_graph (bool): Return the StateGraph under 'graph', e.g. to build hints from.
+    - chunk (int): States sent to a worker at a time.
+
+    Returns:
+    dict: The search statistics and the properties found, see 'print_report'.
+
+    Raises:
+    ValueError: If the graph is asked for with a memory limit, which doesn't keep it.
+    """
+    if keep_graph and memory_limit is not None:
+        raise ValueError("The state graph is only kept by the exact transposition table")
+    graph = StateGraph(array("Q"), [], [], array("H"), [], bytearray(), bytearray())
+    terminal, solved, edges = graph.terminal, graph.solved, graph.edges
+    table = TranspositionTable() if memory_limit is None else BloomFilter(memory_limit)
+    exact = memory_limit is None
+    clues = {}
+    pumps = set()
+    best = (None, ())   # the highest final score and a path to it
+    transitions = 0
+
+    def add(node, path):
+        nonlocal best
+        if node.final_score is not None and (best[0] is None or node.final_score > best[0]):
+            best = (node.final_score, path)
+        index = table.insert(node.digest, len(terminal))
+        if index != len(terminal):
+            return index, False
+        for location, clue in node.clues:
+            clues.setdefault(location, set()).add(clue)
+        terminal.append(node.decision is None)
+        solved.append(node.solved)
+        if exact:
+            edges.append(array("I"))
+        if keep_graph:
+            graph.digests.append(node.digest)
+            graph.decisions.append(node.decision)
+            graph.options.append(node.options)
+            graph.clue_counts.append(len(node.clues))
+        return index, True
+
+    start = time.perf_counter()
+    workers = os.cpu_count() if workers is None else workers
+    pool = ProcessPoolExecutor(workers, initializer=_install_headless_io) if workers else None
+    try:
+        with headless_io():
+            root = _replay(())
+            add(root, ())
+            frontier = [(0, (), root)]
+            depth = 0
+            while frontier and (max_states is None or len(terminal) < max_states):
+                work = [(path, node.options) for _, path, node in frontier]
+                batches = [work[first:first + chunk] for first in range(0, len(work), chunk)]
+                if pool:
+                    expanded = [children for batch in pool.map(_expand, batches)
+                                for children in batch]
+                else:
+                    expanded = [children for batch in batches for children in _expand(batch)]
+                next_frontier = []
+                for (parent, path, node), children in zip(frontier, expanded):
+                    for option, child in zip(node.options, children):
+                        transitions += 1
+                        if child.digest == node.digest and child.score != node.score:
+                            pumps.add((node.decision, option))
+                        index, new = add(child, path + (option,))
+                        if exact:
+                            edges[parent].append(index)
+                        if new and child.decision is not None:
+                            next_frontier.append((index, path + (option,), child))
+                frontier = next_frontier
+                depth += 1
+    finally:
+        if pool:
+            pool.shutdown()
+
+    results = {"states": len(terminal), "terminal": sum(terminal),
+               "transitions": transitions, "depth": depth,
+               "complete": not frontier, "exact": exact,
+               "seconds": time.perf_counter() - start, "workers": max(workers, 1),
+               "best_score": best[0], "best_path": best[1],
+               "culprit_reachable": any(solved), "pumps": sorted(pumps),
+               "clues": clues, "dead_ends": None, "unwinnable": None,
+               "graph": graph if keep_graph else None}
+    if exact and not frontier:
+        ends = _reaches([state for state, over in enumerate(terminal) if over], edges)
+        wins = _reaches([state for state, won in enumerate(solved) if won], edges)
+        results["dead_ends"] = sum(1 for state, over in enumerate(terminal)
+                                   if not over and not ends[state])
+        results["unwinnable"] = sum(1 for state, over in enumerate(terminal)
+                                    if not over and not wins[state])
+    return results
+
+
+def print_report(results):
+    """Print the size of the state space and the properties checked."""
+    from game import Game
+
+    print(f"states: {results['states']} ({results['terminal']} game over), "
+          f"transitions: {results['transitions']}, depth: {results['depth']}")
+    if not results["complete"]:
+        print("the search stopped at the state limit, so the properties below are partial")
+    elif not results["exact"]:
+        print("visited states were kept in a Bloom filter, so some may have been skipped")
+    print(f"searched in {results['seconds']:.1f}s on {results['workers']} workers "
+          f"({results['transitions'] / results['seconds']:.0f} transitions/s)")
+
+    print(f"highest final score: {results['best_score']} via "
+          f"{' '.join(answer or '<none>' for answer in results['best_path'])}")
+    for decision, option in results["pumps"]:
+        print(f"  the score has no limit: answering {option!r} to the {decision} "
+              "prompt raises it without changing the game")
+    print(f"culprit can be found: {'yes' if results['culprit_reachable'] else 'NO'}")
+    if results["dead_ends"] is not None:
+        print(f"dead ends (can't reach the end): {results['dead_ends']}")
+        print(f"unwinnable states (can't find the culprit): {results['unwinnable']}")
+
+    print("clues reachable per location:")
+    for location in Game(seed=0).locations:
+        found = results["clues"].get(location.key, ())
+        print(f"  {location.key}: {len(found)} of {location.number_of_clues_to_find}")
+
+
+if __name__ == "__main__":
+    options = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+    print_report(explore(int(options["workers"]) if "workers" in options else None,
+                         int(options["memory"]) if "memory" in options else None,
+                         int(options["states"]) if "states" in options else None))
@@ -10,6 +10,9 @@ It includes interactions with characters, exploring locations, playing mini-game
 Classes:
 1. Game: Represents the main game class, managing the player's journey, interactions, inventory, and overall progress.
 
+Functions:
+1. derive_seed(seed, index): Derives per-session seeds from one base seed.
+
 Usage:
 - Import this module into your Python program to use the 'Game' class.
 
@@ -17,38 +20,132 @@ Author: Sam Curran, Sam Courtney, Hayden Carroll, Jamie O'Neill, Finn Delaney
 Date: 15/11/2023 - 01/12/2023
 """
 
+import os
 import time
-import json
-from colorama import \
-    Fore  # Easily installed via Pycharm (requirement for project submission)
+# json, colorama, bcrypt and the mini-games are imported on first use so the
+# player sees the intro sooner (see 'python main.py --profile-startup')
 from loggable import Loggable
-from character import Suspect, NPC, Witness
+from achievements import AchievementTracker, get_achievement_network
+from character import character_from_definition
+from content import get_story_data
+from events import EventBus, CaseClosed, CharacterInteracted, ClueFound, \
+    CommandIssued, MiniGameWon
 from leaderboard import Leaderboard
-from miniGames import HauntedMansionGame, RockPaperScissors, Riddle, MiniGameCounter
 from inventory import Inventory
-from item import Item
-from location import CrimeScene, Kitchen, Attic, Library, Location
-from user_registration import register_user, login_user
+from item import get_item_catalog
+from location import CrimeScene, Kitchen, Attic, Library, Location, \
+    LocationRegistry
+from mini_game_registry import MINI_GAMES
+
+# The main menu. Hints are looked up by the state the game is in at this prompt
+MENU_PROMPT = ("Press one of the following keys: \n'q' to quit\n"
+               "'r' to review your clues\n"
+               "'e' to explore the mansion further\n"
+               "'s' to see your current score \n"
+               "'u' to use an item from your inventory: \n"
+               "'h' for a hint\n"
+               "'c' to conclude investigation\n"
+               "Please Enter your selection: ")
+
+
+def _fore():
+    """Return colorama's Fore colours, importing colorama on first use."""
+    from colorama import \
+        Fore  # Easily installed via Pycharm (requirement for project submission)
+    return Fore
+
+
+def derive_seed(seed, index):
+    """
+    Derive the seed of one of many sessions from a base seed, so simulations
+    can give every worker its own reproducible, independent random stream.
+
+    Parameters:
+    - seed (int): The base seed.
+    - index (int): The session's number.
+
+    Returns:
+    int: A 64-bit seed for 'Game(seed=...)'.
+    """
+    import hashlib
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
 
 
 # Define the main game class
 class Game:
     """The Game class is set up to manage the game's behavior."""
 
-    def __init__(self):
-        self.username = None
-        self.player_name = None
+    # A fixed attribute layout keeps each session small when many are hosted
+    __slots__ = (
+        "username", "player_name", "game_leaderboard", "game_log", "events",
+        "achievements",
+        "__error_logger", "inventory", "library", "attic", "kitchen",
+        "secret_passages", "crime_scene", "locations", "_mini_game",
+        "seed", "_rng", "running", "started",
+        "characters_interacted", "npcs_interacted", "kitchen_npc_interacted",
+        "attic_npc_interacted", "library_npc_interacted", "_npc_scored", "score",
+        "witness", "witness2", "suspect", "suspect2",
+        "suspect3", "npcs", "doors_checker", "doors", "game_scores",
+    )
+
+    def __init__(self, seed=None):
+        """
+        Set up a new game session.
+
+        Parameters:
+        - seed (int): Seeds the session's random number generator, so a session
+          can be replayed exactly. Default is a fresh random seed.
+        """
         self.game_leaderboard = Leaderboard()
         self.game_log = Loggable()
-        self.game_riddle = Riddle()
+        # Game logic publishes what happens on the event bus. The log and the
+        # running score are subscribers, see events.py
+        self.events = EventBus()
+        self.events.subscribe(self.game_log.log_events)
+        self.events.subscribe(self._update_score, (CharacterInteracted, ClueFound))
+        # Achievements are matched incrementally from the events they test
+        network = get_achievement_network()
+        self.achievements = AchievementTracker(network, self._announce_achievement)
+        self.events.subscribe(self.achievements.handle, network.alpha)
+        self._rng = None
         self.__error_logger = Loggable()
-        self.haunted_game = HauntedMansionGame()
         self.inventory = Inventory()  # Initialize the player's inventory
-        self.library = Library()
-        self.attic = Attic()
-        self.kitchen = Kitchen()
-        self.secret_passages = Location(3)
-        self.rock_paper_scissors = RockPaperScissors()
+        # Every location is registered here and records its clues in the
+        # registry's shared clue store
+        self.locations = LocationRegistry()
+        clue_store = self.locations.clue_store
+        self.crime_scene = self.locations.register(
+            CrimeScene("Mansion's Drawing Room", clue_store))
+        self.attic = self.locations.register(Attic(clue_store))
+        self.kitchen = self.locations.register(Kitchen(clue_store))
+        self.library = self.locations.register(Library(clue_store))
+        # Secret passage clues are saved but do not add to the score
+        self.secret_passages = self.locations.register(
+            Location(3, "Secret Passages", clue_store), scored=False)
+        self._mini_game = None
+
+        # Characters, items and narrative text live in story_data.json
+        characters = self.story_data["Characters"]
+        self.witness = character_from_definition(characters["witness"])
+        self.witness2 = character_from_definition(characters["witness2"])
+        self.suspect = character_from_definition(characters["suspect"])
+        self.suspect2 = character_from_definition(characters["suspect2"])
+        self.suspect3 = character_from_definition(characters["suspect3"])
+
+        self.npcs = [character_from_definition(characters[key])
+                     for key in self.story_data["Crime_scene_npcs"]]
+
+        # One door per registered mini-game, see mini_game_registry.py
+        self.doors_checker = [False] * len(MINI_GAMES)
+        self.doors = [f"Hidden Passage({mini_game.door})" for mini_game in MINI_GAMES]
+        self.game_scores = MINI_GAMES.new_scores()
+        self._start_session(seed)
+
+    def _start_session(self, seed):
+        """Set the player state a session starts with and seed its random number generator."""
+        self.username = None
+        self.player_name = None
         self.running = True
         self.started = False
         self.characters_interacted = False
@@ -56,113 +153,109 @@ class Game:
         self.kitchen_npc_interacted = False
         self.attic_npc_interacted = False
         self.library_npc_interacted = False
+        self._npc_scored = set()  # locations whose NPCs have earned their points
         self.score = 0
-        self.mini_game = MiniGameCounter()
-        self.crime_scene = CrimeScene("Mansion's Drawing Room")
-        self.witness = Witness(
-            "Mr. Drew the Gardener",
-            "I am not so sure this is as simple a case, people have been "
-            "very suspicious recently, the chef and the butler are acting "
-            "strange, I suggest you talk to them, if you haven't already",
-            "Chef and butler acting strange",
-            "Leaves the room to go back to gardening",
-            48,
-        )
-        self.witness2 = Witness(
-            "Ms. Parker",
-            "I saw someone near the window at the time of the incident, "
-            "just after my walk with Lady Victoria",
-            "Suspicious figure in dark clothing.",
-            "calmly walks away",
-            45,
-        )
-        self.suspect = Suspect(
-            "Mr. Reginald, the butler",
-            "I was working last night but left at 8",
-            "Claims to have left at 8",
-            "walks away in a rush",
-            61,
-        )
-        self.suspect2 = Suspect(
-            "Lady Victoria Starling",
-            "I cant believe my Diamond necklace was"
-            " Stolen!\nI heard someone in my room last night, it was worth "
-            "so much aswell!!",
-            "Was on a walk with Mr. Parker",
-            "walks away",
-            78,
-        )
-        self.suspect3 = Suspect(
-            "The Chef",
-            "Get out my kitchen, I dont need to talk to you",
-            "Left at 9 with the butler (You notice the times dont match up)",
-            "Acting Suspicious",
-            78,
-        )
-
-        self.npcs = [
-            NPC(
-                "Beatrice",
-                "How do you do.",
-                "decides to hang around and see what will happen",
-                68,
-            ),
-            NPC("Seamus", "Welcome to the mansion", "decides to walk away",
-                29),
-            NPC("The Child", "Go away this is my house!",
-                "angrily storms away", 8),
-        ]
-
-        self.doors_checker = [False] * 3
-        self.doors = ["Hidden Passage(1)", "Hidden Passage(2)", "Hidden "
-                                                                "Passage(3)"]
-        self.game_scores = {
-            "Haunted Mansion": 0,
-            "Rock Paper Scissors": 0,
-            "Riddle": 0,
-            # Add more games as needed
-        }
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(8), "big")
+        if self._rng is not None:
+            self._rng.seed(self.seed)
+        self.game_log.log(f"Session seed: {self.seed} "
+                          f"(replay with 'python main.py --seed {self.seed}')")
+
+    def reset(self, seed=None):
+        """
+        Restore the session in place to the state a new Game starts in, so a
+        host can hand it to the next player without building another one
+        (see session_pool.py). The event bus keeps its subscriptions, and
+        the characters, locations and loggers are reused.
+
+        Parameters:
+        - seed (int): Seeds the session's random number generator. Default is a fresh random seed.
+
+        Returns:
+        None
+        """
+        self.events.discard()
+        self.game_log.clear()
+        self.__error_logger.clear()
+        self.achievements.reset()
+        self.inventory.clear()
+        self.locations.reset()
+        for character in (self.witness, self.witness2, self.suspect,
+                          self.suspect2, self.suspect3, *self.npcs):
+            character.reset()
+        if self._mini_game is not None:
+            self._mini_game.counter = 1
+        self.doors_checker[:] = [False] * len(self.doors_checker)
+        for title in self.game_scores:
+            self.game_scores[title] = 0
+        self._start_session(seed)
+
+    def _update_score(self, events):
+        """Add the points events are worth to the running score, as a subscriber
+        of CharacterInteracted and ClueFound events."""
+        for event in events:
+            if type(event) is ClueFound:
+                # this gives you a point for every clue you find
+                if self.locations.is_scored(event.location):
+                    self.score += 1
+            elif event.role == "npc":
+                # this gives you 2 points for interacting with a location's NPCs
+                if event.location not in self._npc_scored:
+                    self._npc_scored.add(event.location)
+                    self.score += 2
+            elif event.role == "witness":
+                # this gives you 10 points for interacting with a witness
+                self.score += 10
+            elif event.location == self.crime_scene.key:
+                # this gives you 15 points for interacting with the suspect
+                self.score += 15
+
+    def _announce_achievement(self, achievement):
+        print(f"Achievement unlocked: {achievement.title} ({achievement.description})")
+        self.game_log.log(f"Player unlocked the achievement {achievement.achievement_id}")
+
+    def find_clue(self, location, clue, category="evidence"):
+        """
+        Add a clue to a location and publish a ClueFound event if it is new.
+
+        Parameters:
+        - location (Location): Where the clue was found.
+        - clue (str): The clue.
+        - category (str): The kind of clue, e.g. 'evidence' or 'testimony'.
+
+        Returns:
+        bool: True if the clue was new.
+        """
+        if location.add_clue(clue, category):
+            self.events.publish(ClueFound(location.key, clue, category))
+            return True
+        return False
 
     def __score__(self):
-        # this gives you 10 points for interacting with a witness
-        if self.witness.interacted:
-            self.score += 10
-
-        # this gives you 10 points for interacting with a witness
-        if self.witness2.interacted:
-            self.score += 10
-
-        # this gives you 15 points for interacting with a suspect
-        if self.suspect.interacted:
-            self.score += 15
-
-        # this gives you 2 points for interacting with NPCs
-        if self.npcs_interacted:
-            self.score += 2
-
-        if self.attic_npc_interacted:
-            self.score += 2
-
-        if self.library_npc_interacted:
-            self.score += 2
-
-        if self.kitchen_npc_interacted:
-            self.score += 2
-
-        # this gives you a point for every clue you find
-        if self.crime_scene.review_clue():
-            self.score += len(self.crime_scene.review_clue())
-
-        if self.attic.review_clue():
-            self.score += len(self.attic.review_clue())
-
-        if self.library.review_clue():
-            self.score += len(self.library.review_clue())
+        # The score is kept up to date by _update_score as events happen
+        return self.score
 
-        if self.kitchen.review_clue():
-            self.score += len(self.kitchen.review_clue())
+    @property
+    def story_data(self):
+        """The story content. It is not kept on the session, so a rebuilt
+        content pack can release the one it replaces."""
+        return get_story_data()
 
-        return self.score
+    @property
+    def rng(self):
+        """The session's own random number generator, used by every mini-game."""
+        if self._rng is None:
+            import random
+            self._rng = random.Random(self.seed)
+        return self._rng
+
+    # Mini-games are created by their registry factory when a door is opened
+    @property
+    def mini_game(self):
+        if self._mini_game is None:
+            from miniGames import MiniGameCounter
+            self._mini_game = MiniGameCounter(len(MINI_GAMES))
+        return self._mini_game
 
     @property
     def log(self):
@@ -175,31 +268,20 @@ class Game:
         return self.__error_logger
 
     def get_past_progress(self):
+        import json
         with open('user_data.json', 'r') as file:
             game_data = json.load(file)
         self.player_name = game_data[self.username]["name"]
         self.score = game_data[self.username]["score"]
-        try:
-            self.crime_scene.import_past_progress(game_data[self.username][
-                                                      "Location_clues"][
-                                                      "CrimeScene"])
-            self.attic.import_past_progress(game_data[self.username][
-                                                "Location_clues"][
-                                                "Attic"])
-            self.kitchen.import_past_progress(game_data[self.username][
-                                                  "Location_clues"][
-                                                  "Kitchen"])
-            self.library.import_past_progress(game_data[self.username][
-                                                  "Location_clues"][
-                                                  "Library"])
-            self.secret_passages.import_past_progress(game_data[
-                                                          self.username][
-                                                          "Location_clues"][
-                                                          "Secret Passages"])
-        except KeyError:
+        missing = self.locations.import_progress(
+            game_data[self.username].get("Location_clues", {}))
+        self.achievements.restore(game_data[self.username].get("Achievements", ()))
+        if missing:
             print("You found no clues last time, or didn't exit properly!")
 
     def initialize_player(self):
+        from user_registration import register_user, login_user
+
         max_login_attempts = 3
 
         while max_login_attempts > 0:
@@ -229,6 +311,7 @@ class Game:
                     print("Login failed")
 
     def update_user_score(self, username, score):
+        import json
         try:
             with open('user_data.json', 'r') as file:
                 user_data = json.load(file)
@@ -241,23 +324,37 @@ class Game:
             json.dump(user_data, file, indent=2)
 
     def completed_mini_game_message(self):
-        self.crime_scene.add_clue("The letter on the ground")
-        self.inventory.add_item(Item("Letter", "Letter found in the butlers "
-                                               "pantry", "You read the "
-                                                         "letter to find the "
-                                                         "butler has been "
-                                                         "talking to a "
-                                                         "jeweller about "
-                                                         "selling "
-                                                         "jewellery", 15))
+        self.find_clue(self.crime_scene, "The letter on the ground")
+        self.inventory.add_item(self.new_item("letter", self.crime_scene.key))
         print("You have discovered a secret letter")
 
+    def hint(self):
+        """
+        Look up the precomputed hint for the game's current state (see hints.py).
+
+        Returns:
+        str: The next steps towards the nearest clue, or towards solving the
+        case once no clues are left.
+        """
+        from game_state import state_digest, state_key
+        from hints import get_hint_table
+
+        table = get_hint_table()
+        if table is None:
+            return "No hints are available (build them with 'python hints.py')."
+        hint = table.hint(state_digest(state_key(self, MENU_PROMPT)))
+        return hint or "You're on your own here Detective, there is no hint for this."
+
+    def story(self, key):
+        """Return a piece of narrative text from the story data."""
+        return self.story_data["Story"][key]
+
+    def new_item(self, key, found_in=None):
+        """Create an inventory item from its shared prototype in the item catalog."""
+        return get_item_catalog().create(key, found_in)
+
     def run(self):
-        text = "\033[1;31mWelcome to 'The Poirot Mystery'\n" \
-               "You are about to embark on a thrilling " \
-               "adventure as a detective\n" \
-               "Your expertise is needed to solve a complex case " \
-               "and unveil the truth\n\033[0m"
+        text = self.story("intro")
 
         for char in text:
             print(char, end="", flush=True)
@@ -288,17 +385,9 @@ class Game:
          choice to start the game or quit."""
 
         if self.started:
-            player_input = input(Fore.GREEN +
-                                 "Press one of the following keys: \n'q' to quit\n"
-                                 "'r' to review your clues\n"
-                                 "'e' to explore the mansion further\n"
-                                 "'s' to see your current score \n"
-                                 "'u' to use an item from your inventory: \n"
-                                 "'c' to conclude investigation\n"
-                                 "Please Enter your selection: "
-                                 )
-
-            self.game_log.log(f"Player input is {player_input}.")
+            player_input = input(_fore().GREEN + MENU_PROMPT)
+
+            self.events.publish(CommandIssued(player_input, "main"))
 
             if player_input.lower() == "q":
                 print("exiting...")
@@ -308,10 +397,9 @@ class Game:
                 self.game_log.log("Player chose to review clues "
                                   "at Crime Scene")
                 if self.crime_scene:
-                    clues = self.crime_scene.review_clue() + self.attic.review_clue() + self.library.review_clue() + self.kitchen.review_clue()
-                    if clues:
+                    if self.locations.has_clues():
                         print("You review your clues:")
-                        for clue in clues:
+                        for clue in self.locations.all_clues():
                             print(clue)
                     else:
                         print("No clues have been gathered yet.")
@@ -324,9 +412,23 @@ class Game:
             elif player_input.lower() == "u":
                 # Print all items in the inventory
                 self.inventory.print_inventory()
-                item_name = input(
-                    "Enter the name of the item you want to use: ")
-                self.inventory.use_item(item_name, Game)
+                item_names = input(
+                    "Enter the name of the item you want to use "
+                    "(separate several items with commas): ")
+                item_names = [name.strip() for name in item_names.split(",")
+                              if name.strip()]
+                try:
+                    effects = self.inventory.use_items(item_names, self)
+                except ValueError as error:
+                    print(error)
+                else:
+                    for effect in effects:
+                        print(effect.impact)
+                        print(f"{effect.name} has been removed from your "
+                              "inventory.")
+            elif player_input.lower() == "h":
+                self.game_log.log("Player asked for a hint")
+                print(self.hint())
             elif player_input.lower() == "c":
                 self.user_guess()
             else:
@@ -352,13 +454,8 @@ class Game:
         if not self.player_name:
             self.player_name = input("Please enter your detective name:")
 
-            text = ("\033[1;31mAs the renowned detective, "
-                    f"{self.player_name},\n"
-                    "you were called in to solve the baffling case of the "
-                    "missing Diamond Necklace Starlight Serenade\n\n"
-                    "You have been tasked with finding the missing piece "
-                    "of the mansion's owner, Lady Victoria Starling!\n"
-                    "You can find her in the mansions drawing room...\n\033[0m")
+            text = self.story("case_briefing").format(
+                player_name=self.player_name)
 
             for char in text:
                 print(char, end="", flush=True)
@@ -370,7 +467,7 @@ class Game:
 
     def explore_options(self):
 
-        explore_choice = input(Fore.GREEN + "Which path do you dare to take,"
+        explore_choice = input(_fore().GREEN + "Which path do you dare to take,"
                                             "The path that leads upstairs(1) or"
                                             " The path that leads downstairs("
                                             "2) : ")
@@ -383,7 +480,7 @@ class Game:
 
     def explore_upstairs(self):
         while True:
-            room_choice = input(Fore.GREEN + "As you venture forward 4 rooms "
+            room_choice = input(_fore().GREEN + "As you venture forward 4 rooms "
                                              "are revealed "
                                              "to you:\nA Kitchen(K)"
                                              "\nA huge Library(L)"
@@ -394,16 +491,18 @@ class Game:
 
             if room_choice.lower() == 'k' and not self.kitchen.visited:
                 self.kitchen.visited = True
-                print('you walk through the seemingly never ending upstairs '
-                      'hallway of the mansion on your way to the kitchen '
-                      'you open the door and see an old man cutting carrots')
+                print(self.story("kitchen_arrival"))
                 interact_choice = input("Do you want to talk to the chef "
                                         "(Y/N) : ")
                 while True:
                     if interact_choice.lower() == 'y':
                         print(self.suspect3.interact())
-                        self.kitchen.add_clue("chef is hostile and doesnt seem to "
-                                              "want to help you solve the crime")
+                        self.events.publish(CharacterInteracted(
+                            self.suspect3.name, "suspect", self.kitchen.key))
+                        self.find_clue(self.kitchen,
+                                       "chef is hostile and doesnt seem to "
+                                       "want to help you solve the crime",
+                                       "testimony")
                         break
                     elif interact_choice.lower() == 'n':
                         print('Scared off interaction...How embarrassing, '
@@ -417,13 +516,10 @@ class Game:
                     " ? (Y/N) :")
                 while True:
                     if explore_choice1.lower() == 'y':
-                        print(
-                            "you walk around the kitchen searching for clues...\n"
-                            "you see signs of a forced entry on the knife press\n"
-                            "and you also heard the chef complain about missing\n"
-                            "utensils earlier")
-                        self.kitchen.add_clue("looks like someone stole a knife "
-                                              "from the kitchen")
+                        print(self.story("kitchen_search"))
+                        self.find_clue(self.kitchen,
+                                       "looks like someone stole a knife "
+                                       "from the kitchen")
                         break
                     elif explore_choice1.lower() == 'n':
                         print("You return to the hallway")
@@ -435,16 +531,8 @@ class Game:
                     "do you want to explore kitchen further"
                     "? (Y/N) :")
                 if explore_choice1.lower() == 'y':
-                    print(
-                        "\nAs you are leaving you see a camera in the corner "
-                        "off\n"
-                        "the kitchen that looks to be off. The Chef says \n"
-                        "'it wasn't on when i arrived this morning'.\nThis "
-                        "person"
-                        "must know a lot about this mansion, you think to "
-                        "yourself \n As you walk out of the kitchen you get "
-                        "a strong distinct smell of a cigar...interesting")
-                    self.kitchen.add_clue("camera system has been shut off")
+                    print(self.story("kitchen_camera"))
+                    self.find_clue(self.kitchen, "camera system has been shut off")
 
             elif room_choice.lower() == 'k' and self.kitchen.visited:
                 print("You have already explored this room\n"
@@ -452,15 +540,14 @@ class Game:
 
             elif room_choice.lower() == "a" and not self.attic.visited:
                 self.attic.visited = True
-                print(
-                    "You walk through the never ending halls of the mansion on"
-                    "your way to the attic. You reach a dimly lit room, As you"
-                    " walk in there\'s a young girl writing at a desk")
+                print(self.story("attic_arrival"))
                 interact_choice = input(
                     f"do you want to talk to the girl? (y/n) : ")
                 if interact_choice.lower() == 'y':
-                    print(self.attic.interact_with_npcs)
                     self.attic_npc_interacted = True
+                    print(self.attic.interact_with_npcs)
+                    self.events.publish(CharacterInteracted(
+                        self.attic.npc.name, "npc", self.attic.key))
                     print(self.attic.npc_action)
                 else:
                     print("You back out of the room")
@@ -468,14 +555,10 @@ class Game:
                 explore_choice2 = input("do you want to explore attic further"
                                         " ? (Y/N) :")
                 if explore_choice2.lower() == 'y':
-                    print("\n as you walk around the attic you feel a cold "
-                          "breeze coming from\nthe window at the back of the "
-                          "room.\nYou see it has been opened and see a muddy "
-                          "footprint on the windowsill.\n\nAs you examine it "
-                          "closer it looks to be forces open")
-                    self.attic.add_clue("window open in attic")
-                    self.attic.add_clue("muddy footprint on attic windowsill")
-                    self.attic.add_clue("window appears to be forced open")
+                    print(self.story("attic_search"))
+                    self.find_clue(self.attic, "window open in attic")
+                    self.find_clue(self.attic, "muddy footprint on attic windowsill")
+                    self.find_clue(self.attic, "window appears to be forced open")
                 else:
                     print(
                         'Scared of a bit of investigating...How embarrassing,'
@@ -486,17 +569,17 @@ class Game:
 
             elif room_choice.lower() == "l" and not self.library.visited:
                 self.library.visited = True
-                print(
-                    "you walk through the never ending halls of the mansion on "
-                    "your way to the library.")
+                print(self.story("library_arrival"))
                 interact_choice = input(
                     "do you want to talk to the librarian? (y/n) : ")
                 if interact_choice.lower() == 'y':
-                    print(self.library.interact_with_npcs)
                     self.library_npc_interacted = True
+                    print(self.library.interact_with_npcs)
+                    self.events.publish(CharacterInteracted(
+                        self.library.npc.name, "npc", self.library.key))
                     print(self.library.npc_action)
-                    self.library.add_clue("someone was walking in the attic"
-                                          " late last night")
+                    self.find_clue(self.library, "someone was walking in the attic"
+                                   " late last night", "testimony")
                 else:
                     print("You walk back out of the room")
 
@@ -504,12 +587,9 @@ class Game:
                     "do you want to explore library further"
                     " ? (Y/N) :")
                 if explore_choice3.lower() == 'y':
-                    print("\nas you walk through the isles of bookshelves you "
-                          "see a trail of footprints\nleading from what seems "
-                          "to be a hidden passage.")
-                    self.library.add_clue(
-                        "hidden passage that leads to library")
-                    self.library.add_clue("muddy footprints in library")
+                    print(self.story("library_search"))
+                    self.find_clue(self.library, "hidden passage that leads to library")
+                    self.find_clue(self.library, "muddy footprints in library")
 
             elif room_choice.lower() == "l" and self.library.visited:
                 print("You have already explored the library"
@@ -518,31 +598,19 @@ class Game:
             elif room_choice.lower() == "b":
                 break
             elif room_choice.lower() == 'd':
-                text = ("\033[1;31mIt appears you found the Crime Scene,\n"
-                        "what you find here is of the upmost\n"
-                        "importance so be very careful\n\033[0m")
+                text = self.story("crime_scene_warning")
 
                 for char in text:
                     print(char, end="", flush=True)
                     time.sleep(0.005)  # Adjust the delay time as needed
 
-                text = (
-                    "\033[1;31mAs you make your way through the winding "
-                    "stairs that"
-                    "lead\n"
-                    " to the crime scene you feel all eyes are on you, "
-                    "you must\n"
-                    "solve this crime. You reach the top of the stairs and "
-                    "go\n"
-                    "to the bedroom were the precious jewels were stored. "
-                    "You\n"
-                    "slowly push the door open.\n\033[0m")
+                text = self.story("crime_scene_approach")
                 for char in text:
                     print(char, end="", flush=True)
                     time.sleep(0.005)
 
                 while True:
-                    player_input = input(Fore.RED +
+                    player_input = input(_fore().RED +
                                          "Press one of the following keys: "
                                          "\n'b' to go back to"
                                          "the hallway\n"
@@ -552,7 +620,7 @@ class Game:
                                          "Please Enter your selection: "
                                          )
 
-                    self.game_log.log(f"Player input is {player_input}.")
+                    self.events.publish(CommandIssued(player_input, "crime scene"))
 
                     if player_input.lower() == "b":
                         print("Leaving...")
@@ -582,7 +650,7 @@ class Game:
                                           "at Crime Scene")
                         if self.crime_scene:
                             clues = self.crime_scene.review_clue()
-                            if clues:
+                            if self.crime_scene.clues_found:
                                 print("You review your clues:")
                                 for clue in clues:
                                     print(clue)
@@ -595,10 +663,9 @@ class Game:
 
     def door_choice(self):
         """This method handles the door examination option. User input is
-        being handled. The user can make 3 choices: door 1 leads to the
-        front door, door 2 leads to the library and door 3 leads to the
-        kitchen. Wrong user input is being handled via print-outs for error
-        handling."""
+        being handled. Each door leads to the mini-game registered for it in
+        mini_game_registry.py, and winning it reveals a clue. Wrong user
+        input is being handled via print-outs for error handling."""
 
         while True:
             print("You venture forward within this decrepted mansion,Three dark "
@@ -606,80 +673,16 @@ class Game:
             for i, door in enumerate(self.doors, start=1):
                 print(f"{i}. {door}")
             print("\n--To go back(B)--")
-            player_input = int(
-                input("Which passage will you venture through...Brave"
-                      f" detective:")
-            )
+            player_input = input("Which passage will you venture through...Brave"
+                                 f" detective:")
+            if player_input.strip().lower() == "b":
+                break
+            player_input = int(player_input)
 
             if 0 < player_input < len(self.doors) + 1:  # for valid entry check
                 self.game_log.log(f"Player chose to enter door {player_input}")
-                if int(player_input) == 1 and not self.doors_checker[0]:
-                    print("Those who dare to enter ahead..guess this word...or "
-                          f"ill take your head")
-                    # Play mini-game only for the first door choice
-                    word_result = self.haunted_game.play_haunted_mansion_game()
-                    if word_result:
-                        self.doors_checker[0] = True
-                        print(
-                            "inside is a small kitchen with a butler making food\n"
-                            "you ask him who he is  and he tells you hes the "
-                            "the mansion's butler, Mr. Reginald\n"
-                            "you are surised he is the butler at first as his"
-                            " trousers seem to be stained with mud and his shoes\n"
-                            "look tarnished after talking, you realise he has a"
-                            " suspiciously extensive knowledge of the mansion's "
-                            "layout\n"
-                        )
-                        self.secret_passages.add_clue(
-                            "Mr. Reginald's rugged look and extensive knowledge "
-                            "of the mansion's layout"
-                        )
-                        self.secret_passages.add_clue(
-                            "Mr. Reginald's rugged look and extensive knowledge "
-                            "of the mansion's layout"
-                        )
-                        # Calls the method reward_for_game_completion adds to the users score.
-                        self.mini_game.display_counter()
-
-                elif int(player_input) == 2 and not self.doors_checker[1]:
-                    print("Those who dare to enter ahead..Prove to me you are "
-                          "worthy, Beat me in this game of wit..before you end "
-                          "up dead")
-
-                    rps_result = self.rock_paper_scissors.play_game()
-                    if rps_result:
-                        self.doors_checker[1] = True
-                        print(
-                            "You slowly open the door to reveal a...\n"
-                            "...a dark corridor which leads you to stairs\n"
-                        )
-                        self.secret_passages.add_clue("The letter on the ground")
-                        # Calls the method reward_for_game_completion adds to the users score.
-                        self.mini_game.display_counter()
-
-                elif int(player_input) == 3 and not self.doors_checker[2]:
-                    print(
-                        "Those who dare to proceed ahead...let me riddle you a question before you end up dead")
-                    # Use the new methods from the updated Riddle class
-                    self.game_riddle.print_riddle()
-                    user_input = input("What is your guess Detective:")
-                    # Access the answer using the get_answer property
-                    if user_input.lower().strip() == self.game_riddle.get_answer.strip():
-                        print("Very good Detective, you may proceed")
-                        print(
-                            "You open the library door to reveal a hidden\n"
-                            "passage...\n"
-                            "What secrets does it hold?"
-                        )
-                        self.secret_passages.add_clue(
-                            "The hidden passage behind the library door")
-                        self.doors_checker[2] = True
-                        # Calls the method reward_for_game_completion adds to the users score.
-                        self.mini_game.display_counter()
-
-                    elif player_input == "B":
-                        break
-
+                if not self.doors_checker[player_input - 1]:
+                    self.play_mini_game(player_input)
                 else:
                     self.game_log.log(
                         f"Player chose to enter door {player_input} "
@@ -691,17 +694,57 @@ class Game:
                     )
             else:
                 raise ValueError(f"Invalid door choice Detective: {player_input}")
-        if self.mini_game.counter == 4:
-            self.completed_mini_game_message()
+
+    def play_mini_game(self, number):
+        """
+        Play the mini-game behind a door. The mini-game is created for this
+        attempt only, so a lost game can be retried from the start.
+
+        Parameters:
+        - number (int): The door's position in the list shown to the player.
+
+        Returns:
+        bool: True if the player won.
+        """
+        mini_game = MINI_GAMES.at_door(number)
+        print(self.story(f"door{mini_game.door}_challenge"))
+        won, points = self.attempt_mini_game(mini_game)
+        self.game_scores[mini_game.title] += points
+        if won:
+            self.doors_checker[number - 1] = True
+            self.events.publish(MiniGameWon(mini_game.title, mini_game.door,
+                                            mini_game.clue))
+            print(self.story(f"door{mini_game.door}_reward"))
+            if mini_game.clue:
+                self.find_clue(self.secret_passages, mini_game.clue)
+            self.mini_game.display_counter()
+            if all(self.doors_checker):
+                self.completed_mini_game_message()
+        return won
+
+    def attempt_mini_game(self, mini_game):
+        """
+        Create a mini-game with its registry factory and play it once.
+
+        Parameters:
+        - mini_game (MiniGame): The registered mini-game.
+
+        Returns:
+        tuple: Whether the player won and the points the attempt is worth.
+        """
+        instance = mini_game.factory(self)
+        won = mini_game.play(instance, self)
+        return won, mini_game.score(instance, won)
 
     def interact_with_characters(self):
         if not self.characters_interacted:
             print("You decide to interact with the characters in the room.")
 
             clue_suspect = self.suspect.interact()
-            self.crime_scene.add_clue(clue_suspect)
+            self.find_clue(self.crime_scene, clue_suspect, "testimony")
             print(clue_suspect)  # keep the outputs going
-            self.game_log.log(f"{self.suspect.name} interacted with Player")
+            self.events.publish(CharacterInteracted(
+                self.suspect.name, "suspect", self.crime_scene.key))
             self.game_log.log(
                 f"{self.suspect.name} provided clue:" f" {clue_suspect}")
 
@@ -710,7 +753,7 @@ class Game:
             # adds it to the clue list,
             # then prints that and the suspect action
             suspect_alibi = self.suspect.provide_alibi()
-            self.crime_scene.add_clue(suspect_alibi)
+            self.find_clue(self.crime_scene, suspect_alibi, "testimony")
             print(suspect_alibi)
             print(self.suspect.perform_action())
             self.game_log.log(
@@ -719,9 +762,10 @@ class Game:
             time.sleep(2)
 
             clue_witness = self.witness.interact()
-            self.crime_scene.add_clue(clue_witness)
+            self.find_clue(self.crime_scene, clue_witness, "testimony")
             print(clue_witness)
-            self.game_log.log(f"{self.witness.name} interacted with Player")
+            self.events.publish(CharacterInteracted(
+                self.witness.name, "witness", self.crime_scene.key))
             self.game_log.log(
                 f"{self.suspect.name} " f"provided clue: {clue_suspect}")
 
@@ -729,7 +773,7 @@ class Game:
             # it to the clue list, then prints that and the witness action
             # and changes interacted to true
             witness_observation = self.witness.share_observation()
-            self.crime_scene.add_clue(witness_observation)
+            self.find_clue(self.crime_scene, witness_observation, "testimony")
             print(witness_observation)
             print(self.witness.perform_action())
             self.game_log.log(
@@ -739,9 +783,10 @@ class Game:
             time.sleep(2)
 
             clue_witness = self.witness2.interact()
-            self.crime_scene.add_clue(clue_witness)
+            self.find_clue(self.crime_scene, clue_witness, "testimony")
             print(clue_witness)
-            self.game_log.log(f"{self.witness2.name} interacted with Player")
+            self.events.publish(CharacterInteracted(
+                self.witness2.name, "witness", self.crime_scene.key))
             self.game_log.log(
                 f"{self.suspect.name} " f"provided clue: {clue_suspect}")
 
@@ -751,7 +796,7 @@ class Game:
             # to a variable adds it to the clue list, then prints that and
             # the witness action and changes interacted to true
             witness_observation = self.witness2.share_observation()
-            self.crime_scene.add_clue(witness_observation)
+            self.find_clue(self.crime_scene, witness_observation, "testimony")
             print(witness_observation)
             print(self.witness2.perform_action())
             self.characters_interacted = True
@@ -768,49 +813,37 @@ class Game:
 
     def interact_with_npcs(self):
         if not self.npcs_interacted:
+            # set before publishing, as the score subscriber may be batched or async
+            self.npcs_interacted = True
             print("You decide to interact some others in the room.")
             for index, npc in enumerate(self.npcs):
-                self.game_log.log(f"{npc.name} interacted with Player")
+                self.events.publish(CharacterInteracted(
+                    npc.name, "npc", self.crime_scene.key))
                 interaction = npc.interact
                 action = npc.perform_action()
                 print(f"{interaction}\n{action}")
                 self.game_log.log(
                     f"{npc.name} said to the player:" f" {npc.dialogue}")
-            self.crime_scene.add_clue(
+            self.find_clue(
+                self.crime_scene,
                 "Three people hanging around the Crime Scene"
-                "who have nothing to do with the crime"
+                "who have nothing to do with the crime",
+                "testimony"
             )
-            self.npcs_interacted = True
             # Detail needed to be added here, Storyline etc
 
     def examine_clues(self):
         if not self.crime_scene.investigated:
-            print(
-                "You step into the dimly lit crime scene.\nBroken glass lies "
-                "near the window, and a table is overturned.\n"
-                "You find a torn piece of fabric near the window.\n"
-                "There's a distinct smell of Cigars lingering in the air.\n"
-                "The mystery deepens."
-            )
+            print(self.story("crime_scene_examined"))
 
             # Add items to the inventory when examining clues
-            self.crime_scene.add_clue("Torn fabric")
-            self.inventory.add_item(
-                Item("Torn Fabric", "A torn piece of fabric near the "
-                                    "window", "You notice this piece of "
-                                             "fabric is part of the butlers "
-                                             "suit", 2))
-            self.crime_scene.add_clue("Broken glass near window")
-            self.crime_scene.add_clue("An overturned table at crime scene")
-            self.inventory.add_item(Item("Overturned Table",
-                                         "Table overturned at the crime "
-                                         "scene", "Leads you to believe "
-                                                  "someone left in a hurry",
-                                         3))
-            self.crime_scene.add_clue("Smell of perfume")
-            self.inventory.add_item(
-                Item("Cigar", "Cigar at crime scene",
-                     "You think that whoever did the crime smokes cigars", 1))
+            self.find_clue(self.crime_scene, "Torn fabric")
+            self.inventory.add_item(self.new_item("torn_fabric", self.crime_scene.key))
+            self.find_clue(self.crime_scene, "Broken glass near window")
+            self.find_clue(self.crime_scene, "An overturned table at crime scene")
+            self.inventory.add_item(self.new_item("overturned_table", self.crime_scene.key))
+            self.find_clue(self.crime_scene, "Smell of perfume")
+            self.inventory.add_item(self.new_item("cigar", self.crime_scene.key))
             self.crime_scene.investigated = True
         else:
             print(
@@ -820,6 +853,7 @@ class Game:
 
     def user_guess(self):
         guilty = '1'
+        suspects = {"1": "Mr. Reginald", "2": "Lady Victoria Starling", "3": "The Chef"}
         interrogate_choice = input(
             "After reviewing your clues you have 3 possible suspects\n"
             "1. Mr. Reginald (the butler)\n"
@@ -838,11 +872,13 @@ class Game:
                       " questions.\nas you continue to push he breaks and "
                       "admits it was him.")
                 print("\ncongratulations Detective you have found the suspect")
+                self.events.publish(CaseClosed("Mr. Reginald", True, True))
                 self.end_game()
             elif suspect_interrogated_choice == '2':
                 print("Lady Victoria Starling was irate that you could even"
                       " think she did this and kicks you out of the mansion."
                       "\nYour investigation has come to an end........")
+                self.events.publish(CaseClosed("Lady Victoria Starling", False, True))
                 self.end_game()
             elif suspect_interrogated_choice == '3':
                 print("As you ask the chef questions you feel he is hiding"
@@ -856,6 +892,7 @@ class Game:
                 if extra_interrogation.lower() == 'y':
                     print("\nWhen you present your finding to Mr. Reginalde "
                           "immediately admits defeat and confesses.")
+                    self.events.publish(CaseClosed("Mr. Reginald", True, True))
                     self.end_game()
             else:
                 raise ValueError(f"Invalid choice Detective: "
@@ -863,12 +900,15 @@ class Game:
 
         elif interrogate_choice.lower() == 'n':
             guess = input("Who do you believe commited the crime? : ")
+            accused = suspects.get(guess, guess)
             if guilty.lower() == guess.lower():
                 print("congratulations Detective you have found the suspect")
+                self.events.publish(CaseClosed(accused, True, False))
                 self.end_game()
             else:
                 print("unlucky detective you didnt find the suspect. the theif was"
                       "'Mr. Reginald (the butler)'")
+                self.events.publish(CaseClosed(accused, False, False))
                 self.end_game()
 
         else:
@@ -876,14 +916,11 @@ class Game:
                              f"{interrogate_choice}")
 
     def end_game(self):
-        # Find the scores from the individual games
-        haunted_game_score = self.game_scores["Haunted Mansion"]
-        rps_score = self.game_scores["Rock Paper Scissors"]
-        riddle_score = self.game_scores["Riddle"]
-
-        # Calculate the final total score
-        final_score = self.__score__() + haunted_game_score + rps_score + riddle_score
+        # Calculate the final total score, including every mini-game's score
+        final_score = self.__score__() + sum(self.game_scores.values())
 
+        # Deliver any batched events before the log is saved
+        self.events.flush()
         # log_filename = input("Please enter a filename to save the logs:")
         self.log.save_logs_to_file("log_file")
 
@@ -904,6 +941,7 @@ class Game:
         self.running = False
 
     def store_clues(self):
+        import json
         try:
             with open('user_data.json', 'r') as file:
                 user_data = json.load(file)
@@ -912,33 +950,9 @@ class Game:
 
         user_data[self.username]["name"] = self.player_name
 
-        user_data[self.username]["Location_clues"] = {
-            "CrimeScene": {
-                "All clues found": self.crime_scene.all_clues_found,
-                "Clues": self.crime_scene.review_clue(),
-                "Visited": self.crime_scene.visited
-            },
-            "Attic": {
-                "All clues found": self.attic.all_clues_found,
-                "Clues": self.attic.review_clue(),
-                "Visited": self.attic.visited
-            },
-            "Kitchen": {
-                "All clues found": self.kitchen.all_clues_found,
-                "Clues": self.kitchen.review_clue(),
-                "Visited": self.kitchen.visited
-            },
-            "Library": {
-                "All clues found": self.library.all_clues_found,
-                "Clues": self.library.review_clue(),
-                "Visited": self.library.visited
-            },
-            "Secret Passages": {
-                "All clues found": self.library.all_clues_found,
-                "Clues": self.secret_passages.review_clue(),
-                "Visited": self.secret_passages.visited
-            }
-        }
+        user_data[self.username]["Location_clues"] = \
+            self.locations.export_progress()
+        user_data[self.username]["Achievements"] = self.achievements.export()
 
         with open('user_data.json', 'w') as file:
             json.dump(user_data, file, indent=2)
@@ -0,0 +1,80 @@
+# game_state.py
+
+"""
+Game State Module
+
+Description:
+This Python module encodes the state of a game session canonically, so two
+sessions get the same key exactly when every answer from here on has the
+same effect on them. The explorer (explore.py) uses the keys to find every
+reachable state once, and the hint table (hints.py) uses them to look up the
+hint for the state a player is in.
+
+A key is made of the prompt the game is waiting on, without colour codes,
+and the state that decides what happens next: the started and interacted
+flags on Game, every location's visited flag and clues, every character's
+'_interacted' flag, 'doors_checker' and the inventory. The running score is
+not part of the key.
+
+Functions:
+1. state_key(game, prompt, solved): Returns the canonical encoding of a game state.
+2. state_digest(key): Returns the 8-byte digest of a state key, as an int.
+
+Usage:
+    digest = state_digest(state_key(game, MENU_PROMPT))
+
+Author: Haydens Little Helpers
+"""
+
+import hashlib
+import re
+
+_COLOURS = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def _characters(game):
+    yield from (game.witness, game.witness2, game.suspect, game.suspect2,
+                game.suspect3)
+    yield from game.npcs
+    yield from (game.kitchen.npc, game.attic.npc, game.library.npc)
+
+
+def state_key(game, prompt=None, solved=False):
+    """
+    Encode a game state canonically.
+
+    Parameters:
+    - game (Game): The game.
+    - prompt (str): The prompt it is waiting on, None once the game is over.
+    - solved (bool): Whether the culprit was found, for a game that is over.
+
+    Returns:
+    bytes: The encoded state. Clues and items are sorted, so the order they
+    were found in does not matter.
+    """
+    flags = (game.started, game.characters_interacted, game.npcs_interacted,
+             game.kitchen_npc_interacted, game.attic_npc_interacted,
+             game.library_npc_interacted, game.crime_scene.investigated,
+             *(location.visited for location in game.locations),
+             *(character._interacted for character in _characters(game)),
+             *game.doors_checker)
+    groups = [_COLOURS.sub("", prompt) if prompt is not None else f"game over {solved:d}",
+              "".join("1" if flag else "0" for flag in flags)]
+    for location in game.locations:
+        groups.append("\x1f".join([location.key, *sorted(location.review_clue())]))
+    groups.append("\x1f".join(sorted(item.name.casefold()
+                                     for item in game.inventory.items)))
+    return "\x1e".join(groups).encode()
+
+
+def state_digest(key):
+    """
+    Hash a state key.
+
+    Parameters:
+    - key (bytes): A key from 'state_key'.
+
+    Returns:
+    int: A 64-bit digest. Collisions are unlikely until billions of states.
+    """
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
@@ -0,0 +1,370 @@
+# hints.py
+
+"""
+Hint Table Module
+
+Description:
+This Python module builds and loads the hints shown when the player presses
+'h' at the main menu. For every state the main menu can be reached in, the
+hint is the shortest sequence of answers to the nearest clue the player has
+not found yet. A won mini-game counts too, since it reveals a clue in the
+secret passages. Once no more clues can be found, the hint is the shortest
+way to solve the case.
+
+The hints are worked out offline from the state graph of explore.py, by one
+backwards breadth first search per clue count, and written to 'hints.pack'
+together with the modification time of the newest content file and a
+fingerprint of the game logic the states come from: the source of the
+modules that define the prompts, the branching and the state keys. At
+runtime a hint is one dict lookup of the state's digest (see game_state.py).
+A table older than the content, or built from different game logic, is not
+used. Rebuild it with:
+    python hints.py [workers=4]
+
+File layout (little-endian):
+    header:  magic 'PMHT', version, hint count, state count, source mtime,
+             game logic fingerprint (uint64)
+    hints:   the byte length of every hint (uint32), then the UTF-8 text
+    states:  every menu state's digest (uint64), then its hint number (uint32)
+
+Classes:
+1. HintTable: The loaded hints, keyed by state digest.
+
+Functions:
+1. describe(decision, answer): Returns an instruction for giving an answer to a prompt.
+2. compute_hints(graph): Returns the hint for every main menu state of a StateGraph.
+3. game_logic_fingerprint(): Returns a digest of the game logic the hints depend on.
+4. write_hint_table(hints, source_mtime, output): Writes hints to a hint table file.
+5. build_hint_table(output, workers): Explores the game and writes its hint table.
+6. get_hint_table(): Returns the hint table if it is fresh, otherwise None.
+
+Author: Haydens Little Helpers
+"""
+
+import os
+import struct
+import threading
+from array import array
+
+HINT_FILE = "hints.pack"
+MAGIC = b"PMHT"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHxxIIqQ")
+
+# The modules whose code decides the prompts, the branching between them and
+# the state keys. Hints built from other versions of them may be wrong
+GAME_LOGIC_MODULES = ("game.py", "location.py", "mini_game_registry.py",
+                      "game_state.py", "simulate.py", "explore.py", "hints.py")
+
+# What to do for each answer, by the decision its prompt asks for
+_INSTRUCTIONS = {
+    "start": {"s": "start the game (S)"},
+    "menu": {"e": "explore the mansion (E)", "u": "use an item (U)",
+             "c": "conclude the investigation (C)"},
+    "path": {"1": "take the path upstairs (1)", "2": "take the path downstairs (2)"},
+    "room": {"k": "enter the Kitchen (K)", "l": "enter the Library (L)",
+             "a": "enter the Attic (A)", "d": "go to the crime scene (D)",
+             "b": "go back (B)"},
+    "chef": {"y": "talk to the chef (Y)"},
+    "girl": {"y": "talk to the girl (Y)"},
+    "librarian": {"y": "talk to the librarian (Y)"},
+    "kitchen": {"y": "explore the kitchen further (Y)", "n": "leave it (N)"},
+    "attic": {"y": "explore the attic further (Y)"},
+    "library": {"y": "explore the library further (Y)"},
+    "crime_scene": {"i": "interact with the characters (I)", "b": "go back (B)"},
+    "characters": {"1": "speak to the witnesses and the suspect (1)",
+                   "2": "speak to the other people in the room (2)"},
+    "outcome": {"win": "win its challenge"},
+    "interrogate": {"y": "interrogate the suspects (Y)",
+                    "n": "name the culprit without interrogating anyone (N)"},
+    "suspect": {"1": "interrogate Mr. Reginald (1)", "3": "interrogate the chef (3)"},
+    "confront": {"y": "confront Mr. Reginald (Y)"},
+    "accuse": {"1": "accuse Mr. Reginald (1)"},
+}
+
+
+def describe(decision, answer):
+    """
+    Describe an answer to a prompt as an instruction to the player.
+
+    Parameters:
+    - decision (str): The decision the prompt asks for, see simulate.DECISIONS.
+    - answer (str): The answer.
+
+    Returns:
+    str: The instruction, e.g. "enter the Kitchen (K)".
+    """
+    if decision == "door":
+        return "go back (B)" if answer == "b" else f"go through Hidden Passage({answer})"
+    if decision == "items":
+        return f"use the {answer}" if answer else "use nothing"
+    instruction = _INSTRUCTIONS.get(decision, {}).get(answer)
+    return instruction or f"answer '{answer}'"
+
+
+def _next_answers(graph, targets, states):
+    """
+    Find, for every state that can reach one of 'targets', which answer
+    starts a shortest path there. The search walks edges backwards and only
+    passes through 'states'.
+
+    Returns:
+    dict: State number -> the number of its answer that leads towards a target.
+    """
+    parents = {}
+    for state in states:
+        for answer, child in enumerate(graph.edges[state]):
+            parents.setdefault(child, []).append((state, answer))
+    next_answer = {}
+    queue = list(targets)
+    seen = set(queue)
+    for child in queue:  # the queue grows while it is walked
+        for state, answer in parents.get(child, ()):
+            if state not in seen:
+                seen.add(state)
+                next_answer[state] = answer
+                queue.append(state)
+    return next_answer
+
+
+def _path(graph, state, next_answer, done):
+    """Follow 'next_answer' from a state until 'done' holds, describing every answer."""
+    steps = []
+    while not done(state):
+        answer = next_answer[state]
+        steps.append(describe(graph.decisions[state], graph.options[state][answer]))
+        state = graph.edges[state][answer]
+    return steps
+
+
+def compute_hints(graph):
+    """
+    Work out the hint for every state in which the main menu is shown.
+
+    Parameters:
+    - graph (StateGraph): The complete graph from 'explore(keep_graph=True)'.
+
+    Returns:
+    dict: State digest -> hint text.
+    """
+    count = len(graph.decisions)
+    by_clues = {}
+    for state in range(count):
+        if not graph.terminal[state]:
+            by_clues.setdefault(graph.clue_counts[state], []).append(state)
+    solved = [state for state in range(count) if graph.solved[state]]
+    to_solve = _next_answers(graph, solved, range(count))
+
+    hints = {}
+    for clues_found, states in by_clues.items():
+        # Clues are never lost, so a path to a new clue only passes through
+        # states with the same number of clues
+        more = [state for state in range(count) if graph.clue_counts[state] > clues_found]
+        to_clue = _next_answers(graph, more, states)
+        for state in states:
+            if graph.decisions[state] != "menu":
+                continue
+            if state in to_clue:
+                steps = _path(graph, state, to_clue,
+                              lambda at: graph.clue_counts[at] > clues_found)
+                hint = "The nearest clue: " + ", then ".join(steps) + "."
+            elif state in to_solve:
+                steps = _path(graph, state, to_solve, lambda at: graph.terminal[at])
+                hint = ("There are no clues left to find. Solve the case: "
+                        + ", then ".join(steps) + ".")
+            else:
+                continue
+            hints[graph.digests[state]] = hint
+    return hints
+
+
+_fingerprint = None
+
+
+def game_logic_fingerprint():
+    """
+    Get a digest of the source of GAME_LOGIC_MODULES, as loaded by this process.
+
+    Returns:
+    int: A 64-bit fingerprint, stored in the hint table's header.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        import hashlib
+        digest = hashlib.blake2b(digest_size=8)
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for module in GAME_LOGIC_MODULES:
+            with open(os.path.join(directory, module), "rb") as file:
+                digest.update(file.read())
+        _fingerprint = int.from_bytes(digest.digest(), "little")
+    return _fingerprint
+
+
+def write_hint_table(hints, source_mtime, output=HINT_FILE):
+    """
+    Write hints to a hint table file.
+
+    Parameters:
+    - hints (dict): State digest -> hint text.
+    - source_mtime (int): The modification time of the newest content file, in ns.
+    - output (str): The filename to write the table to.
+
+    Returns:
+    int: The number of distinct hints written.
+    """
+    texts = {}
+    digests = array("Q")
+    numbers = array("I")
+    for digest, hint in sorted(hints.items()):
+        digests.append(digest)
+        numbers.append(texts.setdefault(hint, len(texts)))
+    encoded = [text.encode("utf-8") for text in texts]
+    lengths = array("I", (len(text) for text in encoded))
+    header = _HEADER.pack(MAGIC, VERSION, len(encoded), len(digests), source_mtime,
+                          game_logic_fingerprint())
+
+    # Write to a temporary file first so a running game never reads half a table
+    temporary = output + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(header + lengths.tobytes() + b"".join(encoded)
+                   + digests.tobytes() + numbers.tobytes())
+    os.replace(temporary, output)
+    return len(encoded)
+
+
+def build_hint_table(output=HINT_FILE, workers=None):
+    """
+    Explore the game's state space and write its hint table.
+
+    Parameters:
+    - output (str): The filename to write the table to.
+    - workers (int): Worker processes for the explorer, see 'explore'.
+
+    Returns:
+    int: The number of menu states with a hint.
+    """
+    from content import CONTENT_SOURCES
+    from explore import explore
+
+    newest = max(os.stat(filename).st_mtime_ns for filename, _ in CONTENT_SOURCES.values())
+    hints = compute_hints(explore(workers, keep_graph=True)["graph"])
+    write_hint_table(hints, newest, output)
+    return len(hints)
+
+
+class HintTable:
+    """The HintTable class holds the precomputed hints, looked up by the
+    digest of the game state they are for."""
+
+    __slots__ = ("filename", "source_mtime", "fingerprint", "_hints", "_states")
+
+    def __init__(self, filename=HINT_FILE):
+        """
+        Load a hint table.
+
+        Parameters:
+        - filename (str): The hint table file.
+
+        Returns:
+        None
+
+        Raises:
+        ValueError: If the file is not a hint table of a supported version.
+        """
+        self.filename = filename
+        with open(filename, "rb") as file:
+            data = file.read()
+        magic, version, hint_count, state_count, self.source_mtime, self.fingerprint = \
+            _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{filename} is not a version {VERSION} hint table")
+
+        offset = _HEADER.size
+        lengths = array("I", data[offset:offset + 4 * hint_count])
+        offset += 4 * hint_count
+        self._hints = []
+        for length in lengths:
+            self._hints.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        digests = array("Q", data[offset:offset + 8 * state_count])
+        offset += 8 * state_count
+        numbers = array("I", data[offset:offset + 4 * state_count])
+        self._states = dict(zip(digests, numbers))
+
+    def __len__(self):
+        return len(self._states)
+
+    def hint(self, digest):
+        """
+        Get the hint for a game state.
+
+        Parameters:
+        - digest (int): The state's digest, see game_state.state_digest.
+
+        Returns:
+        str: The hint, or None if the state is not in the table.
+        """
+        number = self._states.get(digest)
+        return None if number is None else self._hints[number]
+
+    def is_stale(self, filenames):
+        """
+        Check whether the game logic differs from the logic the table was
+        built from, or any of the content files changed after it was built.
+
+        Parameters:
+        - filenames (iterable): The content files.
+
+        Returns:
+        bool: True if the table should be rebuilt.
+        """
+        if self.fingerprint != game_logic_fingerprint():
+            return True
+        try:
+            return any(os.stat(name).st_mtime_ns > self.source_mtime
+                       for name in filenames)
+        except FileNotFoundError:
+            return True
+
+
+_table = None
+_table_version = None
+_table_lock = threading.Lock()
+
+
+def get_hint_table():
+    """
+    Get the hint table shared by every session, loading it again if it or
+    the content changed.
+
+    Returns:
+    HintTable: The table, or None if it is missing, older than the content or
+    built from different game logic.
+    """
+    global _table, _table_version
+    from content import CONTENT_SOURCES, content_version
+
+    try:
+        version = (content_version(), os.stat(HINT_FILE).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    if version != _table_version:
+        with _table_lock:
+            if version != _table_version:
+                try:
+                    table = HintTable(HINT_FILE)
+                except ValueError:
+                    table = None
+                sources = [filename for filename, _ in CONTENT_SOURCES.values()]
+                _table = None if table is None or table.is_stale(sources) else table
+                _table_version = version
+    return _table
+
+
+if __name__ == "__main__":
+    import sys
+
+    options = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+    count = build_hint_table(workers=int(options["workers"]) if "workers" in options else None)
+    print(f"Wrote {HINT_FILE} (hints for {count} states)")
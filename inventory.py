@@ -5,6 +5,10 @@ This module defines the Inventory class, which manages the player's inventory.
 
 Author: Sam Curran
 
+Items are indexed by their case-folded name and stacked, so picking up a second
+item with the same name adds to a quantity instead of storing another copy.
+Adding, using, removing and looking items up are all O(1).
+
 Usage:
     # Example usage of the Inventory class
     player_inventory = Inventory()
@@ -13,25 +17,122 @@ Usage:
     player_inventory.use_item("Clue from Suspect", game_instance)
 """
 
+
+class ItemStack:
+    """
+    An item held in the inventory and how many of it the player has.
+    """
+
+    __slots__ = ("item", "quantity")
+
+    def __init__(self, item, quantity):
+        self.item = item
+        self.quantity = quantity
+
+
 class Inventory:
     """
     The Inventory class manages the player's inventory.
     """
 
-    def __init__(self):
+    __slots__ = ("_stacks", "_count", "capacity")
+
+    def __init__(self, capacity=None):
         """
         Initialize an empty inventory.
+
+        :param capacity: The most items the inventory can hold, or None for no limit.
+        """
+        # Case-folded item name -> ItemStack, in the order items were first added
+        self._stacks = {}
+        self._count = 0
+        self.capacity = capacity
+
+    @property
+    def items(self):
+        """
+        List every item in the inventory, repeating stacked items.
+
+        The tuple is a read-only snapshot: use add_item and remove_item to
+        change the inventory.
+
+        :return: A tuple of items in the order they were added.
+        """
+        return tuple(stack.item for stack in self._stacks.values()
+                     for _ in range(stack.quantity))
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, item_name):
+        return item_name.casefold() in self._stacks
+
+    def get_item(self, item_name):
+        """
+        Look an item up by name, ignoring case.
+
+        :param item_name: The name of the item.
+        :return: The item, or None if the inventory does not hold it.
+        """
+        stack = self._stacks.get(item_name.casefold())
+        return stack.item if stack else None
+
+    def quantity(self, item_name):
+        """
+        Count how many of an item the inventory holds.
+
+        :param item_name: The name of the item.
+        :return: The size of the item's stack, 0 if there is none.
         """
-        self.items = []
+        stack = self._stacks.get(item_name.casefold())
+        return stack.quantity if stack else 0
 
-    def add_item(self, item):
+    def add_item(self, item, quantity=1):
         """
         Add an item to the inventory.
 
         :param item: The item to be added to the inventory.
+        :param quantity: How many of the item to add.
+        :return: True if the item was added, False if the inventory is full.
         """
-        self.items.append(item)
+        if self.capacity is not None and self._count + quantity > self.capacity:
+            print(f"Your inventory is full, you can't carry {item.name}.")
+            return False
+
+        key = item.name.casefold()
+        stack = self._stacks.get(key)
+        if stack:
+            stack.quantity += quantity
+        else:
+            self._stacks[key] = ItemStack(item, quantity)
+        self._count += quantity
         print(f"You added {item.name} to your inventory.")
+        return True
+
+    def remove_item(self, item_name, quantity=1):
+        """
+        Remove an item from the inventory without using it.
+
+        :param item_name: The name of the item to be removed.
+        :param quantity: How many of the item to remove.
+        :return: The removed item, or None if there were not enough of it.
+        """
+        key = item_name.casefold()
+        stack = self._stacks.get(key)
+        if stack is None or stack.quantity < quantity:
+            return None
+        stack.quantity -= quantity
+        self._count -= quantity
+        if not stack.quantity:
+            del self._stacks[key]
+        return stack.item
+
+    def clear(self):
+        """
+        Empty the inventory, e.g. when a game session is reset.
+        """
+        self._stacks.clear()
+        self._count = 0
 
     def use_item(self, item_name, game):
         """
@@ -40,19 +141,53 @@ class Inventory:
         :param item_name: The name of the item to be used.
         :param game: The game instance on which the item is used.
         """
-        item = next((item for item in self.items if item.name.lower() == item_name.lower()), None)
+        item = self.get_item(item_name)
         if item:
             item.use(game)
-            self.items.remove(item)
+            self.remove_item(item_name)
             print(f"{item.name} has been removed from your inventory.")
         else:
             print(f"You don't have {item_name} in your inventory.")
 
+    def use_items(self, item_names, game):
+        """
+        Use several items at once and add their points to the score in one update.
+
+        Nothing is used unless the inventory holds every requested item, so a
+        failed batch leaves both the inventory and the score unchanged.
+
+        :param item_names: The names of the items to use, as any iterable. A name may repeat to use more of a stack.
+        :param game: The game session whose score the items change.
+        :return: A list of ItemEffect records, one per item used.
+        :raises ValueError: If an item is missing or there are too few of it.
+        """
+        item_names = list(item_names)  # iterated more than once below
+        wanted = {}
+        for item_name in item_names:
+            key = item_name.casefold()
+            wanted[key] = wanted.get(key, 0) + 1
+        for item_name in item_names:
+            stack = self._stacks.get(item_name.casefold())
+            if stack is None:
+                raise ValueError(f"You don't have {item_name} in your inventory.")
+            if stack.quantity < wanted[item_name.casefold()]:
+                raise ValueError(f"You only have {stack.quantity} "
+                                 f"{stack.item.name} in your inventory.")
+
+        effects = [self._stacks[item_name.casefold()].item.effect()
+                   for item_name in item_names]
+        for key, quantity in wanted.items():
+            self.remove_item(key, quantity)
+        game.score += sum(effect.score_increase for effect in effects)
+        return effects
+
     def print_inventory(self):
         """Print all items in the player's inventory."""
-        if self.items:
+        if self._stacks:
             print("Items in your inventory:")
-            for item in self.items:
-                print(f"- {item.name}: {item.description}")
+            for stack in self._stacks.values():
+                item = stack.item
+                quantity = f" (x{stack.quantity})" if stack.quantity > 1 else ""
+                print(f"- {item.name}{quantity}: {item.description}")
         else:
-            print("Your inventory is empty.")
\ No newline at end of file
+            print("Your inventory is empty.")
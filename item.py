@@ -1,7 +1,15 @@
 """
 item.py
 
-This module defines the Item class, representing items that can impact the game.
+This module defines the Item class, representing items that can impact the game,
+and the ItemEffect record describing what using one did.
+
+Item definitions are loaded once from the story content into an ItemCatalog of
+shared ItemPrototype records. Each Item a player picks up only holds a
+reference to its prototype and its own per-instance state, so the names,
+descriptions and impact text are never copied per session. Setting 'name',
+'description', 'impact' or 'score_increase' gives that one item its own
+modified copy of the prototype, so other items are not affected.
 
 Author: Sam Curran, Hayden Carroll
 Date: 3/12
@@ -10,14 +18,32 @@ Usage:
     # Example usage of the Item class
     item = Item(name="Clue from Suspect", description="A crucial clue from a suspect.")
     item.use(game_instance)
+
+    # Items defined in story_data.json
+    letter = get_item_catalog().create("letter")
+    prototype = get_item_catalog().find("Letter")
 """
 
+import threading
+from collections import namedtuple
+
+ItemEffect = namedtuple("ItemEffect", ["name", "impact", "score_increase"])
+ItemEffect.__doc__ = """The result of using an item: its name, the impact text
+shown to the player and the points it is worth."""
+
+
+ItemPrototype = namedtuple("ItemPrototype",
+                           ["item_id", "name", "description", "impact", "score_increase"])
+ItemPrototype.__doc__ = """The shared, read-only definition of an item."""
+
 
 class Item:
     """
     The Item class represents an item that can impact the game.
     """
 
+    __slots__ = ("_prototype", "found_in")
+
     def __init__(self, name, description, impact, score_increase):
         """
         Initialize an Item with a name and description.
@@ -25,10 +51,72 @@ class Item:
         :param name: The name of the item.
         :param description: A brief description of the item.
         """
-        self.name = name
-        self.description = description
-        self.impact = impact
-        self.score_increase = score_increase
+        self._prototype = ItemPrototype(None, name, description, impact, score_increase)
+        self.found_in = None
+
+    @classmethod
+    def from_prototype(cls, prototype, found_in=None):
+        """
+        Create an item that shares a catalog prototype.
+
+        :param prototype: The ItemPrototype the item is an instance of.
+        :param found_in: The id of the location the item was found in, if any.
+        :return: A new Item.
+        """
+        item = cls.__new__(cls)
+        item._prototype = prototype
+        item.found_in = found_in
+        return item
+
+    @property
+    def prototype(self):
+        return self._prototype
+
+    @property
+    def item_id(self):
+        return self._prototype.item_id
+
+    @property
+    def name(self):
+        return self._prototype.name
+
+    @name.setter
+    def name(self, value):
+        # Copy the shared prototype rather than change it for every item
+        self._prototype = self._prototype._replace(name=value)
+
+    @property
+    def description(self):
+        return self._prototype.description
+
+    @description.setter
+    def description(self, value):
+        self._prototype = self._prototype._replace(description=value)
+
+    @property
+    def impact(self):
+        return self._prototype.impact
+
+    @impact.setter
+    def impact(self, value):
+        self._prototype = self._prototype._replace(impact=value)
+
+    @property
+    def score_increase(self):
+        return self._prototype.score_increase
+
+    @score_increase.setter
+    def score_increase(self, value):
+        self._prototype = self._prototype._replace(score_increase=value)
+
+    def effect(self):
+        """
+        Describe the item's impact without applying it.
+
+        :return: An ItemEffect for this item.
+        """
+        prototype = self._prototype
+        return ItemEffect(prototype.name, prototype.impact, prototype.score_increase)
 
     def use(self, game):
         """
@@ -39,3 +127,91 @@ class Item:
 
         print(self.impact)
         game.score += self.score_increase
+
+
+class ItemCatalog:
+    """
+    The ItemCatalog class holds one shared prototype per item definition,
+    indexed by id and by case-folded name.
+    """
+
+    __slots__ = ("_by_id", "_by_name")
+
+    def __init__(self, definitions):
+        """
+        Build a catalog from item definitions.
+
+        :param definitions: A mapping of item id to a dict with name, description,
+            impact and score_increase, as in the story content's "Items".
+        """
+        self._by_id = {}
+        self._by_name = {}
+        for item_id, definition in definitions.items():
+            prototype = ItemPrototype(item_id, definition["name"],
+                                      definition["description"],
+                                      definition["impact"],
+                                      definition["score_increase"])
+            self._by_id[item_id] = prototype
+            self._by_name[prototype.name.casefold()] = prototype
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __contains__(self, item_id):
+        return item_id in self._by_id
+
+    def get(self, item_id):
+        """
+        Look a prototype up by its id.
+
+        :param item_id: The item's key in the content.
+        :return: The ItemPrototype.
+        :raises KeyError: If no item has this id.
+        """
+        return self._by_id[item_id]
+
+    def find(self, name):
+        """
+        Look a prototype up by its display name, ignoring case.
+
+        :param name: The name of the item.
+        :return: The ItemPrototype, or None if no item has this name.
+        """
+        return self._by_name.get(name.casefold())
+
+    def create(self, item_id, found_in=None):
+        """
+        Create a new item instance from a prototype.
+
+        :param item_id: The item's key in the content.
+        :param found_in: The id of the location the item was found in, if any.
+        :return: A new Item sharing the catalog's prototype.
+        :raises KeyError: If no item has this id.
+        """
+        return Item.from_prototype(self._by_id[item_id], found_in)
+
+
+_catalog = None
+_catalog_version = None
+_catalog_lock = threading.Lock()
+
+
+def get_item_catalog():
+    """
+    Get the item catalog shared by every session, rebuilding it if the content changed.
+
+    :return: The ItemCatalog for the current story content.
+    """
+    global _catalog, _catalog_version
+    from content import content_version, get_story_data
+
+    version = content_version()
+    if version != _catalog_version:
+        with _catalog_lock:
+            if version != _catalog_version:
+                _catalog = ItemCatalog(get_story_data()["Items"])
+                _catalog_version = version
+    return _catalog
@@ -20,10 +20,9 @@ Note: This module does not handle saving changes back to a file; additional func
 """
 
 
-import json
-
-
 class Leaderboard:
+    __slots__ = ("_scores",)
+
     def __init__(self):
         """
         Initialize an empty leaderboard.
@@ -73,6 +72,8 @@ class Leaderboard:
         Returns:
         Leaderboard: A new instance of the Leaderboard class with data loaded from the file.
         """
+        import json  # deferred so a leaderboard-only run stays light
+
         leaderboard = Leaderboard()
         user_data = {}  # Initialize an empty dictionary
         try:
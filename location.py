@@ -14,7 +14,14 @@ location with additional properties related to investigation. 3. Kitchen:
 Represents a kitchen location with a specific number of clues and an NPC
 character. 4. Library: Represents a library location with a specific number
 of clues and an NPC character. 5. Attic: Represents an attic location with a
-specific number of clues and an NPC character.
+specific number of clues and an NPC character. 6. LocationRegistry: Holds a
+session's locations by id so scoring, reviewing and saving progress work over
+all of them in one pass.
+
+Clues are kept in a ClueStore (see clues.py). Pass the same store to every
+location in a session so all of its clues live, deduplicated, in one place.
+Saved progress is applied lazily: a location only loads its saved clues the
+first time its clues or status are used.
 
 Usage:
 - Import this module into your Python program to use the Location, CrimeScene, Kitchen, Library, and Attic classes.
@@ -23,17 +30,25 @@ Author: Hayden Carroll
 Date: 27/11/2023
 """
 
-from character import NPC
-import json
+from character import character_from_definition
+from itertools import chain
+from clues import ClueStore, get_clue_dictionary
+from content import get_story_data
 
 
 class Location:
-    def __init__(self, number_of_clues):
+    # Slotted to keep per-session memory small; subclasses add their own slots
+    __slots__ = ("_visited", "_all_clues_found", "number_of_clues_to_find",
+                 "key", "_clue_store", "_saved_progress", "_load_error")
+
+    def __init__(self, number_of_clues, key="Location", clue_store=None):
         """
         Initialize a Location instance.
 
         Parameters:
         - number_of_clues (int): The total number of clues available in the location.
+        - key (str): The id the location's clues are stored under.
+        - clue_store (ClueStore): The session's shared clue store. A private one is created if omitted.
 
         Returns:
         None
@@ -41,8 +56,56 @@ class Location:
         self._visited = False
         self._all_clues_found = False
         self.number_of_clues_to_find = number_of_clues
-        self.__clues = []
-        self.clues_found = len(self.__clues)
+        self.key = key
+        self._clue_store = clue_store if clue_store is not None else ClueStore()
+        self._saved_progress = None
+        self._load_error = None
+
+    def _load_saved_progress(self):
+        """Apply progress staged by import_past_progress, if it has not been applied yet.
+
+        If the saved clue ids can't be decoded the progress stays staged, the
+        player is told once, and export_progress saves it back unchanged."""
+        location_data = self._saved_progress
+        if location_data is None or self._load_error is not None:
+            return
+        if callable(location_data):
+            location_data = self._saved_progress = location_data()
+        if "Clue ids" in location_data:
+            try:
+                clues = get_clue_dictionary().decode(location_data["Clue ids"])
+            except ValueError as error:
+                self._load_error = error
+                print(f"Your saved clues for {self.key} could not be loaded "
+                      f"and will be kept as they are: {error}")
+                return
+        else:
+            clues = location_data["Clues"]  # saved before clue ids were used
+        self._saved_progress = None
+        for clue in clues:
+            self._clue_store.add(self.key, clue)
+        self._all_clues_found = location_data["All clues found"]
+
+    @property
+    def progress_loaded(self):
+        """
+        Check whether saved progress has been applied to the location.
+
+        Returns:
+        bool: False while saved progress is still waiting to be loaded.
+        """
+        return self._saved_progress is None
+
+    @property
+    def clues_found(self):
+        """
+        Get the number of distinct clues found in the location.
+
+        Returns:
+        int: The clue count, read from the clue store in O(1).
+        """
+        self._load_saved_progress()
+        return self._clue_store.count(self.key)
 
     @property
     def visited(self):
@@ -78,6 +141,7 @@ class Location:
         Returns:
         bool: True if all clues have been found, False otherwise.
         """
+        self._load_saved_progress()
         return self._all_clues_found
 
     @all_clues_found.setter
@@ -91,31 +155,51 @@ class Location:
         Returns:
         None
         """
+        self._load_saved_progress()
         if isinstance(value, bool):
             self._all_clues_found = value
         else:
             print("Variable is expected to be a boolean.")
 
-    def add_clue(self, clue):
+    def reset(self):
         """
-        Add a clue to the location.
+        Restore the location to how a new game session finds it. Its clues
+        are kept in the clue store, which is cleared by the registry.
+
+        Returns:
+        None
+        """
+        self._visited = False
+        self._all_clues_found = False
+        self._saved_progress = None
+        self._load_error = None
+        npc = getattr(self, "npc", None)
+        if npc is not None:
+            npc.reset()
+
+    def add_clue(self, clue, category="evidence"):
+        """
+        Add a clue to the location. Clues already found here are ignored.
 
         Parameters:
         - clue (str): The clue to add to the location.
+        - category (str): The kind of clue, e.g. 'evidence' or 'testimony'.
 
         Returns:
-        None
+        bool: True if the clue was new.
         """
-        self.__clues.append(clue)
+        self._load_saved_progress()
+        return self._clue_store.add(self.key, clue, category)
 
     def review_clue(self):
         """
         Retrieve all clues in the location.
 
         Returns:
-        list: A list of clues available in the location.
+        ClueView: A live view of the clues found in the location, in the order they were found.
         """
-        return self.__clues
+        self._load_saved_progress()
+        return self._clue_store.location(self.key)
 
     @property
     def interacted(self):
@@ -142,16 +226,54 @@ class Location:
         return {self.npc.action}
 
     def import_past_progress(self, loaction_data):
-        for clues in loaction_data["Clues"]:
-            self.__clues.append(clues)
-        self.all_clues_found = loaction_data["All clues found"]
+        """
+        Stage saved progress for the location. It is applied on first access,
+        e.g. when the player enters the room or reviews their clues.
+
+        Parameters:
+        - loaction_data (dict or callable): The saved location entry, or a function that returns it.
+
+        Returns:
+        None
+        """
+        self._saved_progress = loaction_data
+
+    def export_progress(self, clue_dictionary=None):
+        """
+        Get the location's progress in the format saved to 'user_data.json'.
+
+        Parameters:
+        - clue_dictionary (ClueDictionary): Maps clues to their saved ids. Defaults to the shared one.
+
+        Returns:
+        dict: The location's clue ids, visited status and all_clues_found status.
+        """
+        if clue_dictionary is None:
+            clue_dictionary = get_clue_dictionary()
+        if self._load_error is not None:
+            # Save the ids that could not be loaded back with the new clues,
+            # so a missing or stale clue dictionary doesn't erase them
+            saved = self._saved_progress
+            new_ids = clue_dictionary.encode(self.review_clue())
+            return {
+                "All clues found": saved["All clues found"] or self._all_clues_found,
+                "Clue ids": list(dict.fromkeys([*saved["Clue ids"], *new_ids])),
+                "Visited": self.visited
+            }
+        return {
+            "All clues found": self.all_clues_found,
+            "Clue ids": clue_dictionary.encode(self.review_clue()),
+            "Visited": self.visited
+        }
 
 
 class CrimeScene(Location):
-    def __init__(self, name):
-        super().__init__(number_of_clues=28)
+    __slots__ = ("__investigated", "name")
+
+    def __init__(self, name, clue_store=None):
+        super().__init__(number_of_clues=28, key="CrimeScene",
+                         clue_store=clue_store)
         self.__investigated = False
-        self.__clues = []
         self.name = name
 
     @property
@@ -165,35 +287,176 @@ class CrimeScene(Location):
         else:
             print("investigated is expected to be a boolean.")
 
+    def reset(self):
+        super().reset()
+        self.__investigated = False
+
     def interact_with_npcs(self):
         pass
 
 
 class Kitchen(Location):
-    def __init__(self):
-        super().__init__(3)
+    __slots__ = ("npc",)
+
+    def __init__(self, clue_store=None):
+        super().__init__(3, key="Kitchen", clue_store=clue_store)
         self._visited = False
         self._all_clues_found = False
-        self.npc = NPC("Smelly Chef", "Get out of my Kitchen",
-                       " looks at you with disgust and then goes back to "
-                       "cooking", 69)
+        self.npc = character_from_definition(
+            get_story_data()["Characters"]["kitchen_chef"])
 
 
 class Library(Location):
-    def __init__(self):
-        super().__init__(3)
+    __slots__ = ("npc",)
+
+    def __init__(self, clue_store=None):
+        super().__init__(3, key="Library", clue_store=clue_store)
         self.visited = False
         self.all_clues_found = False
-        self.npc = NPC("Librarian", "I heard footsteps in the attic late "
-                                    "lastnight", "Goes back to"
-                                             "reading", 50)
+        self.npc = character_from_definition(
+            get_story_data()["Characters"]["librarian"])
 
 
 class Attic(Location):
-    def __init__(self):
-        super().__init__(3)
+    __slots__ = ("npc",)
+
+    def __init__(self, clue_store=None):
+        super().__init__(3, key="Attic", clue_store=clue_store)
         self.visited = False
         self.all_clues_found = False
+        self.npc = character_from_definition(
+            get_story_data()["Characters"]["laura"])
+
 
-        self.npc = NPC("Laura", "Hello. Have you solved the mystery yet?"
-                       , "Goes back to writing her journal", 15)
+class LocationRegistry:
+    """The LocationRegistry class holds every location in a game session,
+    keyed by id and kept in the order they were registered."""
+
+    __slots__ = ("clue_store", "_locations", "_scored")
+
+    def __init__(self, clue_store=None):
+        """
+        Initialize an empty LocationRegistry.
+
+        Parameters:
+        - clue_store (ClueStore): The store shared by the registered locations. A new one is created if omitted.
+
+        Returns:
+        None
+        """
+        self.clue_store = clue_store if clue_store is not None else ClueStore()
+        self._locations = {}
+        self._scored = {}
+
+    def register(self, location, scored=True):
+        """
+        Add a location to the registry under its key.
+
+        Parameters:
+        - location (Location): The location to register. It should use the registry's clue store.
+        - scored (bool): Whether the location's clues count towards the player's score.
+
+        Returns:
+        Location: The registered location, so it can be assigned in one step.
+        """
+        if location.key in self._locations:
+            raise ValueError(f"A location with id {location.key!r} is already registered")
+        self._locations[location.key] = location
+        self._scored[location.key] = scored
+        return location
+
+    def __getitem__(self, key):
+        return self._locations[key]
+
+    def __contains__(self, key):
+        return key in self._locations
+
+    def __iter__(self):
+        return iter(self._locations.values())
+
+    def __len__(self):
+        return len(self._locations)
+
+    def reset(self):
+        """
+        Restore every registered location, and the clue store, to how a new
+        game session finds them.
+
+        Returns:
+        None
+        """
+        self.clue_store.clear()
+        for location in self:
+            location.reset()
+
+    def is_scored(self, key):
+        """
+        Check whether a location's clues count towards the player's score.
+
+        Parameters:
+        - key (str): The id of the location.
+
+        Returns:
+        bool: True if the location is registered as scored.
+        """
+        return self._scored.get(key, False)
+
+    def clue_score(self):
+        """
+        Count the clues found in every scored location.
+
+        Returns:
+        int: One point per clue.
+        """
+        return sum(location.clues_found for key, location in
+                   self._locations.items() if self._scored[key])
+
+    def has_clues(self):
+        """
+        Check whether any clue has been found in any location.
+
+        Returns:
+        bool: True if there is at least one clue to review.
+        """
+        return any(location.clues_found for location in self)
+
+    def all_clues(self):
+        """
+        Iterate over the clues of every location, location by location.
+
+        Returns:
+        iterator: Clue text in registration, then discovery, order.
+        """
+        return chain.from_iterable(location.review_clue() for location in self)
+
+    def export_progress(self, clue_dictionary=None):
+        """
+        Get the progress of every location, keyed by location id.
+
+        Parameters:
+        - clue_dictionary (ClueDictionary): Maps clues to their saved ids. Defaults to the shared one.
+
+        Returns:
+        dict: The 'Location_clues' section saved to 'user_data.json'.
+        """
+        return {key: location.export_progress(clue_dictionary)
+                for key, location in self._locations.items()}
+
+    def import_progress(self, location_clues):
+        """
+        Stage saved progress for every registered location in one pass.
+        Each location loads its part the first time it is used.
+
+        Parameters:
+        - location_clues (dict): The saved 'Location_clues' section, keyed by location id.
+
+        Returns:
+        list: The ids of registered locations that had no saved progress.
+        """
+        missing = []
+        for key, location in self._locations.items():
+            if key in location_clues:
+                location.import_past_progress(location_clues[key])
+            else:
+                missing.append(key)
+        return missing
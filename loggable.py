@@ -15,6 +15,12 @@ Usage:
     logger.log("Log entry 1")
     logger.log("Log entry 2")
 
+    # Or log the events published on a game's event bus
+    bus.subscribe(logger.log_events)
+
+    # Start over with no logs
+    logger.clear()
+
     # Get logs
     all_logs = logger.logs
 
@@ -23,6 +29,8 @@ Usage:
 """
 
 class Loggable:
+    __slots__ = ("_logs",)
+
     def __init__(self):
         self._logs = []
 
@@ -35,6 +43,21 @@ class Loggable:
         if isinstance(message, str):
             self._logs.append(message)
 
+    def log_events(self, events):
+        """
+        Log a batch of game events, as a subscriber of the game's event bus.
+
+        :param events: Events with a 'message', see events.py.
+        """
+        for event in events:
+            self.log(event.message)
+
+    def clear(self):
+        """
+        Remove every log entry, e.g. when a game session is reset.
+        """
+        self._logs.clear()
+
     @property
     def logs(self):
         """
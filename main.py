@@ -11,19 +11,22 @@ Description:
     - It initializes an instance of the Game class, runs the game, and then creates an empty Leaderboard instance.
     - The script loads a leaderboard from the "user_data.json" file and saves it to the Leaderboard instance.
     - It retrieves the top players from the leaderboard and prints their names and scores.
+    - Modules are imported only when they are needed, so a leaderboard-only run never loads the game.
 
 Usage:
     - Ensure the 'game.py' and 'leaderboard.py' files are in the same directory.
     - Run this script to play the game, load the leaderboard, and display top players.
+    - python main.py --leaderboard        only display the top players
+    - python main.py --profile-startup    report how long each module takes to import
+    - python main.py --seed 1234          replay a session with the seed from its log
 """
 
-from game import Game
-from leaderboard import Leaderboard
+import sys
 
-if __name__ == "__main__":
 
-    game = Game()
-    game.run()
+def show_leaderboard():
+    from leaderboard import Leaderboard
+
     game_leaderboard = Leaderboard()  # creates a new empty instance of
     # leaderboard class
     game_leaderboard = game_leaderboard.load_leaderboard("user_data.json")
@@ -34,3 +37,78 @@ if __name__ == "__main__":
     for player, score in top_players:
 
         print(f"{player}: {score}")
+
+
+def profile_startup(module="game", top=15):
+    """
+    Report the import time of every module loaded before the first prompt.
+
+    Parameters:
+    - module (str): The module to import, as the game does on startup.
+    - top (int): How many of the slowest modules to list.
+
+    Returns:
+    list: (module name, self time in ms, cumulative time in ms) tuples, slowest first.
+    """
+    import subprocess
+
+    # '-X importtime' makes a fresh interpreter report every import on stderr
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                             f"import {module}"],
+                            capture_output=True, text=True, check=True)
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append((name.strip(), int(self_us) / 1000,
+                        int(cumulative_us) / 1000))
+
+    total = sum(self_ms for _, self_ms, _ in timings)
+    timings.sort(key=lambda timing: timing[1], reverse=True)
+    print(f"Importing '{module}' loaded {len(timings)} modules in {total:.1f} ms")
+    print(f"{'self (ms)':>10} {'cumulative (ms)':>16}  module")
+    for name, self_ms, cumulative_ms in timings[:top]:
+        print(f"{self_ms:>10.2f} {cumulative_ms:>16.2f}  {name}")
+    return timings
+
+
+def parse_args(args=None):
+    """
+    Parse the command line.
+
+    Parameters:
+    - args (list): The arguments to parse. Default is sys.argv[1:].
+
+    Returns:
+    argparse.Namespace: 'leaderboard', 'profile_startup' and 'seed' (None for a fresh seed).
+    A usage message is printed and the script exits if the arguments are invalid.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play the mansion mystery game.")
+    parser.add_argument("--leaderboard", action="store_true",
+                        help="only display the top players")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report how long each module takes to import")
+    parser.add_argument("--seed", type=int, metavar="SEED",
+                        help="replay a session with the seed from its log")
+    return parser.parse_args(args)
+
+
+if __name__ == "__main__":
+    options = parse_args()
+
+    if options.profile_startup:
+        profile_startup()
+    elif options.leaderboard:
+        show_leaderboard()
+    else:
+        from game import Game
+
+        game = Game(options.seed)
+        # Load the precomputed hints now rather than when 'h' is first pressed
+        from hints import get_hint_table
+        get_hint_table()
+        game.run()
+        show_leaderboard()
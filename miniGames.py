@@ -18,39 +18,70 @@ Author: Jamie, Sam Courtney, Finn and Hayden
 Date: 01/12/2023
 
 Note: Make sure to have the 'game_data.json' file available for the HauntedMansionGame and Riddle classes.
+The file is read through the shared cache in content.py rather than once per instance.
+Secret words come from the word pack in word_pack.py when one has been built.
 """
 
 import random
-import json
+from riddle_index import get_riddle_index
+from rps_predictor import BEATS, DRAW, MOVE_IDS, MOVES, OUTCOMES, WIN, MovePredictor
+from word_pack import get_words, letter_mask, mask_letters
+from word_solver import evaluate_guess
 
 
 class HauntedMansionGame:
-    def __init__(self, max_attempts=6):
+    def __init__(self, max_attempts=6, word_length=None, difficulty=None, rng=None,
+                 secret_word=None):
         """
         Initialize a HauntedMansionGame instance.
 
         Parameters:
-        - secret_word (str): The secret word to be guessed.
+        - secret_word (str): The secret word to be guessed. Default is a random word.
         - max_attempts (int): The maximum number of attempts allowed for guessing the word. Default is 6.
+        - word_length (int): Only pick secret words of this length. Default is any length.
+        - difficulty (int): Only pick secret words of this difficulty (see word_pack.py). Default is any.
+        - rng (random.Random): The random number generator used to pick the word. Default is the 'random' module.
 
         Returns:
         None
         """
-        self.secret_word = self.get_random_word()
+        self.word_length = word_length
+        self.difficulty = difficulty
+        self.rng = rng
+        self.secret_word = secret_word.lower() if secret_word else self.get_random_word()
         self.max_attempts = max_attempts
         self.remaining_attempts = max_attempts
-        self.guessed_letters = set()
+        # Letters are tracked as bitmasks (bit 0 is 'a'), see word_solver.py
+        self._word_mask = letter_mask(self.secret_word)
+        self._guessed_mask = 0
+        self._excluded_mask = 0
+        self._display = None
+        self._display_mask = None
+
+    @property
+    def guessed_letters(self):
+        """The set of letters the player has guessed or found so far."""
+        return set(mask_letters(self._guessed_mask))
+
+    @guessed_letters.setter
+    def guessed_letters(self, letters):
+        self._guessed_mask = letter_mask(letters)
 
     def display_word(self):
         """
         Display the current state of the secret word, revealing guessed letters and hiding others.
+        The string is only rebuilt when a new letter of the word has been found.
 
         Returns:
         str: The formatted secret word display.
         """
-        return ' '.join(
-            letter if letter in self.guessed_letters else '_' for letter in
-            self.secret_word)
+        revealed = self._guessed_mask & self._word_mask
+        if revealed != self._display_mask:
+            self._display = ' '.join(
+                letter if revealed >> (ord(letter) - 97) & 1 else '_' for letter in
+                self.secret_word)
+            self._display_mask = revealed
+        return self._display
 
     def check_guess(self, guess):
         """
@@ -63,9 +94,9 @@ class HauntedMansionGame:
         None
         """
         guess = guess.lower()
-        if len(guess) == 1 and guess.isalpha():
+        if len(guess) == 1 and guess.isascii() and guess.isalpha():
             return self.check_letter(guess)
-        elif len(guess) == len(self.secret_word) and guess.isalpha():
+        elif len(guess) == len(self.secret_word) and guess.isascii() and guess.isalpha():
             return self.check_word(guess)
         else:
             print("Please enter a valid single letter or a complete word.")
@@ -81,16 +112,19 @@ class HauntedMansionGame:
         Returns:
         int or None: Returns 1 if the guessed letter is correct, None otherwise.
         """
-        if guess in self.guessed_letters:
+        guess_mask = letter_mask(guess)
+        if self._guessed_mask & guess_mask:
             print("You already guessed that letter.")
         else:
-            self.guessed_letters.add(guess)
+            self._guessed_mask, hits, won = evaluate_guess(
+                self._word_mask, self._guessed_mask, guess_mask)
             self.remaining_attempts -= 1
-            if guess not in self.secret_word:
+            if not hits:
+                self._excluded_mask |= guess_mask
                 print(f"'{guess}' is not in the word.")
             else:
                 print(f"'{guess}' is in the word.")
-                if self.is_winner():
+                if won:
                     return 1  # User wins if they guessed the entire word
         return 0  # User did not win
 
@@ -105,14 +139,16 @@ class HauntedMansionGame:
         None
         """
         if guess == self.secret_word:
-            self.guessed_letters = set(self.secret_word)
+            self._guessed_mask |= self._word_mask
             return 1  # User wins if they guessed the entire word
         else:
-            correct_letters = set(letter for letter in guess if letter in self.secret_word)
+            guess_mask = letter_mask(guess)
+            correct_letters = guess_mask & self._word_mask
+            self._excluded_mask |= guess_mask & ~self._word_mask
 
             if correct_letters:
-                self.guessed_letters.update(correct_letters)
-                print(f"Correct letters: {', '.join(correct_letters)}")
+                self._guessed_mask |= correct_letters
+                print(f"Correct letters: {', '.join(mask_letters(correct_letters))}")
             else:
                 self.remaining_attempts -= 1
                 print(f"Incorrect word guess. You have {self.remaining_attempts} guesses remaining. Choose carefully.")
@@ -126,7 +162,19 @@ class HauntedMansionGame:
         Returns:
         bool: True if the user has guessed the entire word, False otherwise.
         """
-        return set(self.secret_word) == self.guessed_letters
+        return not self._word_mask & ~self._guessed_mask
+
+    def hint(self):
+        """
+        Ask the solver for the best next guess over the whole word dictionary.
+
+        Returns:
+        Hint: The suggested letter or word, or None if the solver has no suggestion.
+        """
+        from word_solver import get_word_solver
+
+        solver = get_word_solver(len(self.secret_word))
+        return solver.suggest(self._guessed_mask, self._excluded_mask, self.display_word())
 
     def is_game_over(self):
         """
@@ -139,24 +187,27 @@ class HauntedMansionGame:
 
     def get_random_word(self):
         """
-        Get a random word from the 'Secret_words' list in 'game_data.json'.
+        Get a random word from the word pack, or the 'Secret_words' list in 'game_data.json'.
 
         Returns:
         str: A random word.
         """
         try:
-            with open('game_data.json', 'r') as file:
-                game_data = json.load(file)
-
-            secret_words = game_data.get("Secret_words", [])
-            if secret_words:
-                return random.choice(secret_words).lower()  # Convert to lowercase for case-insensitive comparison
-            else:
-                print("No secret words found in 'game_data.json'.")
-                return ""
+            words = get_words()
         except FileNotFoundError:
             print("'game_data.json' not found.")
             return ""
+        except ValueError as error:
+            # e.g. an empty or malformed 'Secret_words' list
+            print(f"The secret words in 'game_data.json' can't be used: {error}")
+            return ""
+
+        secret_word = words.random_word(self.word_length, self.difficulty, self.rng)
+        if secret_word:
+            return secret_word  # Words are stored lowercase for case-insensitive comparison
+        else:
+            print("No secret words found in 'game_data.json'.")
+            return ""
 
     def play_haunted_mansion_game(self):
         """
@@ -166,11 +217,24 @@ class HauntedMansionGame:
         int: 1 if the user wins, 0 if the game is lost.
         """
         print("Welcome to the Haunted Mansion!\nCan you guess the secret word?")
-        print(f"You have {self.max_attempts} attempts.")
+        print(f"You have {self.max_attempts} attempts. Enter '?' for a hint, it costs one attempt.")
         print(self.display_word())
 
         while not self.is_game_over():
             guess = input("Enter your guess: ")
+            if guess.strip() == "?":
+                hint = self.hint()
+                if hint is None:
+                    # Only a hint that is given costs an attempt
+                    print("The spirits have no idea either.")
+                    continue
+                self.remaining_attempts -= 1
+                if hint.is_word:
+                    print(f"The spirits whisper: try the word '{hint.guess}'.")
+                else:
+                    print(f"The spirits whisper: try the letter '{hint.guess}' "
+                          f"({hint.candidates} words are still possible).")
+                continue
             result = self.check_guess(guess)
             print(self.display_word())
 
@@ -183,15 +247,23 @@ class HauntedMansionGame:
 
 
 class RockPaperScissors:
-    def __init__(self):
+    def __init__(self, opponent="random", rng=None):
         """
         Initialize a RockPaperScissors instance.
 
+        Parameters:
+        - opponent (str): "random" for a computer that picks at random, or "adaptive"
+          for one that learns the player's habits (see rps_predictor.py).
+        - rng (random.Random): The random number generator the computer uses. Default is the 'random' module.
+
         Returns:
         None
         """
-        self.choices = ["rock", "paper", "scissors"]
+        self.choices = list(MOVES)
         self.attempts = 3
+        self.opponent = opponent
+        self.rng = rng
+        self.predictor = MovePredictor(order=1, rng=rng) if opponent == "adaptive" else None
 
     def get_user_choice(self):
         """
@@ -210,12 +282,28 @@ class RockPaperScissors:
 
     def get_computer_choice(self):
         """
-        Get the computer's random choice for Rock, Paper, or Scissors.
+        Get the computer's choice for Rock, Paper, or Scissors. An adaptive
+        computer plays whatever beats the player's predicted move.
 
         Returns:
         str: The computer's choice.
         """
-        return random.choice(self.choices)
+        if self.predictor is not None:
+            return MOVES[BEATS[self.predictor.predict()]]
+        return (self.rng or random).choice(self.choices)
+
+    def record_user_choice(self, user_choice):
+        """
+        Let an adaptive computer learn from the user's choice.
+
+        Parameters:
+        - user_choice (str): The user's choice.
+
+        Returns:
+        None
+        """
+        if self.predictor is not None:
+            self.predictor.update(MOVE_IDS[user_choice])
 
     def determine_winner(self, user_choice, computer_choice):
         """
@@ -228,12 +316,11 @@ class RockPaperScissors:
         Returns:
         bool: True if the user wins, False otherwise.
         """
-        if user_choice == computer_choice:
+        outcome = OUTCOMES[MOVE_IDS[user_choice]][MOVE_IDS[computer_choice]]
+        if outcome == DRAW:
             print("Draw!!")
             return False
-        elif (user_choice == "rock" and computer_choice == "scissors") or \
-                (user_choice == "paper" and computer_choice == "rock") or \
-                (user_choice == "scissors" and computer_choice == "paper"):
+        elif outcome == WIN:
             print("You win!")
             return True
         else:
@@ -252,6 +339,7 @@ class RockPaperScissors:
         while self.attempts > 0:
             user_choice = self.get_user_choice()
             computer_choice = self.get_computer_choice()
+            self.record_user_choice(user_choice)
             print(f"You chose {user_choice}. I chose {computer_choice}.")
             result = self.determine_winner(user_choice, computer_choice)
             if result:
@@ -263,32 +351,46 @@ class RockPaperScissors:
 
 
 class Riddle:
-    def __init__(self):
-        self.riddles_and_answers = self.load_riddles_and_answers()
+    def __init__(self, rng=None):
+        self.index = get_riddle_index()
+        self.rng = rng
         self.current_riddle = None  # Store the current riddle
-
-    def load_riddles_and_answers(self):
-        with open("game_data.json", "r") as file:
-            data = json.load(file)
-        return data
+        self._current = None  # and its position in the riddle index
 
     def print_riddle(self):
         """
-                Selects a riddle at random from a list
+                Selects a riddle at random from the riddle index
                 and displays it to the user
         """
-        self.current_riddle = random.choice(list(self.riddles_and_answers["Riddles"].keys()))
+        self._current = self.index.random_riddle(self.rng)
+        self.current_riddle = self.index.question(self._current)
         print(self.current_riddle)
 
     @property
     def get_answer(self):
-        return self.riddles_and_answers["Riddles"].get(self.current_riddle, "")
+        if self._current is None:
+            return ""
+        return self.index.answer(self._current)
+
+    def check_answer(self, guess):
+        """
+        Check the player's answer to the current riddle. Articles, spacing,
+        aliases from 'game_data.json' and small typos are all accepted.
+
+        Parameters:
+        - guess (str): The player's answer.
+
+        Returns:
+        bool: True if the answer is correct.
+        """
+        return self._current is not None and self.index.check(self._current, guess)
 
 
 class MiniGameCounter:
-    def __init__(self):
+    def __init__(self, total=3):
         self.counter = 1
+        self.total = total  # the number of registered mini-games
 
     def display_counter(self):
-        print(f"You have completed {self.counter} / 3 mini-games")
+        print(f"You have completed {self.counter} / {self.total} mini-games")
         self.counter += 1
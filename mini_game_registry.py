@@ -0,0 +1,176 @@
+# mini_game_registry.py
+
+"""
+Mini-Game Registry Module
+
+Description:
+This Python module keeps the registry of mini-games played behind the hidden
+passage doors. Each mini-game registers a factory that builds a fresh
+instance for a game session, a play hook that runs it, a scoring hook and its
+metadata (title, door number and the clue it rewards). The Game builds its
+doors, score table and completion counter from the registry and only creates
+a mini-game when its door is opened, dropping it again once it is played.
+
+The mini-game classes themselves live in miniGames.py and are only imported
+by the factories, so sessions that never open a door never load them.
+
+Classes:
+1. MiniGame: The registered metadata and hooks of one mini-game.
+2. MiniGameRegistry: The mini-games, ordered by door.
+
+Usage:
+- Register a new mini-game with a door and a matching 'doorN_challenge' and
+  'doorN_reward' text in story_data.json:
+    MINI_GAMES.register("quiz", "Quiz", 4, factory, play, clue="...")
+
+Author: Haydens Little Helpers
+"""
+
+from collections import namedtuple
+
+MiniGame = namedtuple("MiniGame", ["key", "title", "door", "factory", "play",
+                                   "score", "clue"])
+MiniGame.__doc__ = """A registered mini-game.
+
+- key (str): A unique id for the mini-game.
+- title (str): The name shown in scores.
+- door (int): The hidden passage door it sits behind.
+- factory (callable): factory(game) returns a new instance for a game session,
+  drawing any randomness from 'game.rng'.
+- play (callable): play(instance, game) plays it and returns True if the player won.
+- score (callable): score(instance, won) returns the points the attempt is worth.
+- clue (str): The clue found in the secret passages when the player wins."""
+
+
+# The computer player behind door 2: "adaptive" learns the player's habits as
+# they play (see rps_predictor.py), "random" picks uniformly
+RPS_OPPONENT = "adaptive"
+
+
+def no_points(instance, won):
+    """The default scoring hook: mini-games unlock clues rather than points."""
+    return 0
+
+
+class MiniGameRegistry:
+    """The MiniGameRegistry class holds every mini-game, ordered by door."""
+
+    __slots__ = ("_games", "_doors")
+
+    def __init__(self):
+        """
+        Initialize an empty MiniGameRegistry.
+
+        Returns:
+        None
+        """
+        self._games = {}
+        self._doors = []
+
+    def register(self, key, title, door, factory, play, score=no_points, clue=None):
+        """
+        Register a mini-game.
+
+        Parameters:
+        - key (str): A unique id for the mini-game.
+        - title (str): The name shown in scores.
+        - door (int): The door the mini-game sits behind.
+        - factory (callable): Builds a new instance for a game session.
+        - play (callable): Plays an instance and returns True if the player won.
+        - score (callable): Returns the points an attempt is worth.
+        - clue (str): The clue the player finds when they win.
+
+        Returns:
+        MiniGame: The registered mini-game.
+
+        Raises:
+        ValueError: If the key or door is already taken.
+        """
+        if key in self._games:
+            raise ValueError(f"A mini-game is already registered as {key!r}")
+        if any(mini_game.door == door for mini_game in self._doors):
+            raise ValueError(f"Door {door} already has a mini-game")
+        mini_game = MiniGame(key, title, door, factory, play, score, clue)
+        self._games[key] = mini_game
+        self._doors.append(mini_game)
+        self._doors.sort(key=lambda registered: registered.door)
+        return mini_game
+
+    def __getitem__(self, key):
+        return self._games[key]
+
+    def __contains__(self, key):
+        return key in self._games
+
+    def __iter__(self):
+        return iter(self._doors)
+
+    def __len__(self):
+        return len(self._doors)
+
+    def at_door(self, number):
+        """
+        Get the mini-game behind a door, counting doors from 1 in door order.
+
+        Parameters:
+        - number (int): The door's position in the list shown to the player.
+
+        Returns:
+        MiniGame: The mini-game.
+        """
+        return self._doors[number - 1]
+
+    def new_scores(self):
+        """
+        Get an empty score table for a game session.
+
+        Returns:
+        dict: Mini-game title -> 0, in door order.
+        """
+        return {mini_game.title: 0 for mini_game in self._doors}
+
+
+# Each factory hands the mini-game the session's seeded random number generator
+def _haunted_mansion(game):
+    from miniGames import HauntedMansionGame
+    return HauntedMansionGame(rng=game.rng)
+
+
+def _play_haunted_mansion(haunted_game, game):
+    return haunted_game.play_haunted_mansion_game() == 1
+
+
+def _rock_paper_scissors(game):
+    from miniGames import RockPaperScissors
+    return RockPaperScissors(opponent=RPS_OPPONENT, rng=game.rng)
+
+
+def _play_rock_paper_scissors(rock_paper_scissors, game):
+    return bool(rock_paper_scissors.play_game())
+
+
+def _riddle(game):
+    from miniGames import Riddle
+    return Riddle(rng=game.rng)
+
+
+def _play_riddle(riddle, game):
+    riddle.print_riddle()
+    user_input = input("What is your guess Detective:")
+    # Answers are matched through the riddle index, forgiving typos
+    if riddle.check_answer(user_input):
+        print("Very good Detective, you may proceed")
+        return True
+    return False
+
+
+MINI_GAMES = MiniGameRegistry()
+MINI_GAMES.register(
+    "haunted_mansion", "Haunted Mansion", 1, _haunted_mansion, _play_haunted_mansion,
+    clue="Mr. Reginald's rugged look and extensive knowledge of the mansion's layout")
+MINI_GAMES.register(
+    "rock_paper_scissors", "Rock Paper Scissors", 2, _rock_paper_scissors,
+    _play_rock_paper_scissors, clue="The letter on the ground")
+MINI_GAMES.register(
+    "riddle", "Riddle", 3, _riddle, _play_riddle,
+    clue="The hidden passage behind the library door")
@@ -0,0 +1,233 @@
+# riddle_index.py
+
+"""
+Riddle Index Module
+
+Description:
+This Python module loads the riddles in 'game_data.json' into an indexed array
+so a random riddle is picked in O(1) without copying the riddle list. Every
+answer is normalized once when the index is built, together with the aliases
+listed under 'Riddle_aliases', so checking a player's answer is one dict lookup
+plus, if that fails, a bounded edit-distance comparison against that riddle's
+few accepted answers. The cost of checking does not depend on how many
+riddles are loaded.
+
+Normalizing lowercases the answer, drops punctuation, a leading article
+('a', 'an', 'the', 'your', 'my') and the spaces between words, so "A sponge!"
+and "foot steps" match "sponge" and "footsteps".
+
+Classes:
+1. RiddleIndex: The riddles, their normalized answers and a fuzzy answer check.
+
+Functions:
+1. normalize_answer(text): Returns the form answers are compared in.
+2. edit_distance(first, second, limit): Levenshtein distance, giving up past 'limit'.
+3. get_riddle_index(): Returns the RiddleIndex for the current game data.
+
+Usage:
+    index = get_riddle_index()
+    riddle = index.random_riddle(rng)
+    index.check(riddle, "a sponge")
+
+Author: Haydens Little Helpers
+"""
+
+import random
+import threading
+from array import array
+
+_ARTICLES = ("a", "an", "the", "your", "my")
+
+
+def normalize_answer(text):
+    """
+    Reduce an answer to the form answers are compared in.
+
+    Parameters:
+    - text (str): An answer as written in the game data or typed by the player.
+
+    Returns:
+    str: The lowercase letters and digits of the answer, without a leading article.
+    """
+    words = "".join(letter if letter.isalnum() else " "
+                    for letter in text.casefold()).split()
+    if len(words) > 1 and words[0] in _ARTICLES:
+        words = words[1:]
+    return "".join(words)
+
+
+def allowed_typos(answer):
+    """
+    Get how many typing mistakes to forgive in an answer of this length.
+
+    Parameters:
+    - answer (str): A normalized answer.
+
+    Returns:
+    int: 0 for answers of up to 3 letters, 1 up to 6 letters, otherwise 2.
+    """
+    if len(answer) <= 3:
+        return 0
+    if len(answer) <= 6:
+        return 1
+    return 2
+
+
+def edit_distance(first, second, limit):
+    """
+    Compute the Levenshtein distance between two strings, stopping early once
+    it is certain to be more than 'limit'. Only a band of 2 * limit + 1 cells
+    around the diagonal is filled in, so the cost is O(limit * length).
+
+    Parameters:
+    - first (str): One string.
+    - second (str): The other string.
+    - limit (int): The largest distance of interest.
+
+    Returns:
+    int: The distance, or limit + 1 if it is larger than 'limit'.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    if len(first) > len(second):
+        first, second = second, first
+    too_far = limit + 1
+    previous = list(range(len(second) + 1))
+    for row, letter in enumerate(first, 1):
+        low = max(1, row - limit)
+        high = min(len(second), row + limit)
+        current = [too_far] * (len(second) + 1)
+        current[0] = row if row <= limit else too_far
+        best = current[0]
+        for column in range(low, high + 1):
+            cost = previous[column - 1] + (letter != second[column - 1])
+            cost = min(cost, previous[column] + 1, current[column - 1] + 1)
+            current[column] = cost if cost < too_far else too_far
+            best = min(best, current[column])
+        if best > limit:
+            return too_far
+        previous = current
+    return previous[len(second)]
+
+
+class RiddleIndex:
+    """The RiddleIndex class holds riddles in parallel arrays, indexed by
+    position, with every accepted answer normalized up front."""
+
+    __slots__ = ("_questions", "_question_ids", "_answer_of", "_answers", "_accepted")
+
+    def __init__(self, riddles, aliases=None):
+        """
+        Build an index of riddles.
+
+        Parameters:
+        - riddles (mapping): Riddle text -> answer, as in the game data's 'Riddles'.
+        - aliases (mapping): Answer -> list of other accepted answers, as in 'Riddle_aliases'.
+
+        Returns:
+        None
+        """
+        aliases = aliases or {}
+        self._questions = []
+        self._question_ids = {}
+        self._answer_of = array("I")
+        self._answers = []   # answer id -> answer as written in the game data
+        self._accepted = []  # answer id -> normalized answer and aliases
+        answer_ids = {}
+        for question, answer in riddles.items():
+            answer_id = answer_ids.get(answer)
+            if answer_id is None:
+                answer_id = answer_ids[answer] = len(self._answers)
+                forms = [normalize_answer(answer)]
+                forms.extend(normalize_answer(alias) for alias in aliases.get(answer, ()))
+                self._answers.append(answer)
+                self._accepted.append(tuple(dict.fromkeys(forms)))
+            self._question_ids[question] = len(self._questions)
+            self._questions.append(question)
+            self._answer_of.append(answer_id)
+
+    def __len__(self):
+        return len(self._questions)
+
+    def random_riddle(self, rng=None):
+        """
+        Pick a riddle at random.
+
+        Parameters:
+        - rng (random.Random): The random number generator to use. Defaults to the 'random' module.
+
+        Returns:
+        int: The riddle's position in the index.
+        """
+        return (rng or random).randrange(len(self._questions))
+
+    def find(self, question):
+        """
+        Look a riddle up by its text.
+
+        Parameters:
+        - question (str): The riddle text.
+
+        Returns:
+        int: The riddle's position, or None if it is not in the index.
+        """
+        return self._question_ids.get(question)
+
+    def question(self, riddle):
+        """Return the text of a riddle."""
+        return self._questions[riddle]
+
+    def answer(self, riddle):
+        """Return a riddle's answer as written in the game data."""
+        return self._answers[self._answer_of[riddle]]
+
+    def accepted_answers(self, riddle):
+        """Return the normalized answer and aliases accepted for a riddle."""
+        return self._accepted[self._answer_of[riddle]]
+
+    def check(self, riddle, guess):
+        """
+        Check a player's answer, forgiving small typing mistakes.
+
+        Parameters:
+        - riddle (int): The riddle's position in the index.
+        - guess (str): The player's answer.
+
+        Returns:
+        bool: True if the guess matches the answer or one of its aliases.
+        """
+        guess = normalize_answer(guess)
+        accepted = self._accepted[self._answer_of[riddle]]
+        if guess in accepted:
+            return True
+        for answer in accepted:
+            limit = allowed_typos(answer)
+            if limit and edit_distance(guess, answer, limit) <= limit:
+                return True
+        return False
+
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def get_riddle_index():
+    """
+    Get the riddle index shared by every session, rebuilding it if the game data changed.
+
+    Returns:
+    RiddleIndex: The index of the riddles in 'game_data.json'.
+    """
+    global _index, _index_version
+    from content import content_version, get_game_data
+
+    version = content_version()
+    if version != _index_version:
+        with _index_lock:
+            if version != _index_version:
+                game_data = get_game_data()
+                _index = RiddleIndex(game_data["Riddles"],
+                                     game_data.get("Riddle_aliases"))
+                _index_version = version
+    return _index
@@ -0,0 +1,123 @@
+# rps_predictor.py
+
+"""
+RPS Predictor Module
+
+Description:
+This Python module holds the rules and the adaptive opponent for Rock, Paper,
+Scissors. Moves are the integers 0 (rock), 1 (paper) and 2 (scissors), and
+every result is read from a precomputed 3x3 outcome table.
+
+The adaptive opponent predicts the player's next move with a Markov model over
+the player's last few moves, falling back to their overall move frequencies
+for a context it has not seen yet, and then plays the move that beats the
+prediction. The model is a flat table of counts updated in place, so updating
+and predicting take the same constant time however long the history is. Rows
+are halved when they fill up, so the model keeps adapting when a player
+changes strategy.
+
+Classes:
+1. MovePredictor: The incrementally updated Markov/frequency model.
+
+Constants:
+1. MOVES: Move names by id.
+2. OUTCOMES: OUTCOMES[player][opponent] is WIN, DRAW or LOSS for the player.
+3. BEATS: BEATS[move] is the move that beats it.
+
+Usage:
+    predictor = MovePredictor(order=2)
+    opponent_move = BEATS[predictor.predict()]
+    predictor.update(player_move)
+    OUTCOMES[player_move][opponent_move]
+
+Author: Haydens Little Helpers
+"""
+
+import random
+
+MOVES = ("rock", "paper", "scissors")
+MOVE_IDS = {name: move for move, name in enumerate(MOVES)}
+
+DRAW = 0
+WIN = 1
+LOSS = 2
+# Each move beats the one before it, so the outcome only depends on the difference
+OUTCOMES = tuple(tuple((player - opponent) % 3 for opponent in range(3))
+                 for player in range(3))
+BEATS = tuple((move + 1) % 3 for move in range(3))
+
+
+class MovePredictor:
+    """The MovePredictor class predicts a player's next move from their history."""
+
+    __slots__ = ("order", "limit", "rng", "_contexts", "_context", "_seen",
+                 "_counts", "_frequencies")
+
+    def __init__(self, order=1, limit=64, rng=None):
+        """
+        Initialize an empty model.
+
+        Parameters:
+        - order (int): How many of the player's previous moves make up the context.
+        - limit (int): Halve a context's counts once any reaches this, so old habits fade.
+        - rng (random.Random): Breaks ties between equally likely moves. Defaults to the 'random' module.
+
+        Returns:
+        None
+        """
+        self.order = order
+        self.limit = limit
+        self.rng = rng or random
+        self._contexts = 3 ** order
+        self._context = 0  # the last 'order' moves as a base 3 number
+        self._seen = 0     # moves seen, up to 'order'
+        self._counts = [0] * (self._contexts * 3)
+        self._frequencies = [0, 0, 0]
+
+    def _most_likely(self, counts, offset):
+        first, second, third = counts[offset], counts[offset + 1], counts[offset + 2]
+        best = max(first, second, third)
+        if not best:
+            return None
+        moves = [move for move, count in enumerate((first, second, third))
+                 if count == best]
+        return moves[0] if len(moves) == 1 else self.rng.choice(moves)
+
+    def predict(self):
+        """
+        Predict the player's next move.
+
+        Returns:
+        int: The most likely move, or a random one if there is no history.
+        """
+        move = None
+        if self._seen == self.order:
+            move = self._most_likely(self._counts, self._context * 3)
+        if move is None:
+            move = self._most_likely(self._frequencies, 0)
+        if move is None:
+            move = self.rng.randrange(3)
+        return move
+
+    def update(self, move):
+        """
+        Record the player's move.
+
+        Parameters:
+        - move (int): The move the player made.
+
+        Returns:
+        None
+        """
+        if self._seen == self.order:
+            self._add(self._counts, self._context * 3, move)
+        else:
+            self._seen += 1
+        self._add(self._frequencies, 0, move)
+        self._context = (self._context * 3 + move) % self._contexts
+
+    def _add(self, counts, offset, move):
+        counts[offset + move] += 1
+        if counts[offset + move] >= self.limit:
+            for index in range(offset, offset + 3):
+                counts[index] //= 2
@@ -0,0 +1,117 @@
+# session_pool.py
+
+"""
+Session Pool Module
+
+Description:
+This Python module defines a bounded pool of game sessions for hosting many
+players. Building a Game creates its characters, locations, loggers, event
+bus and inventory, and its event subscriptions make reference cycles that
+only the garbage collector can free. When players come and go quickly that
+allocation and collection work adds up, so a finished session is returned
+to the pool and 'Game.reset' restores it in place for the next player.
+
+The pool keeps at most 'size' idle sessions. A session released into a full
+pool is dropped, and acquiring from an empty pool builds a new one, so the
+pool never limits how many players can play at once.
+
+Classes:
+1. SessionPool: Hands out reset game sessions and takes finished ones back.
+
+Usage:
+    pool = SessionPool(size=64)
+    with pool.session() as game:
+        game.run()
+
+Author: Haydens Little Helpers
+"""
+
+import threading
+from contextlib import contextmanager
+
+from game import Game
+
+
+class SessionPool:
+    """The SessionPool class reuses finished game sessions for new players."""
+
+    __slots__ = ("factory", "size", "_idle", "_lock", "created", "reused")
+
+    def __init__(self, size=32, factory=Game):
+        """
+        Initialize an empty pool.
+
+        Parameters:
+        - size (int): The most idle sessions to keep.
+        - factory (callable): factory(seed=...) builds a new session. Default is Game.
+
+        Returns:
+        None
+        """
+        if size < 0:
+            raise ValueError(f"The pool size must not be negative, got {size}")
+        self.factory = factory
+        self.size = size
+        self._idle = []
+        self._lock = threading.Lock()
+        self.created = 0  # sessions built because the pool was empty
+        self.reused = 0   # sessions reset and handed out again
+
+    def acquire(self, seed=None):
+        """
+        Get a session in the state a new Game starts in.
+
+        Parameters:
+        - seed (int): Seeds the session's random number generator. Default is a fresh random seed.
+
+        Returns:
+        Game: A reset idle session, or a new one if none are idle.
+        """
+        with self._lock:
+            if self._idle:
+                game = self._idle.pop()
+                self.reused += 1
+            else:
+                game = None
+                self.created += 1
+        if game is None:
+            return self.factory(seed=seed)
+        game.reset(seed)
+        return game
+
+    def release(self, game):
+        """
+        Return a finished session to the pool. It is reset when it is next
+        acquired, so the player's state is kept until then.
+
+        Parameters:
+        - game (Game): A session from 'acquire'. It must not be used again by its player.
+
+        Returns:
+        bool: True if the session was kept, False if the pool was full.
+        """
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(game)
+                return True
+        return False
+
+    @contextmanager
+    def session(self, seed=None):
+        """
+        Acquire a session for the length of a 'with' block and release it afterwards.
+
+        Parameters:
+        - seed (int): Seeds the session's random number generator.
+
+        Returns:
+        Game: The acquired session.
+        """
+        game = self.acquire(seed)
+        try:
+            yield game
+        finally:
+            self.release(game)
+
+    def __len__(self):
+        return len(self._idle)
@@ -0,0 +1,482 @@
+# simulate.py
+
+"""
+Playthrough Simulator Module
+
+Description:
+This Python module plays whole games of 'Game' without a player, to measure
+the score distribution real players can reach under '__score__' and the
+'end_game' threshold of 35. An agent answers every prompt: the main menu in
+'update', the rooms in 'explore_upstairs', the doors in 'door_choice', the
+mini-games and the accusation in 'user_guess'. Playthroughs are spread
+across a ProcessPoolExecutor, every playthrough gets its own seed derived
+from one base seed, and the results are merged into score histograms, path
+frequencies and win rates.
+
+Each worker replaces 'input', 'print' and 'time.sleep' with the agent's
+hooks, and plays a HeadlessGame, which skips logging in and never writes
+'user_data.json' or the log file. Any playthrough is reproducible from its
+seed.
+
+Agents:
+1. RandomAgent: Picks uniformly among the valid answers to every prompt.
+2. HeuristicAgent: Explores every room, talks to everyone, plays every door
+   (with the word solver's hints), uses its items and accuses the butler.
+
+Classes:
+1. HeadlessGame: A Game that is played by an agent and keeps nothing on disk.
+2. StepLimitReached: Ends a playthrough that answers too many prompts.
+
+Functions:
+1. decision_for(prompt, game): Names the decision a prompt asks for and its valid answers.
+2. run_headless(game): Runs a HeadlessGame with its agent answering the prompts.
+3. play(agent_name, seed, step_limit): Plays one game and returns its result.
+4. simulate(playthroughs, agents, workers, seed, step_limit): Runs and merges many playthroughs.
+
+Usage:
+    python simulate.py [playthroughs=10000] [agent=heuristic|random|both] [workers=4] [seed=1]
+
+Author: Haydens Little Helpers
+"""
+
+import builtins
+import os
+import random
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from game import Game, derive_seed
+from loggable import Loggable
+
+Result = namedtuple("Result", ["seed", "score", "path", "solved", "steps", "ending"])
+Result.__doc__ = """The outcome of one simulated playthrough."""
+
+# Prompt text -> (decision, the valid answers), checked in order
+DECISIONS = (
+    ("Press 'q' to quit or 's' to start", "start", ("s", "q")),
+    ("'c' to conclude investigation", "menu", ("r", "e", "s", "u", "h", "c", "q")),
+    ("Enter the name of the item", "items", None),
+    ("Which path do you dare to take", "path", ("1", "2")),
+    ("rooms are revealed", "room", ("k", "l", "a", "d", "b")),
+    ("talk to the chef", "chef", ("y", "n")),
+    ("explore kitchen further", "kitchen", ("y", "n")),
+    ("talk to the girl", "girl", ("y", "n")),
+    ("explore attic further", "attic", ("y", "n")),
+    ("talk to the librarian", "librarian", ("y", "n")),
+    ("explore library further", "library", ("y", "n")),
+    ("'i' to interact with characters", "crime_scene", ("b", "i", "r")),
+    ("If you want to speak to the witness", "characters", ("1", "2")),
+    ("Which passage will you venture through", "door", None),
+    ("Enter your guess", "word", None),
+    ("What is your choice Rock", "rps", ("rock", "paper", "scissors")),
+    ("What is your guess Detective", "riddle", None),
+    ("Would you like to interrogate the suspects", "interrogate", ("y", "n")),
+    ("who would you like to interrogate", "suspect", ("1", "2", "3")),
+    ("With this new information", "confront", ("y", "n")),
+    ("Who do you believe commited the crime", "accuse", ("1", "2", "3")),
+)
+ROOMS = {"k": "Kitchen", "l": "Library", "a": "Attic"}
+SOLVED_MESSAGES = ("congratulations Detective you have found the suspect",
+                   "immediately admits defeat")
+
+
+def decision_for(prompt, game):
+    """
+    Work out which decision a prompt asks for.
+
+    Parameters:
+    - prompt (str): The text passed to 'input'.
+    - game (Game): The game asking, for prompts whose answers depend on its state.
+
+    Returns:
+    tuple: The decision's name and its valid answers, or None for free text.
+
+    Raises:
+    ValueError: If the prompt is not one the simulator knows.
+    """
+    for text, decision, options in DECISIONS:
+        if text in prompt:
+            if decision == "door":
+                options = tuple(str(door) for door in range(1, len(game.doors) + 1)) + ("b",)
+            return decision, options
+    raise ValueError(f"The simulator does not know the prompt {prompt!r}")
+
+
+class StepLimitReached(BaseException):
+    """Raised from 'input' to stop a playthrough that runs too long. It is a
+    BaseException so that Game.run's 'except Exception' can't swallow it."""
+
+
+class Agent(ABC):
+    """The Agent class answers a HeadlessGame's prompts and records its path."""
+
+    name = "agent"
+
+    def __init__(self, rng, step_limit):
+        self.rng = rng
+        self.step_limit = step_limit
+        self.steps = 0
+        self.path = []
+        self.solved = False
+        self.last_output = ""
+
+    def observe(self, text):
+        """Read a line the game printed."""
+        if text.strip():
+            self.last_output = text.strip()
+            if any(message in text for message in SOLVED_MESSAGES):
+                self.solved = True
+
+    def answer(self, prompt, game):
+        """Answer a prompt, recording the milestones of the playthrough."""
+        self.steps += 1
+        if self.steps > self.step_limit:
+            raise StepLimitReached(self.steps)
+        decision, options = decision_for(prompt, game)
+        choice = self.decide(decision, options, game)
+        self._record(decision, choice, game)
+        return choice
+
+    def _record(self, decision, choice, game):
+        milestone = None
+        if decision == "room" and choice in ROOMS and not getattr(game, ROOMS[choice].lower()).visited:
+            milestone = ROOMS[choice]
+        elif decision == "room" and choice == "d":
+            milestone = "Crime scene"
+        elif decision == "door" and choice != "b" and not game.doors_checker[int(choice) - 1]:
+            milestone = f"Door {choice}"
+        elif decision in ("suspect", "accuse"):
+            milestone = {"1": "Accused the butler", "2": "Accused Lady Victoria",
+                         "3": "Questioned the chef"}[choice]
+        elif decision == "menu" and choice == "q":
+            milestone = "Quit"
+        if milestone and (not self.path or self.path[-1] != milestone):
+            self.path.append(milestone)
+
+    @abstractmethod
+    def decide(self, decision, options, game):
+        """Choose one of 'options' for a decision, e.g. the room to go to next."""
+
+
+class RandomAgent(Agent):
+    """Picks uniformly among the valid answers to every prompt."""
+
+    name = "random"
+
+    def decide(self, decision, options, game):
+        if decision == "items":
+            names = [item.name for item in game.inventory.items]
+            return self.rng.choice(names) if names else ""
+        if decision == "word":
+            return self.rng.choice("abcdefghijklmnopqrstuvwxyz?")
+        if decision == "riddle":
+            return self.rng.choice(("sponge", "age", "footsteps", "map", "echo", "no idea"))
+        return self.rng.choice(options)
+
+
+class HeuristicAgent(Agent):
+    """Plays the way a thorough player would."""
+
+    name = "heuristic"
+    riddle_skill = 0.8  # the chance of knowing a riddle's answer
+    door_attempts = 3   # tries per door before giving up on it
+
+    def __init__(self, rng, step_limit):
+        super().__init__(rng, step_limit)
+        self._door_tries = Counter()
+        self._guessed = ""
+
+    def observe(self, text):
+        super().observe(text)
+        if "Can you guess the secret word?" in text:
+            self._guessed = ""
+
+    def _rooms_left(self, game):
+        return [key for key, room in ROOMS.items()
+                if not getattr(game, room.lower()).visited]
+
+    def _crime_scene_left(self, game):
+        return not (game.characters_interacted and game.npcs_interacted)
+
+    def _doors_left(self, game):
+        return [door for door in range(1, len(game.doors) + 1)
+                if not game.doors_checker[door - 1]
+                and self._door_tries[door] < self.door_attempts]
+
+    def _guess_word(self):
+        from word_pack import letter_mask
+        from word_solver import get_word_solver
+
+        display = self.last_output
+        found = display.replace(" ", "").replace("_", "")
+        guessed_mask = letter_mask(self._guessed + found)
+        excluded_mask = letter_mask(self._guessed) & ~letter_mask(found)
+        hint = get_word_solver(len(display.split(" "))).suggest(
+            guessed_mask, excluded_mask, display)
+        if hint is None:
+            guess = self.rng.choice([letter for letter in "abcdefghijklmnopqrstuvwxyz"
+                                     if letter not in self._guessed + found])
+        else:
+            guess = hint.guess
+        if len(guess) == 1:
+            self._guessed += guess
+        return guess
+
+    def decide(self, decision, options, game):
+        if decision == "menu":
+            if self._rooms_left(game) or self._crime_scene_left(game) or self._doors_left(game):
+                return "e"
+            return "u" if len(game.inventory) else "c"
+        if decision == "items":
+            return ", ".join(item.name for item in game.inventory.items)
+        if decision == "path":
+            return "1" if self._rooms_left(game) or self._crime_scene_left(game) else "2"
+        if decision == "room":
+            rooms = self._rooms_left(game)
+            if rooms:
+                return rooms[0]
+            return "d" if self._crime_scene_left(game) else "b"
+        if decision == "crime_scene":
+            return "i" if self._crime_scene_left(game) else "b"
+        if decision == "characters":
+            return "2" if game.characters_interacted else "1"
+        if decision == "door":
+            doors = self._doors_left(game)
+            if not doors:
+                return "b"
+            self._door_tries[doors[0]] += 1
+            return str(doors[0])
+        if decision == "word":
+            return self._guess_word()
+        if decision == "rps":
+            return self.rng.choice(options)
+        if decision == "riddle":
+            from riddle_index import get_riddle_index
+
+            index = get_riddle_index()
+            riddle = index.find(self.last_output)
+            if riddle is not None and self.rng.random() < self.riddle_skill:
+                return index.answer(riddle)
+            return "no idea"
+        if decision in ("suspect", "accuse"):
+            return "1"
+        return options[0]  # start, and 'y' to every room, talk and interrogation
+
+
+AGENTS = {agent.name: agent for agent in (RandomAgent, HeuristicAgent)}
+
+
+class _HeadlessLog(Loggable):
+    """A session log that is kept in memory only."""
+
+    __slots__ = ()
+
+    def save_logs_to_file(self, filename):
+        pass
+
+
+class HeadlessGame(Game):
+    """A Game played by an agent. It skips logging in and never touches the
+    save files, and records the final score that would have been saved."""
+
+    __slots__ = ("agent", "final_score")
+
+    def __init__(self, agent, seed=None):
+        super().__init__(seed)
+        self.agent = agent
+        self.final_score = None
+        self.events.unsubscribe(self.game_log.log_events)
+        self.game_log = _HeadlessLog()
+        self.events.subscribe(self.game_log.log_events)
+
+    def initialize_player(self):
+        self.username = "simulated"
+        self.player_name = "Simulated Detective"
+
+    def update_user_score(self, username, score):
+        # end_game can run more than once, the last score is the one kept
+        self.final_score = score
+
+    def store_clues(self):
+        pass
+
+
+_playing = None
+
+
+def _input(prompt=""):
+    return _playing.agent.answer(str(prompt), _playing)
+
+
+def _print(*values, sep=" ", end="\n", file=None, flush=False):
+    if _playing is None or file is not None:
+        return
+    if len(values) == 1:
+        text = str(values[0])
+        if len(text) == 1:  # the typewriter effect prints one character at a time
+            return
+    else:
+        text = (sep or " ").join(str(value) for value in values)
+    _playing.agent.observe(text)
+
+
+def _sleep(seconds):
+    pass
+
+
+class headless_io:
+    """Route 'input', 'print' and 'time.sleep' to the game being simulated."""
+
+    def __enter__(self):
+        self._saved = builtins.input, builtins.print, time.sleep
+        builtins.input, builtins.print, time.sleep = _input, _print, _sleep
+        return self
+
+    def __exit__(self, *exc_info):
+        builtins.input, builtins.print, time.sleep = self._saved
+
+
+def run_headless(game):
+    """
+    Run a HeadlessGame with 'input' and 'print' routed to its agent. They must
+    already be installed, see 'headless_io'.
+
+    Parameters:
+    - game (HeadlessGame): The game to run.
+
+    Returns:
+    None
+    """
+    global _playing
+    _playing = game
+    try:
+        game.run()
+    finally:
+        _playing = None
+
+
+def play(agent_name, seed, step_limit=1000):
+    """
+    Play one game with an agent. 'input', 'print' and 'time.sleep' must already
+    be routed to the simulator, see 'headless_io'.
+
+    Parameters:
+    - agent_name (str): A key of AGENTS.
+    - seed (int): Seeds both the game session and the agent.
+    - step_limit (int): The most prompts the agent answers before the game is stopped.
+
+    Returns:
+    Result: The final score, the milestones reached, whether the culprit was
+    found, how many prompts were answered and how the game ended.
+    """
+    agent = AGENTS[agent_name](random.Random(derive_seed(seed, "agent")), step_limit)
+    game = HeadlessGame(agent, seed)
+    ending = "finished"
+    try:
+        run_headless(game)
+    except StepLimitReached:
+        ending = "step limit"
+    if ending == "finished" and agent.path and agent.path[-1] == "Quit":
+        ending = "quit"
+    score = game.final_score if game.final_score is not None else game.score
+    return Result(seed, score, " > ".join(agent.path), agent.solved, agent.steps, ending)
+
+
+def _install_headless_io():
+    """Pool initializer: a worker only ever runs simulations."""
+    headless_io().__enter__()
+
+
+def _play_batch(agent_name, seeds, step_limit):
+    """Play a batch of games in a worker and return its merged statistics."""
+    start = time.process_time()
+    scores = Counter()
+    paths = Counter()
+    endings = Counter()
+    solved = 0
+    for seed in seeds:
+        result = play(agent_name, seed, step_limit)
+        scores[result.score] += 1
+        paths[result.path] += 1
+        endings[result.ending] += 1
+        solved += result.solved
+    return {"scores": scores, "paths": paths, "endings": endings, "solved": solved,
+            "playthroughs": len(seeds), "cpu_seconds": time.process_time() - start}
+
+
+def simulate(playthroughs=10000, agent_name="heuristic", workers=None, seed=1,
+             step_limit=1000, batch=200):
+    """
+    Play many games across a process pool and merge the results.
+
+    Parameters:
+    - playthroughs (int): How many games to play.
+    - agent_name (str): A key of AGENTS.
+    - workers (int): Worker processes. Default is one per CPU core; 0 plays in this process.
+    - seed (int): The base seed every playthrough's seed is derived from.
+    - step_limit (int): The most prompts answered per playthrough.
+    - batch (int): Playthroughs sent to a worker at a time.
+
+    Returns:
+    dict: Merged 'scores', 'paths' and 'endings' Counters, the 'solved' count,
+    'playthroughs', 'cpu_seconds', 'wall_seconds' and 'workers'.
+    """
+    seeds = [derive_seed(seed, number) for number in range(playthroughs)]
+    batches = [seeds[start:start + batch] for start in range(0, playthroughs, batch)]
+    workers = os.cpu_count() if workers is None else workers
+
+    start = time.perf_counter()
+    if workers == 0:
+        with headless_io():
+            results = [_play_batch(agent_name, seeds, step_limit) for seeds in batches]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_install_headless_io) as pool:
+            results = list(pool.map(_play_batch, [agent_name] * len(batches), batches,
+                                    [step_limit] * len(batches)))
+    merged = {"scores": Counter(), "paths": Counter(), "endings": Counter(),
+              "solved": 0, "playthroughs": 0, "cpu_seconds": 0.0}
+    for result in results:
+        for key, value in result.items():
+            merged[key] += value
+    merged["wall_seconds"] = time.perf_counter() - start
+    merged["workers"] = max(workers, 1)
+    return merged
+
+
+def print_report(agent_name, results, threshold=35, top_paths=5):
+    """Print the score histogram, win rates, common paths and throughput of a simulation."""
+    count = results["playthroughs"]
+    scores = results["scores"]
+    print(f"== {agent_name} agent: {count} playthroughs ==")
+    print(f"culprit found: {100 * results['solved'] / count:5.1f}%")
+    above = sum(number for score, number in scores.items() if score > threshold)
+    print(f"score above {threshold}: {100 * above / count:5.1f}%")
+    print("endings: " + ", ".join(f"{ending} {100 * number / count:.1f}%"
+                                  for ending, number in results["endings"].most_common()))
+    print("score histogram:")
+    buckets = Counter()
+    for score, number in scores.items():
+        buckets[score // 10 * 10] += number
+    for bucket in sorted(buckets):
+        share = buckets[bucket] / count
+        print(f"  {bucket:>4}-{bucket + 9:<4} {100 * share:5.1f}% {'#' * round(share * 50)}")
+    print("most common paths:")
+    for path, number in results["paths"].most_common(top_paths):
+        print(f"  {100 * number / count:5.1f}%  {path or '(nothing)'}")
+    per_core = count / results["cpu_seconds"] if results["cpu_seconds"] else float("inf")
+    print(f"throughput: {count / results['wall_seconds']:.0f} playthroughs/s on "
+          f"{results['workers']} workers, {per_core:.0f} playthroughs/s per core")
+
+
+if __name__ == "__main__":
+    options = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+    agent = options.get("agent", "both")
+    for name in (AGENTS if agent == "both" else [agent]):
+        results = simulate(int(options.get("playthroughs", 10000)), name,
+                           int(options["workers"]) if "workers" in options else None,
+                           int(options.get("seed", 1)),
+                           int(options.get("steps", 1000)))
+        print_report(name, results)
@@ -21,10 +21,14 @@ Note: Make sure to have the 'user_data.json' file available for user data storag
 """
 
 import json
-import bcrypt
+
+# bcrypt is imported inside the functions that hash passwords, so it is only
+# loaded once the player actually registers or logs in
 
 
 def register_user(username, password):
+    import bcrypt
+
     # Load existing user data from JSON file
     try:
         with open('user_data.json', 'r') as file:
@@ -50,6 +54,8 @@ def register_user(username, password):
 
 
 def login_user(username, password):
+    import bcrypt
+
     # Load user data from JSON file
     try:
         with open('user_data.json', 'r') as file:
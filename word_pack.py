@@ -0,0 +1,513 @@
+# word_pack.py
+
+"""
+Word Pack Module
+
+Description:
+This Python module stores the secret words for the Haunted Mansion game in a
+compact, memory-mapped word pack. Words are grouped by length and difficulty
+and each group is a fixed-width section of ASCII bytes, so the n-th word of a
+group is a single slice of the map. Picking a uniformly random word is O(1) in
+the size of the dictionary, and words are only turned into Python strings when
+they are picked. Each word's set of letters is also stored as a 26-bit mask, so
+word filters (see word_solver.py) are integer operations over the map.
+
+Layout (all integers little-endian):
+- Header: magic, version, group count, word count, section offsets, the
+  newest source modification time and the offset and size of the source list
+  (used to detect a stale pack).
+- Group table: (length, difficulty, offset, count, first word) records sorted
+  by length then difficulty.
+- Word section: each group's words, sorted and packed back to back without
+  separators.
+- Mask section: one 32-bit letter mask per word, in the same order as the words.
+- Source list: the files the pack was built from, as UTF-8 text, one per line.
+
+Classes:
+1. WordPack: A read-only, memory-mapped view of a compiled word pack.
+2. WordList: The same interface over an in-memory list, used when no pack exists.
+
+Functions:
+1. letter_mask(word): Returns the bitmask of the letters in a word.
+2. mask_letters(mask): Returns the letters in a bitmask, alphabetically.
+3. word_difficulty(word): Rates how hard a word is to guess.
+4. build_word_pack(sources, output): Compiles word lists into a pack.
+5. get_words(): Returns the word pack if it is fresh, else the words in 'game_data.json'.
+
+Usage:
+- Build the pack from 'game_data.json' and any extra word lists (one word per line):
+    python word_pack.py [wordlist.txt ...]
+- Pick a word:
+    get_words().random_word(length=5, difficulty=EASY, rng=random.Random(seed))
+
+Author: Haydens Little Helpers
+"""
+
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+
+WORD_PACK_FILE = "words.pack"
+MAGIC = b"PMWP"
+VERSION = 3
+
+_HEADER = struct.Struct("<4sHHIIIIqII")
+_GROUP = struct.Struct("<BBxxIII")
+_MASK = struct.Struct("<I")
+
+EASY = 0
+MEDIUM = 1
+HARD = 2
+DIFFICULTIES = {"easy": EASY, "medium": MEDIUM, "hard": HARD}
+
+# Letters that rarely appear in English words and so are hard to guess
+_RARE_LETTERS = frozenset("bfgjkqvwxyz")
+_MAX_LENGTH = 255
+_A = ord("a")
+
+
+def letter_mask(word):
+    """
+    Get the set of letters in a word as a bitmask, bit 0 for 'a' up to bit 25 for 'z'.
+
+    Parameters:
+    - word (str): A lowercase word.
+
+    Returns:
+    int: The letter mask.
+    """
+    mask = 0
+    for letter in word:
+        mask |= 1 << (ord(letter) - _A)
+    return mask
+
+
+def mask_letters(mask):
+    """
+    Get the letters in a bitmask.
+
+    Parameters:
+    - mask (int): A mask returned by 'letter_mask'.
+
+    Returns:
+    list: The letters, in alphabetical order.
+    """
+    return [chr(_A + bit) for bit in range(26) if mask >> bit & 1]
+
+
+def word_difficulty(word):
+    """
+    Rate how hard a word is to guess. Every letter guess costs an attempt, so
+    words with more distinct letters, and rarer ones, are harder.
+
+    Parameters:
+    - word (str): A lowercase word.
+
+    Returns:
+    int: EASY, MEDIUM or HARD.
+    """
+    letters = set(word)
+    score = len(letters) + len(letters & _RARE_LETTERS)
+    if score <= 4:
+        return EASY
+    if score <= 6:
+        return MEDIUM
+    return HARD
+
+
+def _normalize(words):
+    """Lowercase words and drop any that are not plain ASCII letters."""
+    for word in words:
+        word = word.strip().lower()
+        if word.isascii() and word.isalpha() and len(word) <= _MAX_LENGTH:
+            yield word
+
+
+def _group_words(words):
+    """Return {(length, difficulty): sorted list of unique words}."""
+    groups = {}
+    for word in set(_normalize(words)):
+        groups.setdefault((len(word), word_difficulty(word)), []).append(word)
+    for group in groups.values():
+        group.sort()
+    return dict(sorted(groups.items()))
+
+
+def _read_sources(sources):
+    """Read the words in 'game_data.json' style files and plain word lists."""
+    import json  # the game itself never parses JSON when a pack exists
+
+    words = []
+    newest = 0
+    for filename in sources:
+        with open(filename, "r", encoding="utf-8") as file:
+            if filename.endswith(".json"):
+                words.extend(json.load(file).get("Secret_words", ()))
+            else:
+                words.extend(file.read().split())
+        newest = max(newest, os.stat(filename).st_mtime_ns)
+    return words, newest
+
+
+def build_word_pack(sources, output=WORD_PACK_FILE):
+    """
+    Compile word lists into one word pack.
+
+    Parameters:
+    - sources (list): Files to read. JSON files contribute their 'Secret_words',
+      any other file is read as whitespace separated words.
+    - output (str): The filename to write the pack to.
+
+    Returns:
+    int: The number of words in the pack.
+    """
+    words, newest = _read_sources(sources)
+    groups = _group_words(words)
+
+    table = bytearray()
+    section = bytearray()
+    masks = bytearray()
+    count = 0
+    for (length, difficulty), group in groups.items():
+        table += _GROUP.pack(length, difficulty, len(section), len(group), count)
+        section += "".join(group).encode("ascii")
+        masks += b"".join(_MASK.pack(letter_mask(word)) for word in group)
+        count += len(group)
+
+    groups_offset = _HEADER.size
+    words_offset = groups_offset + len(table)
+    # Align the masks so they can be read as an array of 32-bit integers
+    padding = -(words_offset + len(section)) % _MASK.size
+    masks_offset = words_offset + len(section) + padding
+    # The sources are recorded so a change to any of them makes the pack stale
+    source_list = "\n".join(sources).encode("utf-8")
+    sources_offset = masks_offset + len(masks)
+    header = _HEADER.pack(MAGIC, VERSION, len(groups), count, groups_offset,
+                          words_offset, masks_offset, newest, sources_offset,
+                          len(source_list))
+
+    # Write to a temporary file first so a running game never maps half a pack
+    temporary = output + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(header + bytes(table) + bytes(section) + bytes(padding)
+                   + bytes(masks) + source_list)
+    os.replace(temporary, output)
+    return count
+
+
+class _Words:
+    """Filtering and random selection shared by WordPack and WordList.
+
+    Subclasses provide '_groups', a list of (length, difficulty, count)
+    tuples sorted by length then difficulty, 'word(group, index)' and
+    'masks(group)'."""
+
+    def _select(self, length, difficulty):
+        """Return (group indexes, cumulative counts) for the groups matching a filter."""
+        key = (length, difficulty)
+        selection = self._selections.get(key)
+        if selection is None:
+            indexes = []
+            cumulative = []
+            total = 0
+            for index, (group_length, group_difficulty, count) in enumerate(self._groups):
+                if length is not None and group_length != length:
+                    continue
+                if difficulty is not None and group_difficulty != difficulty:
+                    continue
+                total += count
+                indexes.append(index)
+                cumulative.append(total)
+            selection = self._selections[key] = (indexes, cumulative)
+        return selection
+
+    def __len__(self):
+        return sum(count for _, _, count in self._groups)
+
+    def __contains__(self, word):
+        word = word.lower()
+        for index, (length, _, count) in enumerate(self._groups):
+            if length != len(word):
+                continue
+            position = bisect_left(_GroupWords(self, index, count), word)
+            if position < count and self.word(index, position) == word:
+                return True
+        return False
+
+    def groups(self, length=None):
+        """
+        List the groups holding words of a length.
+
+        Parameters:
+        - length (int): The word length, or None for every group.
+
+        Returns:
+        list: Group indexes for use with 'word' and 'masks'.
+        """
+        return [index for index, (group_length, _, _) in enumerate(self._groups)
+                if length is None or group_length == length]
+
+    def group_size(self, group):
+        """Return the number of words in a group."""
+        return self._groups[group][2]
+
+    def lengths(self):
+        """
+        List the word lengths available.
+
+        Returns:
+        list: The distinct word lengths, shortest first.
+        """
+        return sorted({length for length, _, _ in self._groups})
+
+    def count(self, length=None, difficulty=None):
+        """
+        Count the words matching a filter.
+
+        Parameters:
+        - length (int): Only count words of this length, or None for any length.
+        - difficulty (int): Only count words of this difficulty, or None for any.
+
+        Returns:
+        int: The number of matching words.
+        """
+        _, cumulative = self._select(length, difficulty)
+        return cumulative[-1] if cumulative else 0
+
+    def random_word(self, length=None, difficulty=None, rng=None):
+        """
+        Pick a uniformly random word matching a filter.
+
+        Parameters:
+        - length (int): The word length, or None for any length.
+        - difficulty (int): EASY, MEDIUM, HARD, or None for any difficulty.
+        - rng (random.Random): The random number generator to use, so a seeded
+          session always picks the same words. Defaults to the 'random' module.
+
+        Returns:
+        str: The word, or None if no word matches.
+        """
+        indexes, cumulative = self._select(length, difficulty)
+        if not cumulative:
+            return None
+        number = (rng or random).randrange(cumulative[-1])
+        position = bisect_right(cumulative, number)
+        start = cumulative[position - 1] if position else 0
+        return self.word(indexes[position], number - start)
+
+
+class _GroupWords:
+    """Lets bisect search one group's sorted words without decoding all of them."""
+
+    __slots__ = ("_owner", "_group", "_count")
+
+    def __init__(self, owner, group, count):
+        self._owner = owner
+        self._group = group
+        self._count = count
+
+    def __getitem__(self, index):
+        return self._owner.word(self._group, index)
+
+    def __len__(self):
+        return self._count
+
+
+class WordPack(_Words):
+    """The WordPack class maps a compiled word pack into memory. Only the small
+    group table is decoded up front; words are read from the map when picked."""
+
+    def __init__(self, filename=WORD_PACK_FILE):
+        """
+        Open and map a word pack.
+
+        Parameters:
+        - filename (str): The pack file to map.
+
+        Returns:
+        None
+
+        Raises:
+        ValueError: If the file is not a word pack of a supported version.
+        """
+        self.filename = filename
+        with open(filename, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, group_count, self.word_count, groups_offset,
+         words_offset, self._masks_offset, self.source_mtime, sources_offset,
+         sources_size) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{filename} is not a version {VERSION} word pack")
+        source_list = self._map[sources_offset:sources_offset + sources_size]
+        self.sources = source_list.decode("utf-8").split("\n") if source_list else []
+
+        self._groups = []
+        self._offsets = []
+        self._firsts = []
+        for index in range(group_count):
+            length, difficulty, offset, count, first = _GROUP.unpack_from(
+                self._map, groups_offset + index * _GROUP.size)
+            self._groups.append((length, difficulty, count))
+            self._offsets.append(words_offset + offset)
+            self._firsts.append(first)
+        self._selections = {}
+
+    def __len__(self):
+        return self.word_count
+
+    def close(self):
+        """
+        Release the memory map. Mask views returned by 'masks' must be released first.
+
+        Returns:
+        bool: True if the map was released, False if mask views are still in use,
+        in which case it is released once they and the pack are garbage collected.
+        """
+        try:
+            self._map.close()
+        except BufferError:
+            return False
+        return True
+
+    def is_stale(self, filenames):
+        """
+        Check whether any of the source files changed after the pack was built.
+
+        Parameters:
+        - filenames (iterable): The source files the pack was built from.
+
+        Returns:
+        bool: True if the pack should be rebuilt.
+        """
+        try:
+            return any(os.stat(name).st_mtime_ns > self.source_mtime
+                       for name in filenames)
+        except FileNotFoundError:
+            return True
+
+    def word(self, group, index):
+        """Return the word at an index in a group."""
+        length = self._groups[group][0]
+        start = self._offsets[group] + index * length
+        return self._map[start:start + length].decode("ascii")
+
+    def masks(self, group):
+        """
+        Get the letter masks of every word in a group, read straight from the map.
+
+        Parameters:
+        - group (int): A group index.
+
+        Returns:
+        A sequence of int letter masks, in the same order as the group's words.
+        """
+        start = self._masks_offset + self._firsts[group] * _MASK.size
+        end = start + self._groups[group][2] * _MASK.size
+        if sys.byteorder == "little":
+            return memoryview(self._map)[start:end].cast("I")
+        return [mask for mask, in _MASK.iter_unpack(self._map[start:end])]
+
+
+class WordList(_Words):
+    """The WordList class holds a small word list in memory behind the same
+    interface as WordPack, for when no compiled pack is available."""
+
+    def __init__(self, words):
+        """
+        Group a list of words by length and difficulty.
+
+        Parameters:
+        - words (iterable): The words. Case is ignored and non-letter words are dropped.
+
+        Returns:
+        None
+        """
+        grouped = _group_words(words)
+        self._words = list(grouped.values())
+        self._masks = [[letter_mask(word) for word in group] for group in self._words]
+        self._groups = [(length, difficulty, len(group))
+                        for (length, difficulty), group in grouped.items()]
+        self._selections = {}
+
+    def word(self, group, index):
+        """Return the word at an index in a group."""
+        return self._words[group][index]
+
+    def masks(self, group):
+        """Return the letter masks of every word in a group."""
+        return self._masks[group]
+
+
+_pack = None
+_pack_mtime = None
+_word_list = None
+_word_list_version = None
+_words_lock = threading.Lock()
+
+
+def _fresh_pack():
+    """Map the word pack if it exists and is newer than 'game_data.json' and
+    every word list it was built from."""
+    global _pack, _pack_mtime
+    from content import GAME_DATA_FILE
+
+    try:
+        mtime = os.stat(WORD_PACK_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    with _words_lock:
+        if mtime != _pack_mtime:
+            if _pack is not None:
+                _pack.close()
+            try:
+                _pack = WordPack(WORD_PACK_FILE)
+            except ValueError:
+                _pack = None
+            _pack_mtime = mtime
+        pack = _pack
+
+    if pack is None or pack.is_stale([GAME_DATA_FILE, *pack.sources]):
+        return None
+    return pack
+
+
+def get_words():
+    """
+    Get the secret words shared by every session.
+
+    Returns:
+    WordPack or WordList: The compiled word pack if it is fresh, otherwise the
+    'Secret_words' in 'game_data.json'.
+
+    Raises:
+    FileNotFoundError: If there is no fresh pack and 'game_data.json' is missing.
+    ValueError: If there is no fresh pack and 'game_data.json' is invalid.
+    """
+    global _word_list, _word_list_version
+    from content import content_version, get_game_data
+
+    pack = _fresh_pack()
+    if pack is not None:
+        return pack
+
+    version = content_version()
+    with _words_lock:
+        if version != _word_list_version:
+            _word_list = WordList(get_game_data().get("Secret_words", ()))
+            _word_list_version = version
+        return _word_list
+
+
+if __name__ == "__main__":
+    import sys
+    from content import GAME_DATA_FILE
+
+    count = build_word_pack([GAME_DATA_FILE] + sys.argv[1:])
+    print(f"Wrote {WORD_PACK_FILE} ({count} words)")
@@ -0,0 +1,209 @@
+# word_solver.py
+
+"""
+Word Solver Module
+
+Description:
+This Python module evaluates Haunted Mansion guesses with letter bitmasks and
+suggests the best next guess over the whole secret word dictionary. A game's
+state is three integers: the letters in the secret word, the letters guessed
+so far and the letters known not to be in the word. Checking a guess and
+checking for a win are single integer operations.
+
+The solver first discards dictionary words whose letter mask contradicts what
+the player knows, using the masks stored in the word pack, and only decodes
+the words that survive. It then suggests the letter whose revealed positions
+split the remaining words most evenly (the most expected information), or the
+word itself once only one is left.
+
+Classes:
+1. Hint: A suggested guess and how many dictionary words are still possible.
+2. WordSolver: Suggests guesses for a word length over a word pack or list.
+
+Functions:
+1. evaluate_guess(word_mask, guessed_mask, guess_mask): Scores a letter or word guess.
+2. get_word_solver(length): Returns the shared solver for a word length.
+
+Usage:
+    solver = get_word_solver(length=5)
+    hint = solver.suggest(guessed_mask, excluded_mask, "_ p p _ _")
+
+Author: Haydens Little Helpers
+"""
+
+import threading
+from collections import namedtuple
+from math import log2
+from word_pack import get_words, letter_mask
+
+Hint = namedtuple("Hint", ["guess", "is_word", "candidates"])
+Hint.__doc__ = """A suggested guess: a letter, or the whole word when 'is_word' is
+True, and the number of dictionary words still consistent with the game."""
+
+
+def evaluate_guess(word_mask, guessed_mask, guess_mask):
+    """
+    Apply a guess to a game's letter masks.
+
+    Parameters:
+    - word_mask (int): The letters in the secret word.
+    - guessed_mask (int): The letters the player has found or tried so far.
+    - guess_mask (int): The letters of the guess.
+
+    Returns:
+    tuple: (new guessed mask, the guessed letters that are in the word, True if
+    every letter of the secret word has now been guessed).
+    """
+    hits = guess_mask & word_mask
+    guessed_mask |= guess_mask
+    return guessed_mask, hits, not word_mask & ~guessed_mask
+
+
+class WordSolver:
+    """The WordSolver class suggests guesses for secret words of one length."""
+
+    __slots__ = ("words", "length", "_groups")
+
+    def __init__(self, words, length):
+        """
+        Initialize a WordSolver.
+
+        Parameters:
+        - words (WordPack or WordList): The dictionary the secret word was drawn from.
+        - length (int): The length of the secret word.
+
+        Returns:
+        None
+        """
+        self.words = words
+        self.length = length
+        self._groups = words.groups(length)  # the groups holding words of this length
+
+    def candidates(self, found_mask, excluded_mask, display):
+        """
+        List the dictionary words consistent with what the player knows.
+
+        Parameters:
+        - found_mask (int): Letters known to be in the word.
+        - excluded_mask (int): Letters known not to be in the word.
+        - display (str): The revealed word as shown to the player, e.g. '_ p p _ _'.
+
+        Returns:
+        list: The matching words.
+        """
+        pattern = display.split(" ")
+        matches = []
+        for group in self._groups:
+            masks = self.words.masks(group)
+            for index, mask in enumerate(masks):
+                # Most words are ruled out here without being decoded
+                if mask & excluded_mask or mask & found_mask != found_mask:
+                    continue
+                word = self.words.word(group, index)
+                # Every occurrence of a found letter is revealed, so hidden
+                # positions can't hold one
+                if all(letter == shown if shown != "_" else
+                       not found_mask >> (ord(letter) - 97) & 1
+                       for letter, shown in zip(word, pattern)):
+                    matches.append(word)
+            if hasattr(masks, "release"):
+                masks.release()
+        return matches
+
+    def suggest(self, guessed_mask, excluded_mask, display):
+        """
+        Suggest the guess that tells the player the most about the secret word.
+
+        Parameters:
+        - guessed_mask (int): Letters the player has found or tried so far.
+        - excluded_mask (int): Letters known not to be in the word.
+        - display (str): The revealed word as shown to the player.
+
+        Returns:
+        Hint: The suggestion, or None if no dictionary word fits the game.
+        """
+        found_mask = guessed_mask & ~excluded_mask
+        matches = self.candidates(found_mask, excluded_mask, display)
+        if len(matches) <= 1:
+            return Hint(matches[0], True, 1) if matches else None
+
+        # For each unguessed letter, count the words by where it would appear
+        splits = {}
+        for word in matches:
+            positions = {}
+            for index, letter in enumerate(word):
+                if not guessed_mask >> (ord(letter) - 97) & 1:
+                    positions[letter] = positions.get(letter, 0) | 1 << index
+            for letter, where in positions.items():
+                split = splits.setdefault(letter, {})
+                split[where] = split.get(where, 0) + 1
+
+        total = len(matches)
+        if not splits:
+            return Hint(matches[0], True, total)
+
+        def information(letter):
+            counts = list(splits[letter].values())
+            counts.append(total - sum(counts))  # words without the letter
+            return -sum(count / total * log2(count / total) for count in counts if count)
+
+        # Ties go to the alphabetically first letter so hints are repeatable
+        letter = max(sorted(splits), key=information)
+        return Hint(letter, False, total)
+
+    def solve(self, secret_word, max_guesses=26):
+        """
+        Play a secret word with the solver's hints, for testing the dictionary.
+
+        Parameters:
+        - secret_word (str): The word to find.
+        - max_guesses (int): Give up after this many guesses.
+
+        Returns:
+        list: The guesses made, ending with the secret word if it was found.
+        """
+        word_mask = letter_mask(secret_word)
+        guessed_mask = excluded_mask = 0
+        guesses = []
+        while len(guesses) < max_guesses:
+            display = " ".join(letter if guessed_mask >> (ord(letter) - 97) & 1 else "_"
+                               for letter in secret_word)
+            hint = self.suggest(guessed_mask, excluded_mask, display)
+            if hint is None:
+                break
+            guesses.append(hint.guess)
+            if hint.is_word:
+                break
+            guess_mask = letter_mask(hint.guess)
+            guessed_mask, hits, _ = evaluate_guess(word_mask, guessed_mask, guess_mask)
+            excluded_mask |= guess_mask & ~hits
+        return guesses
+
+
+# Solvers for the current word pack or list, by word length
+_solvers = {}
+_solvers_words = None
+_solvers_lock = threading.Lock()
+
+
+def get_word_solver(length):
+    """
+    Get the solver for a word length shared by every session, making new
+    solvers if the secret words changed.
+
+    Parameters:
+    - length (int): The length of the secret word.
+
+    Returns:
+    WordSolver: A solver over the words returned by word_pack.get_words.
+    """
+    global _solvers_words
+    words = get_words()
+    with _solvers_lock:
+        if words is not _solvers_words:
+            _solvers.clear()
+            _solvers_words = words
+        solver = _solvers.get(length)
+        if solver is None:
+            solver = _solvers[length] = WordSolver(words, length)
+    return solver